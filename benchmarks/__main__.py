@@ -0,0 +1,219 @@
+"""Run the headless benchmark suite, optionally writing results to JSON.
+
+    poetry run python -m benchmarks --size 10000 --output after.json \
+        --compare before.json
+
+Measures Component construction, widget -> Component -> Mediator notify
+round-trip latency, singlenotifydispatch dispatch cost, FileDialog
+construction and the time from a FileOptions filter change to populated
+DirectoryFiles options, on a generated tree of --size files. No kernel or
+frontend is needed - widget comms are unconnected.
+"""
+import argparse
+import gc
+import json
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from typing import Any, Callable, Optional
+
+from ipywidgets import widgets
+
+from benchmarks.components import NullMediator
+from benchmarks.directory_scan import build_tree
+from ipymediator.dialogs import FileDialog
+from ipymediator.interface import Component
+from ipymediator.utils import invalidate_directory_index, singlenotifydispatch
+
+FILTERS = (("CSV", "*.csv"), ("TXT", "*.txt"))
+
+
+class DispatchMediator(NullMediator):
+    """Mediator with handlers registered for 50 references"""
+
+    @singlenotifydispatch
+    def notify(self, reference, change) -> None:
+        pass
+
+
+for i in range(50):
+    DispatchMediator.notify.register(
+        f"component_{i}", lambda self, reference, change: change)
+
+
+def per_call(fn: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """Return the best seconds per call of fn over repeat runs"""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def median_seconds(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the median seconds of repeat calls of fn"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def bench_component_construction(args) -> float:
+    """Seconds per Component construction, widgets built beforehand"""
+    mediator = NullMediator()
+    built = [widgets.IntText() for _ in range(args.components)]
+    gc.collect()
+    start = time.perf_counter()
+    for widget in built:
+        Component(mediator=mediator, widget=widget)
+    seconds = time.perf_counter() - start
+    mediator.dispose()
+    return seconds / args.components
+
+
+def bench_notify_roundtrip(args) -> float:
+    """Seconds per widget trait change delivered to Mediator.notify"""
+    mediator = DispatchMediator()
+    component = Component(
+        mediator=mediator, widget=widgets.IntText(), widget_name="component_1")
+    widget, values = component.widget, iter(range(sys.maxsize))
+
+    def change() -> None:
+        widget.value = next(values)
+
+    seconds = per_call(change, args.number // 10)
+    mediator.dispose()
+    return seconds
+
+
+def bench_dispatch(args) -> float:
+    """Seconds per singlenotifydispatch call with 50 handlers registered"""
+    notify = DispatchMediator().notify
+    change = {"name": "value", "old": 0, "new": 1}
+    return per_call(lambda: notify("component_25", change), args.number)
+
+
+def dialog_type(root: pathlib.Path) -> type:
+    """Return a FileDialog subclass listing root"""
+    return type("BenchmarkDialog", (FileDialog,), {"_PATH": root})
+
+
+def bench_dialog_construction(args, root: pathlib.Path) -> float:
+    """Median seconds per FileDialog construction with filters"""
+    cls = dialog_type(root)
+
+    def construct() -> None:
+        cls(filter_pattern=FILTERS).dispose()
+
+    return median_seconds(construct, args.repeat)
+
+
+def bench_filter_populate(args, root: pathlib.Path, cold: bool) -> float:
+    """Median seconds from a filter change to populated DirectoryFiles, with
+    a cold (invalidated) or cached directory index"""
+    dialog = dialog_type(root)(filter_pattern=FILTERS)
+    patterns = iter(("*.txt", "*.csv") * args.repeat)
+
+    def change_filter() -> None:
+        if cold:
+            invalidate_directory_index(root)
+        dialog.file_option["value"] = next(patterns)
+        dialog.directory["value"] = dialog.directory["options"][-1][1]
+        assert dialog.directory_files["options"]
+
+    change_filter()
+    seconds = median_seconds(change_filter, args.repeat)
+    dialog.dispose()
+    return seconds
+
+
+def run(args) -> dict[str, dict[str, Any]]:
+    """Run every benchmark, returning name -> {value, unit}"""
+    results = {
+        "component_construction": bench_component_construction(args),
+        "notify_roundtrip": bench_notify_roundtrip(args),
+        "dispatch": bench_dispatch(args),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        # half the files match each filter
+        build_tree(root, args.size // 2)
+        for path in tuple(root.rglob("*.csv")):
+            path.with_suffix(".txt").touch()
+        results["dialog_construction"] = bench_dialog_construction(
+            args, root)
+        results["filter_populate_cold"] = bench_filter_populate(
+            args, root, cold=True)
+        results["filter_populate_cached"] = bench_filter_populate(
+            args, root, cold=False)
+        invalidate_directory_index(root)
+    return {
+        name: {"value": seconds, "unit": "s"}
+        for name, seconds in results.items()}
+
+
+def git_commit() -> Optional[str]:
+    """Return the checked out commit, or None outside a git repository"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report(
+    results: dict[str, dict[str, Any]],
+    baseline: Optional[dict[str, dict[str, Any]]] = None,
+) -> None:
+    """Print results, with the ratio to baseline results where given"""
+    print(f"{'benchmark':<26} {'value':>12} {'baseline':>12} {'ratio':>7}")
+    for name, result in results.items():
+        value, line = result["value"], f"{name:<26} "
+        line += f"{value * 1e6:>10.2f}us"
+        if baseline and name in baseline:
+            before = baseline[name]["value"]
+            line += f" {before * 1e6:>10.2f}us {value / before:>7.2f}"
+        print(line)
+
+
+def main(argv: Optional[list[str]] = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size", type=int, default=10_000,
+        help="files in the generated directory tree")
+    parser.add_argument("--components", type=int, default=1_000)
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=pathlib.Path)
+    parser.add_argument(
+        "--compare", type=pathlib.Path,
+        help="results JSON of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    document = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "args": {
+                name: value for name, value in vars(args).items()
+                if name not in ("output", "compare")},
+        },
+        "results": run(args),
+    }
+    baseline = None
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())["results"]
+    report(document["results"], baseline)
+    if args.output is not None:
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+    return document
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Count comm messages and bytes sent by FileDialog with and without
+Component.batch, and comms opened by FileDialog construction.
+
+    poetry run python -m benchmarks.comm_messages
+"""
+import contextlib
+import pathlib
+import tempfile
+from unittest import mock
+
+from ipymediator.dialogs import FileDialog
+from ipymediator.interface import Component
+from ipymediator.testing import CommRecorder
+
+
+def count_messages(fn) -> tuple[int, int]:
+    """Return the number and bytes of widget messages (excluding comms
+    opened) sent by fn"""
+    with CommRecorder() as recorder:
+        fn()
+    update = recorder.summary("method").get("update", {})
+    return update.get("messages", 0), update.get("bytes", 0)
+
+
+def count_opened(fn) -> int:
+    """Return the number of widget comms opened by fn"""
+    with CommRecorder() as recorder:
+        fn()
+    return recorder.summary("method").get("open", {}).get("messages", 0)
+
+
+def interaction(root: pathlib.Path) -> dict[str, tuple[int, int]]:
+    """Count messages for construction and a file selection"""
+    counts = {}
+    dialogs = []
+
+    def construct() -> None:
+        dialogs.append(FileDialog(filter_pattern=(("CSV", "*.csv"),)))
+
+    counts["construct"] = count_messages(construct)
+    dialog = dialogs[0]
+
+    def select_file() -> None:
+        dialog.file_option["value"] = "*.csv"
+        dialog.directory["value"] = dialog.directory["options"][1][1]
+        dialog.directory_files["value"] = (
+            dialog.directory_files["options"][0][1])
+        dialog.button_select["value"] = True
+        dialog.button_save.widget.click()
+
+    counts["select_file"] = count_messages(select_file)
+    return counts
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        for i in range(10):
+            (root / f"file_{i}.csv").touch()
+
+        with mock.patch.object(FileDialog, "_PATH", root):
+            batched = interaction(root)
+            with mock.patch.object(
+                    Component, "batch",
+                    lambda self, *args, **kwargs: contextlib.nullcontext()):
+                unbatched = interaction(root)
+
+    print(f"{'action':<12} {'unbatched':>16} {'batched':>16}")
+    for action in batched:
+        print(f"{action:<12} " + " ".join(
+            f"{messages:>6} msgs {size:>5}B"
+            for messages, size in (unbatched[action], batched[action])))
+
+    # deferred widgets (e.g. the hidden FileOptions) open no comm
+    for filter_pattern in (None, (("CSV", "*.csv"),)):
+        opened = count_opened(
+            lambda: FileDialog(filter_pattern=filter_pattern))
+        print(f"comms opened, filter_pattern={filter_pattern}: {opened}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare Component and CompactComponent construction time and memory.
+
+    poetry run python -m benchmarks.components --sizes 1000 10000
+
+Widgets are built before timing, so only Component overhead is measured.
+Memory is the tracemalloc peak allocated while constructing the
+components.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from ipywidgets import widgets
+
+from ipymediator.interface import CompactComponent, Component, Mediator
+
+
+class NullMediator(Mediator):
+    """Mediator discarding every notification"""
+    def notify(self, reference, change) -> None:
+        pass
+
+
+def measure(cls: type, size: int) -> tuple[float, int]:
+    """Return seconds and peak bytes to construct size components of cls"""
+    mediator = NullMediator()
+    built = [widgets.IntText() for _ in range(size)]
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    components = [
+        cls(mediator=mediator, widget=widget, widget_name=f"Row{i}IntText")
+        for i, widget in enumerate(built)]
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(components) == size
+    for widget in built:
+        widget.close()
+    return seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    args = parser.parse_args()
+
+    print(f"{'size':>7} {'component':>17} {'seconds':>9} {'bytes/inst':>11}")
+    for size in args.sizes:
+        for cls in (Component, CompactComponent):
+            seconds, peak = measure(cls, size)
+            print(
+                f"{size:>7} {cls.__name__:>17} {seconds:>9.3f} "
+                f"{peak / size:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark directory_paths & directory_contents scaling on synthetic trees.
+
+    poetry run python -m benchmarks.directory_scan --sizes 10000 100000 1000000
+
+The legacy list-backed reducers are quadratic in the number of unique
+matches and are only timed up to --legacy-max entries.
+"""
+import argparse
+import os
+import pathlib
+import tempfile
+import time
+
+from ipymediator.enumerations import IconUnicode
+from ipymediator.utils import (
+    directory_contents,
+    directory_paths,
+    iconify_str,
+    invalidate_directory_index,
+)
+
+
+def build_tree(root: pathlib.Path, size: int, per_dir: int = 100) -> None:
+    """Create size empty files beneath root, per_dir files per directory,
+    nested two levels deep"""
+    for i in range(0, size, per_dir):
+        directory = root / f"d{i // (per_dir * per_dir)}" / f"d{i}"
+        directory.mkdir(parents=True, exist_ok=True)
+        for j in range(min(per_dir, size - i)):
+            open(os.path.join(directory, f"f{i + j}.csv"), "wb").close()
+
+
+def legacy_scan(root: pathlib.Path, pattern: str) -> tuple[int, int]:
+    """Baseline rglob scan with list membership de-duplication"""
+    paths = [iconify_str(IconUnicode.DIR, root)]
+    files: list[str] = []
+    for path in root.rglob(pattern):
+        iconified_directory = iconify_str(IconUnicode.DIR, path)
+        if iconified_directory not in paths:
+            paths.append(iconified_directory)
+        if not path.is_dir():
+            iconified_file = iconify_str(IconUnicode.FILE, path)
+            if iconified_file not in files:
+                files.append(iconified_file)
+    return len(paths), len(files)
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--legacy-max", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'entries':>10} {'legacy':>10} {'cold':>10} {'cached':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            build_tree(root, size)
+
+            legacy = "-"
+            if size <= args.legacy_max:
+                legacy = f"{timed(legacy_scan, root, '*.csv'):.3f}s"
+
+            def scan() -> None:
+                directory_paths(root, "*.csv", rglob=True)
+                directory_contents(root, "*.csv", rglob=True)
+
+            invalidate_directory_index(root)
+            cold = timed(scan)
+            cached = timed(scan)
+            invalidate_directory_index(root)
+            print(f"{size:>10} {legacy:>10} {cold:>9.3f}s {cached:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
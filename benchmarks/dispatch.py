@@ -0,0 +1,90 @@
+"""Time Mediator.notify dispatch across handler registry sizes.
+
+    poetry run python -m benchmarks.dispatch --handlers 5 50 500
+
+Compares the legacy closure decorator, functools.singledispatchmethod
+(dispatching on the reference type, so a single branch) and the
+singlenotifydispatch descriptor, with handlers registered per reference or
+once to a 'component_*' prefix.
+"""
+import argparse
+import functools
+import timeit
+from typing import Callable, Optional
+
+from ipymediator.utils import singlenotifydispatch
+
+
+def legacy_singlenotifydispatch(func):
+    """Closure decorator replaced by the singlenotifydispatch descriptor"""
+    registry = dict()
+
+    def dispatch(value: str) -> Callable:
+        try:
+            return registry[value]
+        except Exception:
+            return func
+
+    def register(value: str, func: Optional[Callable] = None) -> Callable:
+        if func is None:
+            return lambda f: register(value, f)
+        registry[value] = func
+        return func
+
+    def wrapper(*args, **kwargs):
+        return dispatch(kwargs.get("reference") or args[1])(*args, **kwargs)
+
+    wrapper.register = register
+    return wrapper
+
+
+def build_mediators(handlers: int) -> dict[str, object]:
+    """Return a mediator instance per dispatch implementation, each with
+    handlers registered references"""
+    def handler(self, reference, change):
+        return change
+
+    def default(self, reference, change):
+        return None
+
+    legacy = legacy_singlenotifydispatch(default)
+    descriptor = singlenotifydispatch(default)
+    prefix = singlenotifydispatch(default)
+    prefix.register("component_*", handler)
+    singledispatch = functools.singledispatchmethod(default)
+    singledispatch.register(str, handler)
+    for i in range(handlers):
+        legacy.register(f"component_{i}", handler)
+        descriptor.register(f"component_{i}", handler)
+
+    classes = {
+        "legacy": type("Legacy", (), {"notify": legacy}),
+        "singledispatchmethod": type(
+            "SingleDispatch", (), {"notify": singledispatch}),
+        "descriptor": type("Descriptor", (), {"notify": descriptor}),
+        "descriptor (prefix)": type("Prefix", (), {"notify": prefix}),
+    }
+    return {name: cls() for name, cls in classes.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--handlers", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--number", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'handlers':>8} {'implementation':>22} {'ns/call':>9}")
+    for handlers in args.handlers:
+        reference = f"component_{handlers // 2}"
+        for name, mediator in build_mediators(handlers).items():
+            notify = mediator.notify
+            seconds = min(timeit.repeat(
+                lambda: notify(reference, None),
+                number=args.number, repeat=5))
+            print(
+                f"{handlers:>8} {name:>22} "
+                f"{seconds / args.number * 1e9:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measure import time of ipymediator entry points with python -X importtime.
+
+    poetry run python -m benchmarks.imports --repeat 5
+
+Each statement runs in a fresh interpreter. Reported times are the median
+cumulative milliseconds of the modules the statement imports at top level
+(those imported on interpreter startup excluded), and whether ipywidgets
+was imported.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import ipymediator",
+    "import ipymediator.enumerations",
+    "from ipymediator.utils import singlenotifydispatch",
+    "from ipymediator import Component",
+    "import ipymediator.dialogs",
+)
+
+
+def import_times(statement: str) -> dict[str, tuple[int, int]]:
+    """Return module -> (cumulative microseconds, nesting level) of modules
+    imported by statement, run in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, module = line[len("import time:"):].split("|")
+        name = module.lstrip()
+        times[name] = (int(cumulative), (len(module) - len(name) - 1) // 2)
+    return times
+
+
+def statement_time(statement: str, startup: set[str]) -> int:
+    """Return cumulative microseconds of modules imported by statement at
+    top level, excluding startup modules"""
+    return sum(
+        cumulative
+        for module, (cumulative, level) in import_times(statement).items()
+        if level == 0 and module not in startup)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    startup = set(import_times("pass"))
+    print(f"{'statement':<52} {'ms':>8} {'ipywidgets':>10}")
+    for statement in STATEMENTS:
+        samples = [
+            statement_time(statement, startup) for _ in range(args.repeat)]
+        widgets = "ipywidgets" in import_times(statement)
+        print(
+            f"{statement:<52} {statistics.median(samples) / 1000:>8.1f} "
+            f"{str(widgets):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,21 @@
-from ipymediator.interface import ABCTraits, ABCTraitsMeta, Component, Mediator
+from typing import TYPE_CHECKING
+
+from ipymediator.utils._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from ipymediator.interface import (
+        ABCTraits, ABCTraitsMeta, Component, Mediator)
 
 __all__ = ("ABCTraits", "ABCTraitsMeta", "Component", "Mediator")
+
+# attribute -> module, imported on first access so that importing the
+# package (e.g. for ipymediator.utils or the enumerations) does not import
+# ipywidgets and traitlets
+_LAZY = {
+    "ABCTraits": "ipymediator.interface",
+    "ABCTraitsMeta": "ipymediator.interface",
+    "Component": "ipymediator.interface",
+    "Mediator": "ipymediator.interface",
+}
+
+__getattr__, __dir__ = lazy_module(globals(), _LAZY)
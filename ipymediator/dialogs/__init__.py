@@ -1,3 +1,4 @@
 from .custom_dialogs import FileDialog
+from .pool import FileDialogPool
 
-__all__ = ("FileDialog",)
+__all__ = ("FileDialog", "FileDialogPool")
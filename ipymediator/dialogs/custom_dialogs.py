@@ -1,18 +1,43 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
-from ipymediator.enumerations import ButtonColour, Options, Value
-from ipymediator.interface import Component, MediatorWithTraits
+from ipymediator.enumerations import ButtonColour, IconUnicode, Options, Value
+from ipymediator.interface import Component, ComponentSpec, MediatorWithTraits
 from ipymediator.utils.common_functions import (
-    deiconify_str,
-    directory_contents,
-    directory_paths,
+    PathOption,
+    directory_children_options,
+    directory_content_options,
+    directory_path_options,
+    path_option,
     singlenotifydispatch
 )
+from ipymediator.utils.directory_index import (
+    DirectoryDelta,
+    DirectoryIndex,
+    directory_index,
+    invalidate_directory_index,
+    refresh_directory_index
+)
+from ipymediator.utils.watchers import DirectoryWatcher
 from ipywidgets import widgets as w
 from traitlets import Bool, Instance
 
 
+def _paged(dialog: "FileDialog") -> bool:
+    """ComponentSpec predicate - True if the dialog pages DirectoryFiles"""
+    return dialog.page_size is not None
+
+
+def _unfiltered(dialog: "FileDialog") -> bool:
+    """ComponentSpec predicate - True if the dialog has no filter_pattern"""
+    return dialog.filter_pattern is None
+
+
 class FileDialog(MediatorWithTraits):
     """A concrete Mediator, which facilitates communication between
     Components used to select a local file, acting as a file explorer.
@@ -24,6 +49,10 @@ class FileDialog(MediatorWithTraits):
 
     Class properties:
        _PATH (Path): pathlib Path object set to root directory
+
+    Directory and DirectoryFiles options are (label, Path) pairs, so their
+    values are the selected directory and file paths. Whilst a scan is in
+    progress, the Component it populates is disabled with no options.
     """
 
     dialog_open = Bool(default_value=True).tag(sync=True)  # type: ignore
@@ -31,10 +60,96 @@ class FileDialog(MediatorWithTraits):
 
     _PATH = Path().absolute()
 
+    # not displayed - built only if accessed
+    button_min = ComponentSpec(w.Button, "ButtonMin", lazy=True)
+
+    button_close = ComponentSpec(
+        w.Button,
+        "ButtonClose",
+        traits={"description": "X"},
+        layout={"grid_area": "ButtonClose", "width": "auto"},
+        style={"font_weight": "bold", "button_color": ButtonColour.RED})
+
+    button_save = ComponentSpec(
+        w.Button,
+        "ButtonSave",
+        traits={"icon": "file", "disabled": True},
+        layout={"width": "auto"})
+
+    button_select = ComponentSpec(
+        w.ToggleButton,
+        "ButtonSelect",
+        traits={"icon": "plus", "disabled": True})
+
+    label_selected = ComponentSpec(
+        w.Label, traits={"value": "Selection:"}, layout={"min_width": "60px"})
+
+    # hidden without filter_pattern - then built only if accessed
+    file_option = ComponentSpec(
+        w.ToggleButtons,
+        "FileOptions",
+        layout={"grid_area": "FileOption"},
+        style={"button_width": "88px"},
+        lazy=_unfiltered)
+
+    file_output = ComponentSpec(
+        w.Text,
+        "FileOutput",
+        traits={"value": "...", "disabled": False},
+        layout={"grid_area": "FileOutput", "width": "auto"})
+
+    file_selected = ComponentSpec(
+        w.Text, "FileSelected", traits={"value": "...", "disabled": True})
+
+    directory = ComponentSpec(
+        w.Dropdown,
+        "Directory",
+        layout={"grid_area": "DirectoryPath", "width": "auto"})
+
+    directory_files = ComponentSpec(
+        w.Select,
+        "DirectoryFiles",
+        traits={"rows": 4},
+        layout={
+            "grid_area": "DirectoryContent",
+            "width": "auto",
+            "height": "92px"})
+
+    # paged DirectoryFiles controls, see FileDialog page_size
+    button_prev = ComponentSpec(
+        w.Button,
+        "ButtonPrev",
+        traits={"icon": "chevron-left"},
+        layout={"width": "auto"},
+        enabled=_paged)
+
+    button_next = ComponentSpec(
+        w.Button,
+        "ButtonNext",
+        traits={"icon": "chevron-right"},
+        layout={"width": "auto"},
+        enabled=_paged)
+
+    label_page = ComponentSpec(
+        w.Label,
+        layout={"min_width": "100px"},
+        enabled=_paged)
+
+    file_filter = ComponentSpec(
+        w.Text,
+        "FileFilter",
+        traits={"placeholder": "filter..."},
+        layout={"width": "auto"},
+        enabled=_paged)
+
     def __init__(
             self,
             dialog_name: Optional[str] = None,
-            filter_pattern:  Optional[tuple[tuple[str, str], ...]] = None):
+            filter_pattern:  Optional[tuple[tuple[str, str], ...]] = None,
+            async_scan: bool = False,
+            page_size: Optional[int] = None,
+            lazy_tree: bool = False,
+            prefetch_depth: int = 1):
         """Initialise instance variables and Components.
 
         Params:
@@ -42,75 +157,76 @@ class FileDialog(MediatorWithTraits):
 
             filter_pattern (tuple[tuple]): Optional file glob filter patterns
 
+            async_scan (bool): Scan directories on a worker thread, showing
+                a loading state in the Directory and DirectoryFiles
+                Components until results arrive. Results populate widgets on
+                the running event loop, or without one, on the thread
+                calling wait_scans - never on the worker thread
 
-        """
-        super(FileDialog, self).__init__()
-        self.dialog_name = dialog_name or f"{type(self).__name__}"
-
-        self.button_min = Component(
-            mediator=self, widget=w.Button(), widget_name="ButtonMin")
-
-        self.button_close = Component(
-            mediator=self, widget=w.Button(), widget_name="ButtonClose")
+            page_size (int): Optional number of DirectoryFiles options sent
+                to the widget at a time. Adds previous/next page controls and
+                a filter Text, which narrows the listing server-side
 
-        self.button_save = Component(
-            mediator=self, widget=w.Button(), widget_name="ButtonSave")
+            lazy_tree (bool): List only the selected directory, its parent
+                and its subdirectories in the Directory Component, expanding
+                deeper levels when a subdirectory is selected, rather than
+                every directory beneath _PATH
 
-        self.button_select = Component(
-            mediator=self, widget=w.ToggleButton(), widget_name="ButtonSelect")
+            prefetch_depth (int): Number of subdirectory levels listed below
+                the selected directory when lazy_tree is True
 
-        self.label_selected = Component(mediator=self, widget=w.Label())
-
-        self.file_option = Component(
-            mediator=self, widget=w.ToggleButtons(), widget_name="FileOptions")
-
-        self.file_output = Component(
-            mediator=self, widget=w.Text(), widget_name="FileOutput")
-
-        self.file_selected = Component(
-            mediator=self, widget=w.Text(), widget_name="FileSelected")
-
-        self.directory = Component(
-            mediator=self, widget=w.Dropdown(), widget_name="Directory")
+        Raises:
+            ValueError: page_size below 1
+        """
+        if page_size is not None and page_size < 1:
+            raise ValueError(
+                f"check 'page_size' parameter: {page_size} is below 1")
+        super(FileDialog, self).__init__()
+        self.dialog_name = dialog_name or f"{type(self).__name__}"
 
-        self.directory_files = Component(
-            mediator=self, widget=w.Select(), widget_name="DirectoryFiles")
+        # scan key -> in-flight Future, guarded by the _scans_idle lock
+        self._scans: dict[str, Future] = {}
+        self._scans_idle = threading.Condition()
+        # without a running loop, completed scans awaiting wait_scans
+        self._completed: list[Callable[[], None]] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=self.dialog_name
+        ) if async_scan else None
 
-        self.button_close["description"] = "X"
-        self.button_close["style"].font_weight = "bold"
-        self.button_close["style"].button_color = ButtonColour.RED
-        self.button_close["layout"].width = "auto"
+        # lazy_tree mode: directory listed by Directory options
+        self.lazy_tree = lazy_tree
+        self.prefetch_depth = prefetch_depth
+        self._expanded: Optional[Path] = None
 
-        self.button_save["icon"] = "file"
-        self.button_save["layout"].width = "auto"
-        self.button_save["disabled"] = True
-        self.button_select["icon"] = "plus"
-        self.button_select["disabled"] = True
+        # DirectoryFiles value held by ButtonSelect, saved by ButtonSave
+        self._selected: Optional[Path] = None
 
-        self.label_selected["value"] = "Selection:"
-        self.label_selected["layout"].min_width = "60px"
+        # watches listed directories, see FileDialog.watch
+        self._watcher: Optional[DirectoryWatcher] = None
+        self._watcher_loop: Optional[asyncio.AbstractEventLoop] = None
 
-        self.file_option["style"].button_width = "88px"
-        self.file_option["layout"].grid_area = "FileOption"
+        self.filter_pattern = filter_pattern
 
-        self.file_output["value"] = "..."
-        self.file_output["disabled"] = False
-        self.file_output["layout"].grid_area = "FileOutput"
-        self.file_output["layout"].width = "auto"
+        # full and filtered DirectoryFiles listings, held server-side
+        self.page_size = page_size
+        self._listing: tuple[PathOption, ...] = ()
+        self._listing_filtered: tuple[PathOption, ...] = ()
+        self._page = 0
 
-        self.file_selected["value"] = "..."
-        self.file_selected["disabled"] = True
+        self.build_components()
 
-        self.directory["layout"].grid_area = "DirectoryPath"
-        self.directory["layout"].width = "auto"
-        self.directory_files["rows"] = 4
-        self.directory_files["layout"].grid_area = "DirectoryContent"
-        self.directory_files["layout"].width = "auto"
-        self.directory_files["layout"].height = "92px"
+        # container and option assignments sent as one sync message per widget
+        with self.batch():
+            self._init_layout(filter_pattern)
 
+    def _init_layout(
+            self,
+            filter_pattern: Optional[tuple[tuple[str, str], ...]]) -> None:
+        """Build the containers and set initial Component options"""
         self.container_upper = w.HBox()
         self.container_upper.children = (
-            self.file_option.widget, self.button_close.widget)
+            self.file_option.widget, self.button_close.widget
+        ) if filter_pattern is not None else (self.button_close.widget,)
 
         self.container_upper.layout = w.Layout(
             display="grid",
@@ -140,17 +256,31 @@ class FileDialog(MediatorWithTraits):
             "DirectoryContent DirectoryContent  DirectoryContent"
             """)
 
+        self.container_selected = w.HBox(
+            (self.label_selected.widget, self.file_selected.widget))
+
         self.container_lower = w.HBox()
         self.container_lower.children = (
-            self.button_select.widget,
-            w.HBox(
-                (self.label_selected.widget, self.file_selected.widget))
-        )
+            self.button_select.widget, self.container_selected)
 
         self.container = w.VBox(children=(
             self.container_upper, self.container_middle, self.container_lower))
         self.container.layout = w.Layout(max_width="430px")
 
+        if self.page_size is not None:
+            self.container_pages = w.HBox(children=(
+                self.button_prev.widget,
+                self.label_page.widget,
+                self.button_next.widget,
+                self.file_filter.widget))
+
+            self.container.children = (
+                self.container_upper,
+                self.container_middle,
+                self.container_pages,
+                self.container_lower)
+            self._show_page(0)
+
         if filter_pattern is not None:
             self.file_option["options"] = filter_pattern
             if len(filter_pattern) == 1:
@@ -158,10 +288,21 @@ class FileDialog(MediatorWithTraits):
                 if filter_pattern[0][0] == "":
                     self.file_option["layout"].visibility = "hidden"
         else:
-            self.file_option["layout"].visibility = "hidden"
+            # held until the undisplayed file_option widget is accessed
+            self.file_option["layout"] = {
+                **FileDialog.file_option.layout, "visibility": "hidden"}
             self.file_option["disabled"] = True
             self.file_option["options"] = (("", "*"),)
 
+    @property
+    def _pattern(self) -> Optional[str]:
+        """The selected FileOptions pattern. Without filter_pattern the
+        FileOptions widget is only built if accessed, so its single '*'
+        option is returned without building it"""
+        if not self.file_option.built:
+            return "*"
+        return self.file_option["value"]
+
     @singlenotifydispatch
     def notify(self, reference: str, change: Union[Value, Options]) -> None:
         """Method for notifying a mediator class of a widget event"""
@@ -170,23 +311,38 @@ class FileDialog(MediatorWithTraits):
     @notify.register("FileOptions")
     def _(self, reference: str, change: Value) -> None:
         """"""
-        # file_option -> FileDialog -> button_select
-        self.button_select["value"] = False
+        with self.batch(
+                self.button_select, self.directory, self.directory_files):
+            # file_option -> FileDialog -> button_select
+            self.button_select["value"] = False
 
-        # file_option -> FileDialog -> directory
-        options = directory_paths(self._PATH, self.file_option["value"])
-        if len(options) > 0 and self.directory["options"] == options:
-            self.directory["index"] = 0
-        else:
-            self.directory["options"] = options
+            # file_option -> FileDialog -> directory
+            if self.lazy_tree:
+                directory = self.directory["value"]
+                if directory is None:
+                    directory = self._PATH
+                self._expand_directory(directory)
+                return
+
+            self._scan(
+                "Directory",
+                functools.partial(
+                    directory_path_options,
+                    self._PATH,
+                    self._pattern),
+                self._populate_directory)
 
     @notify.register("Directory")
     def _(self, reference: str, change: Value) -> None:
-        # directory -> FileDialog -> directory_files
-        self.directory_files["options"] = directory_contents(
-            self.patlib_path(str(change["new"])),
-            self.file_option["value"],
-            rglob=False)
+        with self.batch(self.directory, self.directory_files):
+            # directory -> FileDialog -> directory (lazy_tree)
+            if self.lazy_tree and change["new"] not in (
+                    None, self._expanded):
+                self._expand_directory(change["new"])
+                return
+
+            # directory -> FileDialog -> directory_files
+            self._list_directory(change["new"])
 
     @notify.register("DirectoryFiles")
     def _(self, reference: str, change: Options) -> None:
@@ -194,28 +350,48 @@ class FileDialog(MediatorWithTraits):
         # directory -> FileDialog -> button_select
         if change["new"] is not None:
             self.button_select["disabled"] = False
-        else:
+            return
+
+        with self.batch(self.file_selected, self.button_select):
             self.file_selected["value"] = "..."
             self.button_select["disabled"] = True
             self.button_select["value"] = False
 
+    @notify.register("ButtonPrev")
+    def _(self, reference: str, change: Value) -> None:
+        # button_prev -> FileDialog -> directory_files
+        self._show_page(self._page - 1)
+
+    @notify.register("ButtonNext")
+    def _(self, reference: str, change: Value) -> None:
+        # button_next -> FileDialog -> directory_files
+        self._show_page(self._page + 1)
+
+    @notify.register("FileFilter")
+    def _(self, reference: str, change: Value) -> None:
+        # file_filter -> FileDialog -> directory_files
+        self._filter_listing(str(change["new"]))
+
     @notify.register("ButtonSelect")
     def _(self, reference: str, change: Value) -> None:
         value_idx = int(change["new"])
-        # button_select -> FileDialog -> button_select
-        self.button_select["icon"] = ("plus", "minus")[value_idx]
+        with self.batch(self.button_select, self.file_selected):
+            # button_select -> FileDialog -> button_select
+            self.button_select["icon"] = ("plus", "minus")[value_idx]
 
-        # button_select -> FileDialog -> file_selected
-        file_selected = self.directory_files["value"]
-        self.file_selected["value"] = ("...", file_selected)[value_idx]
+            # button_select -> FileDialog -> file_selected
+            self._selected = (None, self.directory_files["value"])[value_idx]
+            self.file_selected["value"] = (
+                "...", self.directory_files["label"])[value_idx]
 
     @notify.register("ButtonSave")
     def _(self, reference: str, change: Value) -> None:
         # button_save -> FileDialog -> Map
-        directory = deiconify_str(self.directory["value"])
-        filename = deiconify_str(self.file_selected["value"])
-        self.dialog_selection = Path(f"{directory}/{filename}")
-        self.button_select["value"] = False
+        # button_select cascades to file_selected and file_output
+        with self.batch(
+                self.button_select, self.file_selected, self.file_output):
+            self.dialog_selection = self._selected
+            self.button_select["value"] = False
 
     @notify.register("ButtonClose")
     def _(self, reference: str, change: Value) -> None:
@@ -225,13 +401,484 @@ class FileDialog(MediatorWithTraits):
     @notify.register("FileSelected")
     def _(self, reference: str, change: Value) -> None:
         # file_selected -> FileDialog -> file_x_column & file_y_column
-        file_selected = deiconify_str(str(change["new"]))
-        if file_selected == "...":
+        if change["new"] == "..." or self._selected is None:
             self.file_output["value"] = "..."
             return
 
-        self.file_output["value"] = file_selected
-        self.button_save["disabled"] = False
+        with self.batch(self.file_output, self.button_save):
+            self.file_output["value"] = self._selected.name
+            self.button_save["disabled"] = False
+
+    def refresh(self) -> None:
+        """Incrementally refresh the cached directory listings beneath _PATH,
+        re-listing only directories modified since they were last scanned,
+        and repopulate the Directory and DirectoryFiles Components"""
+        self._repopulate(
+            functools.partial(self._update_indexes, refresh_directory_index))
+
+    def invalidate(self) -> None:
+        """Discard the cached directory listings beneath _PATH, forcing a
+        full rescan, and repopulate the Directory and DirectoryFiles
+        Components"""
+        self._repopulate(functools.partial(
+            self._update_indexes, invalidate_directory_index))
+
+    def _update_indexes(
+            self,
+            update: Callable[[Path], None],
+            pattern: Optional[str]) -> None:
+        """Run update against the indexes beneath _PATH, leaving those of
+        sibling trees untouched, and refresh the listing of _PATH.parent,
+        the root Directory option"""
+        update(self._PATH)
+        if pattern is not None:
+            directory_index(
+                self._PATH.parent, pattern, rglob=False, validate=False
+            ).refresh((self._PATH.parent,))
+
+    def wait_scans(self, timeout: Optional[float] = None) -> bool:
+        """Block until no scans are in progress, including scans started by
+        the population of earlier results. Without a running event loop,
+        completed scans populate widgets on the calling thread as they
+        arrive. Must not be called from the event loop thread when a loop is
+        running.
+
+        Params:
+            timeout (float): Optional maximum wait in seconds
+
+        Returns:
+            (bool): False if the timeout expired with scans in progress
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(
+                0.0, deadline - time.monotonic())
+            with self._scans_idle:
+                if not self._scans_idle.wait_for(
+                        lambda: self._completed or not self._scans,
+                        remaining):
+                    return False
+                if not self._completed:
+                    return True
+                completed, self._completed = self._completed, []
+            for populate in completed:
+                populate()
+
+    def reset(self) -> None:
+        """Return the dialog to its initial state for reuse (e.g. by
+        FileDialogPool), cancelling scans, stopping any watcher and clearing
+        the selection and listed options without notifying this Mediator"""
+        self.unwatch()
+        self._cancel_scans()
+        self._expanded = self._selected = None
+        self._listing = self._listing_filtered = ()
+        self._page = 0
+
+        with self.batch(), self.paused():
+            for component in self.components():
+                component.reset()  # type: ignore
+            self.directory["disabled"] = False
+            self.directory["options"] = ()
+            self.directory_files["disabled"] = False
+            self.directory_files["options"] = ()
+            self.button_select["icon"] = "plus"
+            self.button_select["disabled"] = True
+            self.button_save["disabled"] = True
+            if self.page_size is not None:
+                self._show_page(0)
+        self.dialog_selection = None
+        self.dialog_open = True
+
+    def close(self) -> None:
+        """Release the dialog, stopping any watcher and scans, shutting down
+        the scan executor and closing every widget. A closed dialog cannot
+        be reused"""
+        self.unwatch()
+        self._cancel_scans()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+        for component in self.components():
+            component.close()  # type: ignore
+        for container in (
+                self.container,
+                self.container_upper,
+                self.container_middle,
+                getattr(self, "container_pages", None),
+                self.container_lower,
+                self.container_selected):
+            if container is not None:
+                container.layout.close()
+                container.close()
+        self.dialog_open = False
+
+    def dispose(self) -> None:
+        """Close the dialog and dispose its Components, releasing the
+        references between them and this dialog"""
+        self.close()
+        super(FileDialog, self).dispose()
+
+    def _scan(
+            self,
+            key: str,
+            scan: Callable[[], Any],
+            populate: Callable[[Any], None]) -> None:
+        """Run scan and pass its result to populate. With async_scan, scan is
+        dispatched to the executor, the Component referenced by key is
+        disabled with no options and any in-flight scan for key is
+        superseded.
+
+        Params:
+            key (str): widget_name of the Component populated by the scan
+
+            scan (Callable): Function returning the scan result
+
+            populate (Callable): Function setting the scan result on widgets
+        """
+        if self._executor is None:
+            populate(scan())
+            return
+
+        component = self._component(key)
+        self._cancel_scan(key)
+        with component.batch():
+            component["disabled"] = True
+            component["options"] = ()
+        with self._scans_idle:
+            future = self._scans[key] = self._executor.submit(scan)
+
+        def done(future: Future) -> None:
+            if future.cancelled() or self._scans.get(key) is not future:
+                return
+            try:
+                with self.batch(self.directory, self.directory_files):
+                    component["disabled"] = False
+                    populate(future.result())
+            finally:
+                with self._scans_idle:
+                    if self._scans.get(key) is future:
+                        del self._scans[key]
+                    self._scans_idle.notify_all()
+
+        def complete(future: Future) -> None:
+            # on the worker thread - widgets are populated by wait_scans
+            with self._scans_idle:
+                self._completed.append(functools.partial(done, future))
+                self._scans_idle.notify_all()
+
+        try:
+            # within a running loop (e.g. IPython kernel), results populate
+            # widgets on the loop thread rather than the worker thread
+            loop = asyncio.get_running_loop()
+            asyncio.wrap_future(future, loop=loop).add_done_callback(
+                lambda _: done(future))
+        except RuntimeError:
+            future.add_done_callback(complete)
+
+    def _cancel_scan(self, key: str) -> None:
+        """Cancel any in-flight scan for the Component referenced by key"""
+        with self._scans_idle:
+            if (future := self._scans.pop(key, None)) is not None:
+                future.cancel()
+            self._scans_idle.notify_all()
+
+    def _cancel_scans(self) -> None:
+        """Cancel every in-flight scan, discarding completed scans awaiting
+        wait_scans"""
+        for key in tuple(self._scans):
+            self._cancel_scan(key)
+        with self._scans_idle:
+            self._completed = []
+
+    def _component(self, key: str) -> Component:
+        """Return the Component populated by scans referenced by key"""
+        return {
+            "Directory": self.directory,
+            "DirectoryFiles": self.directory_files}[key]
+
+    def _populate_directory(self, options: tuple[PathOption, ...]) -> None:
+        """Set Directory options from a directory_path_options result"""
+        if len(options) > 0 and self.directory["options"] == options:
+            self.directory["index"] = 0
+        else:
+            self.directory["options"] = options
+
+    def _expand_directory(
+            self,
+            directory: Path,
+            update: Optional[Callable[[], None]] = None) -> None:
+        """Set Directory options to the directory, its parent and
+        prefetch_depth levels of its subdirectories, then list its files.
+        The parent is omitted above the root directory (_PATH.parent).
+
+        Params:
+            directory (Path): Directory to expand
+
+            update (Callable): Optional directory index update run first
+        """
+        self._expanded = directory
+
+        def scan() -> tuple[PathOption, ...]:
+            if update is not None:
+                update()
+            return self._tree_options(directory)
+
+        def populate(options: tuple[PathOption, ...]) -> None:
+            selected = self.directory["value"]
+            self.directory["options"] = options
+            # the Directory notify lists files whenever the value changes
+            if self.directory["value"] != directory:
+                self.directory["value"] = directory
+            elif selected == directory:
+                self._list_directory(directory)
+
+        self._scan("Directory", scan, populate)
+
+    def _tree_options(self, directory: Path) -> tuple[PathOption, ...]:
+        """Return lazy_tree Directory options for the directory"""
+        options = [path_option(IconUnicode.DIR, directory)]
+        # navigation stops at the _PATH root
+        if directory != self._PATH and directory.parent.is_relative_to(
+                self._PATH):
+            options.append(path_option(IconUnicode.DIR, directory.parent))
+        options.extend(
+            directory_children_options(directory, self.prefetch_depth))
+        return tuple(options)
+
+    def _list_directory(self, directory: Union[Path, str, None]) -> None:
+        """Scan the directory and set DirectoryFiles options"""
+        if directory is None:
+            # directory -> FileDialog -> directory_files (loading or empty)
+            self._cancel_scan("DirectoryFiles")
+            self._set_listing(())
+            return
 
-    def patlib_path(self, path_str: str) -> Path:
-        return Path(deiconify_str(path_str))
+        self._scan(
+            "DirectoryFiles",
+            functools.partial(
+                directory_content_options,
+                directory,
+                self._pattern,
+                rglob=False),
+            self._set_listing)
+
+    def _set_listing(
+            self, options: tuple[PathOption, ...], page: int = 0) -> None:
+        """Hold a directory_content_options result server-side and show a
+        page of its options, narrowed by any FileFilter text"""
+        self._listing = options
+        text = self.file_filter["value"] if self.page_size is not None else ""
+        self._filter_listing(text, page)
+        self._watch_listed()
+
+    def _filter_listing(self, text: str, page: int = 0) -> None:
+        """Narrow the held listing to options whose label contains text
+        (ignoring case) and show a page of it, by default the first"""
+        if text := text.casefold():
+            self._listing_filtered = tuple(
+                option for option in self._listing
+                if text in option[0].casefold())
+        else:
+            self._listing_filtered = self._listing
+        self._show_page(page)
+
+    def _show_page(self, page: int) -> None:
+        """Set DirectoryFiles options to a page of the filtered listing, or
+        the entire filtered listing if page_size is None"""
+        if self.page_size is None:
+            self.directory_files["options"] = self._listing_filtered
+            return
+
+        total = len(self._listing_filtered)
+        last_page = max(0, (total - 1) // self.page_size)
+        self._page = page = min(max(page, 0), last_page)
+        start = page * self.page_size
+        stop = min(start + self.page_size, total)
+
+        with self.batch(
+                self.directory_files,
+                self.button_prev,
+                self.button_next,
+                self.label_page):
+            self.directory_files["options"] = self._listing_filtered[
+                start:stop]
+            self.button_prev["disabled"] = page == 0
+            self.button_next["disabled"] = page == last_page
+            self.label_page["value"] = (
+                f"{min(start + 1, stop)}-{stop} of {total}")
+
+    def _repopulate(self, update: Callable[[Optional[str]], None]) -> None:
+        """Run update, passed the FileOptions pattern, against the directory
+        index then repopulate Directory and DirectoryFiles, retaining the
+        selected directory where it still exists"""
+        directory = self.directory["value"]
+        pattern = self._pattern
+        update_pattern = functools.partial(update, pattern)
+
+        if self.lazy_tree:
+            if directory is None:
+                directory = self._expanded or self._PATH
+            self._expand_directory(directory, update_pattern)
+            return
+
+        def scan() -> tuple[PathOption, ...]:
+            update_pattern()
+            return directory_path_options(self._PATH, pattern)
+
+        def populate(options: tuple[PathOption, ...]) -> None:
+            self.directory["options"] = options
+            if directory in {value for _, value in options}:
+                self.directory["value"] = directory
+            self._list_directory(self.directory["value"])
+
+        self._scan("Directory", scan, populate)
+
+    def watch(self, interval: float = 1.0, backend: str = "auto") -> None:
+        """Watch the listed directories for added and removed entries,
+        applying them to the Directory and DirectoryFiles options without a
+        full rescan. Changes are applied at most once per interval, on the
+        thread running the event loop (IPython's, in a kernel).
+
+        Params:
+            interval (float): Minimum seconds between applied changes
+
+            backend (str): DirectoryWatcher backend - 'inotify', 'polling'
+                or 'auto'
+
+        Raises:
+            RuntimeError: No running event loop
+        """
+        if self._watcher is not None:
+            return
+        try:
+            self._watcher_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                "FileDialog.watch requires a running event loop, on which "
+                "changes are applied") from None
+        self._watcher = DirectoryWatcher(
+            self._on_directories_changed, interval, backend)
+        self._watch_listed()
+        self._watcher.start()
+
+    def unwatch(self) -> None:
+        """Stop watching the listed directories"""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _listed_directories(self) -> set[Path]:
+        """Return directories whose changes affect the listed options"""
+        directories = set()
+        if (selected := self.directory["value"]) is not None:
+            directories.add(selected)
+
+        if self.lazy_tree:
+            directories.update(
+                value for _, value in self.directory["options"])
+        elif (pattern := self._pattern) is not None:
+            index = directory_index(
+                self._PATH, pattern, rglob=True, validate=False)
+            directories.update(map(Path, index.directories()))
+        return directories
+
+    def _watch_listed(self) -> None:
+        """Update the watched directories to those currently listed"""
+        if self._watcher is not None:
+            self._watcher.watch(self._listed_directories())
+
+    def _on_directories_changed(
+            self, directories: Optional[set[str]]) -> None:
+        """DirectoryWatcher callback, run on the watcher thread"""
+        if self._watcher_loop is None:
+            return
+        try:
+            self._watcher_loop.call_soon_threadsafe(
+                self._apply_changes, directories)
+        except RuntimeError:
+            # loop closed, nothing left to update
+            pass
+
+    def _apply_changes(self, directories: Optional[set[str]]) -> None:
+        """Refresh the directory index for modified directories, or in full
+        if directories is None (watcher events were lost), and apply the
+        resulting added and removed matches to the listed options"""
+        if (pattern := self._pattern) is None:
+            return
+
+        options = self.directory["options"]
+        if self.lazy_tree:
+            listed = {str(path) for path in self._listed_directories()}
+            if self._expanded is not None and (
+                    directories is None or not directories.isdisjoint(listed)):
+                options = self._tree_options(self._expanded)
+        else:
+            # refreshed here, for the delta of the watched directories
+            index = directory_index(
+                self._PATH, pattern, rglob=True, validate=False)
+            options = self._delta_directory_options(
+                index, index.refresh(directories))
+
+        # directory delta
+        if options != self.directory["options"]:
+            self._update_options(
+                self.directory,
+                lambda: self.directory.__setitem__("options", options))
+
+        # directory_files delta
+        if (selected := self.directory["value"]) is not None:
+            directory_index(
+                selected, pattern, rglob=False, validate=False
+            ).refresh(directories)
+            self._delta_listing(
+                directory_content_options(selected, pattern, rglob=False))
+
+        self._watch_listed()
+
+    def _delta_listing(self, options: tuple[PathOption, ...]) -> None:
+        """Apply matches added to and removed from the selected directory, as
+        its directory_content_options, to the held listing, keeping the
+        listing order and the current page"""
+        if (current := set(options)) == (held := set(self._listing)):
+            return
+
+        listing = [option for option in self._listing if option in current]
+        listing.extend(option for option in options if option not in held)
+        self._update_options(
+            self.directory_files,
+            lambda: self._set_listing(tuple(listing), self._page))
+
+    def _delta_directory_options(
+            self,
+            index: DirectoryIndex,
+            deltas: dict[str, DirectoryDelta]) -> tuple[PathOption, ...]:
+        """Return Directory options with directories which gained their first
+        match added, and directories which lost their last match removed"""
+        options = list(self.directory["options"])
+        for directory in deltas:
+            option = path_option(IconUnicode.DIR, directory)
+            if any(True for _ in index.entries(directory)):
+                if option not in options:
+                    options.append(option)
+            elif option in options[1:]:
+                options.remove(option)
+        return tuple(options)
+
+    def _update_options(
+            self, component: Component, update: Callable[[], None]) -> None:
+        """Run an options update, restoring the Component's selected value if
+        it is still an option. The Mediator is notified only if the selected
+        value was removed"""
+        selected = component["value"]
+        with component.paused():
+            update()
+            if selected in {value for _, value in component["options"]}:
+                component["value"] = selected
+
+        if (value := component["value"]) != selected:
+            component.observe_handler({
+                "name": "value",
+                "old": selected,
+                "new": value,
+                "owner": component.widget,
+                "type": "change"})
@@ -0,0 +1,107 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Hashable, Iterator
+
+from ipymediator.dialogs.custom_dialogs import FileDialog
+
+
+class FileDialogPool:
+    """Recycles FileDialog instances, so that dialogs opened and closed
+    repeatedly reuse their widgets and comms rather than building new ones.
+
+    Dialogs are keyed by their initialisation arguments. A released dialog
+    is held, its selection intact, and reset when handed back by the next
+    acquire with the same arguments, or closed once maxsize idle dialogs are
+    held for those arguments. A dialog closed by its ButtonClose
+    (dialog_open = False) is released automatically.
+    """
+
+    def __init__(self, maxsize: int = 4, dialog_type: type = FileDialog):
+        """Initialise FileDialogPool class.
+
+        Params:
+            maxsize (int): Maximum idle dialogs held per set of arguments
+
+            dialog_type (type): FileDialog class, or subclass, constructed
+
+        Raises:
+            ValueError: Negative maxsize
+        """
+        if maxsize < 0:
+            raise ValueError(f"check 'maxsize' parameter: {maxsize}")
+        self.maxsize = maxsize
+        self.dialog_type = dialog_type
+        # arguments key -> idle dialogs, most recently released last
+        self._idle: dict[Hashable, list[FileDialog]] = {}
+        # id(dialog) -> arguments key of each dialog handed out
+        self._leased: dict[int, Hashable] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, **kwargs: Any) -> FileDialog:
+        """Return an idle dialog initialised with kwargs, reset to its
+        initial state, or a new one.
+
+        Params:
+            **kwargs: FileDialog initialisation arguments (hashable values)
+        """
+        key = tuple(sorted(kwargs.items()))
+        with self._lock:
+            idle = self._idle.get(key)
+            dialog = idle.pop() if idle else None
+        if dialog is None:
+            dialog = self.dialog_type(**kwargs)
+            dialog.observe(self._on_dialog_open, names="dialog_open")
+        else:
+            dialog.reset()
+        with self._lock:
+            self._leased[id(dialog)] = key
+        return dialog
+
+    def release(self, dialog: FileDialog) -> None:
+        """Hold dialog for reuse, or close it if the pool is full. The
+        dialog is reset by the acquire handing it back, so its dialog_open
+        and dialog_selection observers see the close, not a reset. Dialogs
+        not acquired from this pool are ignored"""
+        with self._lock:
+            key = self._leased.pop(id(dialog), None)
+            if key is None:
+                return
+            idle = self._idle.setdefault(key, [])
+            full = len(idle) >= self.maxsize
+            if not full:
+                idle.append(dialog)
+        if full:
+            self._close(dialog)
+        else:
+            # idle dialogs watch nothing
+            dialog.unwatch()
+
+    @contextmanager
+    def dialog(self, **kwargs: Any) -> Iterator[FileDialog]:
+        """Context manager acquiring a dialog and releasing it on exit"""
+        dialog = self.acquire(**kwargs)
+        try:
+            yield dialog
+        finally:
+            self.release(dialog)
+
+    def clear(self) -> None:
+        """Close every idle dialog"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for dialogs in idle.values():
+            for dialog in dialogs:
+                self._close(dialog)
+
+    def idle(self) -> int:
+        """Return the number of idle dialogs held"""
+        return sum(map(len, self._idle.values()))
+
+    def _close(self, dialog: FileDialog) -> None:
+        dialog.unobserve(self._on_dialog_open, names="dialog_open")
+        dialog.close()
+
+    def _on_dialog_open(self, change: dict) -> None:
+        """Release a leased dialog closed through its ButtonClose"""
+        if not change["new"]:
+            self.release(change["owner"])
@@ -1,3 +1,3 @@
-# from .custom_exceptions import *
+from .custom_exceptions import CascadeError, CommBudgetError
 
-# __all__ = ()
+__all__ = ("CascadeError", "CommBudgetError")
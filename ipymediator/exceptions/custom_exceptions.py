@@ -0,0 +1,33 @@
+class CascadeError(RuntimeError):
+    """Raised when Mediator notifications cascade beyond the depth or
+    re-entry limits of a CascadeGuard, e.g. a feedback loop between
+    Components whose handlers set each other's traits"""
+
+    def __init__(self, message: str, cascade: tuple = ()):
+        """Initialise CascadeError class.
+
+        Params:
+            message (str): Error message
+
+            cascade (tuple): (reference, trait) keys of the notify calls in
+                progress, outermost first
+        """
+        super().__init__(message)
+        self.cascade = cascade
+
+
+class CommBudgetError(AssertionError):
+    """Raised by CommRecorder.check when widget comm messages exceed their
+    count or byte budget. An AssertionError, so that pytest reports it as a
+    failed assertion"""
+
+    def __init__(self, message: str, messages: list = ()):  # type: ignore
+        """Initialise CommBudgetError class.
+
+        Params:
+            message (str): Error message
+
+            messages (list[CommMessage]): Messages counted against budget
+        """
+        super().__init__(message)
+        self.messages = list(messages)
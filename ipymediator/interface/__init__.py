@@ -1,11 +1,27 @@
+from .asynchronous import AsyncMediator
+from .cascade import CascadeGuard
+from .compact import CompactComponent
 from .component import Component
+from .deferred import NotifyQueue
+from .limiter import NotifyLimiter
+from .marshal import WriteMarshal
 from .mediator import Mediator, MediatorWithTraits
 from .metaclass import ABCTraits, ABCTraitsMeta
+from .profiler import NotifyProfiler
+from .spec import ComponentSpec
 
 __all__ = (
     "ABCTraits",
     "ABCTraitsMeta",
+    "AsyncMediator",
+    "CascadeGuard",
+    "CompactComponent",
     "Component",
+    "ComponentSpec",
     "Mediator",
-    "MediatorWithTraits"
+    "MediatorWithTraits",
+    "NotifyLimiter",
+    "NotifyProfiler",
+    "NotifyQueue",
+    "WriteMarshal",
 )
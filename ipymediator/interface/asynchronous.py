@@ -0,0 +1,147 @@
+import asyncio
+import functools
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+from ipymediator.interface.hooks import NotifyHook
+from ipymediator.interface.mediator import Mediator
+from ipymediator.utils.dispatch import notify_key
+
+logger = logging.getLogger(__name__)
+
+
+class _CoroutineScheduler(NotifyHook):
+    """Schedules awaitables returned by an AsyncMediator's notify handlers
+    as tasks, one in flight per notify reference"""
+
+    def __init__(self, mediator: "AsyncMediator"):
+        super(_CoroutineScheduler, self).__init__(mediator)
+        # notify key -> task running its latest handler
+        self.tasks: dict[Hashable, asyncio.Task] = {}
+
+    def _wrap(self, notify: Callable[[Any, Any], Any]) -> Callable:
+        def scheduling_notify(reference: Any, change: Any) -> Any:
+            result = notify(reference, change)
+            if inspect.isawaitable(result):
+                return self.schedule(notify_key(reference), result)
+            return result
+
+        return scheduling_notify
+
+    def schedule(self, key: Hashable, awaitable: Awaitable) -> Any:
+        """Schedule awaitable on the event loop, superseding any task in
+        flight for key. Returns the task, or a concurrent.futures.Future when
+        called from a thread other than the loop's"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            mediator = self.mediator
+            loop = None if mediator is None else mediator.loop
+            if loop is None or loop.is_closed():
+                if inspect.iscoroutine(awaitable):
+                    awaitable.close()
+                raise RuntimeError(
+                    "coroutine notify handlers require a running event loop "
+                    "or AsyncMediator loop") from None
+            return asyncio.run_coroutine_threadsafe(
+                self._supersede(key, awaitable), loop)
+
+        previous = self.tasks.get(key)
+        if previous is not None:
+            previous.cancel()
+        task = loop.create_task(self._run(previous, awaitable))
+        # finished and cancelled tasks are removed from tasks when done
+        task.add_done_callback(
+            functools.partial(self._done, key, awaitable=awaitable))
+        self.tasks[key] = task
+        return task
+
+    async def _supersede(self, key: Hashable, awaitable: Awaitable) -> Any:
+        """Schedule from another thread, awaiting the task on the loop"""
+        return await self.schedule(key, awaitable)
+
+    @staticmethod
+    async def _run(
+        previous: Optional[asyncio.Task], awaitable: Awaitable
+    ) -> Any:
+        # a superseded handler finishes unwinding before its successor
+        # starts, so widget updates for a reference apply in change order
+        if previous is not None and not previous.done():
+            await asyncio.wait((previous,))
+        return await awaitable
+
+    def _done(
+        self, key: Hashable, task: asyncio.Task, awaitable: Awaitable
+    ) -> None:
+        # a superseded task's key already maps to its successor
+        if self.tasks.get(key) is task:
+            del self.tasks[key]
+        if inspect.iscoroutine(awaitable):
+            # cancelled before it started, avoids a never awaited warning
+            awaitable.close()
+        if not task.cancelled() and (error := task.exception()) is not None:
+            logger.error(
+                "notify handler for %r raised", key, exc_info=error)
+
+
+class AsyncMediator(Mediator):
+    """Mediator whose notify handlers may be coroutine functions, e.g. to read
+    file headers without blocking the kernel. A handler returning an
+    awaitable is scheduled as a task on the running event loop (IPython's,
+    in a kernel), or on the loop passed on initialisation when notified from
+    another thread.
+
+    A newer change to the same reference cancels its in-flight handler task,
+    and the new handler starts only once the cancelled task has finished, so
+    a superseded handler never writes to widgets after its successor.
+    Handler exceptions are logged. Synchronous handlers are called as in
+    Mediator.
+    """
+
+    def __init__(
+        self,
+        *args,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        **kwargs,
+    ):
+        """Initialise AsyncMediator class.
+
+        Params:
+            loop (asyncio.AbstractEventLoop): Loop handler tasks are scheduled
+                on when notified outside a running loop, e.g. from a worker
+                thread. Defaults to the loop running on initialisation
+        """
+        super(AsyncMediator, self).__init__(*args, **kwargs)
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        self.loop = loop
+        self._scheduler = _CoroutineScheduler(self)
+        self._scheduler.start()
+
+    def tasks(self) -> dict[Hashable, asyncio.Task]:
+        """Return in-flight handler tasks, keyed by notify reference"""
+        return dict(self._scheduler.tasks)
+
+    def cancel(self, reference: Union[str, Any, None] = None) -> None:
+        """Cancel the in-flight handler task of reference, or every task"""
+        tasks = self._scheduler.tasks
+        if reference is None:
+            for task in tuple(tasks.values()):
+                task.cancel()
+        elif (task := tasks.get(notify_key(reference))) is not None:
+            task.cancel()
+
+    async def wait(self) -> None:
+        """Wait until no handler task is in flight, including tasks
+        scheduled by handlers while waiting"""
+        while tasks := tuple(self._scheduler.tasks.values()):
+            await asyncio.wait(tasks)
+
+    def dispose(self) -> None:
+        """Cancel in-flight handler tasks and dispose every Component"""
+        self.cancel()
+        super(AsyncMediator, self).dispose()
@@ -0,0 +1,123 @@
+import logging
+import threading
+from typing import Any, Callable
+
+from ipymediator.exceptions import CascadeError
+from ipymediator.interface.hooks import NotifyHook
+from ipymediator.utils.dispatch import notify_key
+
+logger = logging.getLogger(__name__)
+
+
+def _equal(old: Any, new: Any) -> bool:
+    """Test trait values for equality, as traitlets does before notifying"""
+    if old is new:
+        return True
+    try:
+        return bool(old == new)
+    except Exception:
+        # e.g. numpy arrays, whose == does not return a bool
+        return False
+
+
+class CascadeGuard(NotifyHook):
+    """Bounds notification cascades, where a handler sets traits which
+    notify the Mediator again - FileDialog's file_option -> directory ->
+    directory_files, for example. Whilst started (see NotifyHook), notify
+    calls made from within another notify call are tracked per thread:
+
+    - a re-entered notify whose value did not change (equal old and new, or
+      a (reference, trait) already in progress with the same new value) is
+      suppressed
+    - a (reference, trait) re-entered more than max_reentries times within
+      one cascade, or a cascade deeper than max_depth, is a cycle, which
+      raises CascadeError or logs a warning and is suppressed (on_cycle)
+
+    Use as a context manager, or via Mediator.guard_cascades.
+    """
+
+    def __init__(
+        self,
+        mediator: Any,
+        max_depth: int = 32,
+        max_reentries: int = 1,
+        on_cycle: str = "raise",
+    ):
+        """Initialise CascadeGuard class.
+
+        Params:
+            mediator (Mediator): Mediator whose notify calls are guarded
+
+            max_depth (int): Nested notify calls allowed in one cascade
+
+            max_reentries (int): Times a (reference, trait) may be re-entered
+                within one cascade, e.g. 1 allows a handler to set a trait
+                back once
+
+            on_cycle (str): 'raise' CascadeError or 'log' a warning
+
+        Raises:
+            ValueError: max_depth less than 1, max_reentries less than 0 or
+                on_cycle not 'raise' or 'log'
+        """
+        if max_depth < 1:
+            raise ValueError(f"check 'max_depth' parameter: {max_depth}")
+        if max_reentries < 0:
+            raise ValueError(
+                f"check 'max_reentries' parameter: {max_reentries}")
+        if on_cycle not in ("raise", "log"):
+            raise ValueError(f"check 'on_cycle' parameter: {on_cycle!r}")
+        super(CascadeGuard, self).__init__(mediator)
+        self.max_depth = max_depth
+        self.max_reentries = max_reentries
+        self.on_cycle = on_cycle
+        # notify calls suppressed as unchanged, and cycles cut off
+        self.suppressed = 0
+        self.cycles = 0
+        # per thread stack of [(reference, trait), new value]
+        self._local = threading.local()
+
+    def _cycle(self, stack: list, key: tuple) -> None:
+        self.cycles += 1
+        cascade = tuple(key_ for key_, _ in stack) + (key,)
+        message = (
+            f"notify cascade cut off at {key!r}, depth {len(cascade)}: "
+            + " -> ".join(f"{name}.{trait}" for name, trait in cascade))
+        if self.on_cycle == "raise":
+            raise CascadeError(message, cascade)
+        logger.warning(message)
+
+    def _wrap(self, notify: Callable[[Any, Any], Any]) -> Callable:
+        local = self._local
+
+        def guarded_notify(reference: Any, change: Any) -> Any:
+            stack = local.__dict__.setdefault("stack", [])
+            if isinstance(change, dict):
+                trait, new = change.get("name"), change.get("new")
+            else:
+                trait, new = None, change
+            key = (notify_key(reference), trait)
+            if stack:
+                # re-entered from a handler, within a cascade
+                if isinstance(change, dict) and "old" in change and _equal(
+                        change["old"], new):
+                    self.suppressed += 1
+                    return None
+                reentries = 0
+                for key_, new_ in stack:
+                    if key_ == key:
+                        if _equal(new_, new):
+                            self.suppressed += 1
+                            return None
+                        reentries += 1
+                if (reentries > self.max_reentries
+                        or len(stack) >= self.max_depth):
+                    return self._cycle(stack, key)
+
+            stack.append((key, new))
+            try:
+                return notify(reference, change)
+            finally:
+                stack.pop()
+
+        return guarded_notify
@@ -0,0 +1,124 @@
+from typing import Optional
+
+from ipymediator.interface.component import (
+    _close_widget,
+    _ComponentMixin,
+    _register
+)
+from ipymediator.interface.mediator import Mediator
+
+from ipywidgets import widgets
+from traitlets import Bool, HasTraits
+
+
+def _toggle_value(widget: widgets.Button) -> None:
+    """on_click callback shared by every CompactComponent Button widget"""
+    widget.value = not widget.value  # type: ignore
+
+
+# id(widget) -> CompactComponents observing it, held until closed as the
+# open widget is held by ipywidgets
+_OBSERVED: dict[int, tuple["CompactComponent", ...]] = {}
+
+
+def _observe(change: dict) -> None:
+    """observe callback shared by every CompactComponent widget, rather than
+    a bound method per Component"""
+    for component in _OBSERVED.get(id(change["owner"]), ()):
+        if change["name"] in component.names:
+            component.observe_handler(change)
+
+
+class CompactComponent(_ComponentMixin):
+    """Lightweight Component for large widget grids - a slotted object
+    without HasTraits machinery, whose widgets share a single observe
+    callback, and Button widgets a single on_click callback. The
+    subscriptable interface, __call__, paused, batch, reset and notify
+    reference are shared with Component, while debounce and throttle are not
+    supported (flush is a no-op).
+    """
+
+    __slots__ = (
+        "widget", "widget_name", "names", "_mediator", "_reference",
+        "_paused", "_closed", "_initial", "__weakref__")
+
+    def __init__(
+        self,
+        mediator: Mediator,
+        widget: widgets.DOMWidget,
+        widget_name: Optional[str] = None,
+        names: tuple[str, ...] = ("value",),
+        notify_self: bool = False,
+    ):
+        """Initialse CompactComponent class.
+
+        Params:
+            mediator (Mediator): Reference to a concrete Mediator
+
+            widget (widgets.DOMWidget): Any widget from ipywidgets
+
+            widget_name (str): Optional name for the Component's widget.
+                If None, the default value of the widget property's class
+                name + "Component" is used
+
+            names (tuple[str, ...]): Trait names of the widget passed to
+                the widget property
+
+            notify_self (bool): Determines the reference value passed to
+                Mediator's notify function - self (True) or widget_name (False)
+
+        Raises:
+            ValueError: Names param contains trait names not held by widget
+        """
+        if isinstance(widget, widgets.Button):
+            # NOTE: HasTraits.add_traits avoids depreciation warning.
+            HasTraits.add_traits(widget, value=Bool(False))
+            widget.on_click(_toggle_value)
+        self._mediator: Optional[Mediator] = mediator
+        self._paused = 0
+        self._closed = False
+        self.widget = widget
+        self.names = names
+        try:
+            # observed trait values restored by reset
+            self._initial = {name: getattr(widget, name) for name in names}
+        except AttributeError as e:
+            raise ValueError(f"check 'names' parameter: {names}") from e
+        _OBSERVED[id(widget)] = (*_OBSERVED.get(id(widget), ()), self)
+        widget.observe(_observe, names=names)  # type: ignore
+        self.widget_name = widget_name or f"{type(widget).__name__}Component"
+        self._reference = self if notify_self else self.widget_name
+        _register(mediator, self)
+
+    def close(self) -> None:
+        """Stop notifying the Mediator and close the widget, with its layout
+        and style, as Component.close"""
+        if self._closed:
+            return
+        self._closed = True
+        widget = self.widget
+        others = tuple(
+            component for component in _OBSERVED.pop(id(widget), ())
+            if component is not self)
+        if others:
+            _OBSERVED[id(widget)] = others
+        # names still observed by other Components sharing the widget
+        if names := set(self.names).difference(
+                *(component.names for component in others)):
+            widget.unobserve(_observe, names=tuple(names))
+        _close_widget(widget)
+
+    def flush(self) -> None:
+        """No-op, as changes are never debounced or throttled"""
+
+    def reset(self) -> None:
+        """Restore the observed traits to their initial values, without
+        notifying the Mediator"""
+        with self.paused():
+            for trait, value in self._initial.items():
+                self.widget.set_trait(trait, value)
+
+    def _release(self) -> None:
+        """Release the notify_self reference, which forms a cycle with the
+        Component"""
+        self._reference = self.widget_name
@@ -1,7 +1,11 @@
+import asyncio
+from contextlib import ExitStack, contextmanager
 from operator import itemgetter
-from typing import Optional, Union
+from typing import Any, Callable, Iterator, Optional, Union
 
 from ipymediator.enumerations import Options, Value
+from ipymediator.interface.limiter import NotifyLimiter
+from ipymediator.interface.marshal import WriteMarshal
 from ipymediator.interface.mediator import Mediator
 from ipymediator.interface.metaclass import ABCTraits
 
@@ -9,7 +13,141 @@ from ipywidgets import widgets
 from traitlets import Bool, HasTraits
 
 
-class Component(ABCTraits):
+def _register(mediator: Any, component: Any) -> None:
+    """Register component with mediator. A Mediator implementation without
+    register_component (e.g. one not derived from Mediator) is supported,
+    its Components are not held for Mediator.components, batch or dispose"""
+    if (register := getattr(mediator, "register_component", None)) is not None:
+        register(component)
+
+
+def _unregister(mediator: Any, component: Any) -> None:
+    """Unregister component from mediator, as _register"""
+    unregister = getattr(mediator, "unregister_component", None)
+    if unregister is not None:
+        unregister(component)
+
+
+# on_msg handlers ipywidgets registers on Button and Text (and subclasses)
+_MSG_HANDLERS = ("_handle_button_msg", "_handle_string_msg")
+
+
+def _close_widget(widget: widgets.Widget) -> None:
+    """Close widget with its layout and style, releasing their comms"""
+    for widget_ in (
+            getattr(widget, "layout", None),
+            getattr(widget, "style", None),
+            widget):
+        if isinstance(widget_, widgets.Widget):
+            widget_.close()
+    # a closed comm receives no messages - unregister the handlers Button
+    # and Text register as bound methods of themselves (reference cycles)
+    for name in _MSG_HANDLERS:
+        if (handler := getattr(widget, name, None)) is not None:
+            widget.on_msg(handler, remove=True)
+
+
+class _ComponentMixin:
+    """Behaviour shared by Component and CompactComponent - notifying the
+    Mediator, pausing and batching, and the subscriptable interface passed to
+    the widget. Subclasses hold widget, widget_name, _reference, _mediator
+    (None once disposed), _paused and _closed, and implement close"""
+
+    __slots__ = ()
+
+    @property
+    def built(self) -> bool:
+        """False until a deferred widget is first accessed"""
+        return True
+
+    @property
+    def closed(self) -> bool:
+        """True once the Component has been closed"""
+        return self._closed  # type: ignore
+
+    def observe_handler(self, change: Union[Value, Options]) -> None:
+        """Observe callback function, passing trait changes to the Mediator"""
+        if self._paused:  # type: ignore
+            return
+        self._deliver(change)
+
+    def _deliver(self, change: Union[Value, Options]) -> None:
+        """Pass a change to the Mediator"""
+        if (mediator := self._mediator) is not None:  # type: ignore
+            mediator.notify(self._reference, change)  # type: ignore
+
+    def dispose(self) -> None:
+        """Close the Component, unregister it from its Mediator and release
+        the references forming cycles with it (the Mediator, which holds its
+        Components, and see _release), so it is collected without the
+        cyclic GC"""
+        self.close()
+        if (mediator := self._mediator) is not None:  # type: ignore
+            _unregister(mediator, self)
+        self._mediator = None
+        self._release()
+
+    def _release(self) -> None:
+        """Release references forming cycles with the Component"""
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """Context manager suspending notifications to the Mediator, e.g.
+        whilst options are replaced and a selection restored"""
+        self._paused += 1  # type: ignore
+        try:
+            yield
+        finally:
+            self._paused -= 1  # type: ignore
+
+    @contextmanager
+    def batch(self, hold_notifications: bool = False) -> Iterator[None]:
+        """Context manager coalescing trait assignments into one sync message
+        per widget on exit, covering the widget and its layout and style.
+
+        Params:
+            hold_notifications (bool): Also hold the widget's trait change
+                notifications (including those to the Mediator) until exit
+        """
+        if not self.built or self.closed:
+            # nothing to hold - a deferred or closed widget has no comm
+            yield
+            return
+        widget = self.widget  # type: ignore
+        with ExitStack() as stack:
+            for widget_ in (
+                    widget,
+                    getattr(widget, "layout", None),
+                    getattr(widget, "style", None)):
+                if isinstance(widget_, widgets.Widget):
+                    stack.enter_context(widget_.hold_sync())
+            if hold_notifications:
+                stack.enter_context(widget.hold_trait_notifications())
+            yield
+
+    def __call__(self, trait: str, *args):
+        """Return widget trait values by leveraging __getitem__, which directs
+        the call to the Component's DOMWidget properties"""
+        return itemgetter(trait, *args)(self)
+
+    def __contains__(self, trait) -> bool:
+        """Test whether the widget holds trait"""
+        return self.widget.has_trait(trait)  # type: ignore
+
+    def __getitem__(self, trait: str):
+        """Subscriptable interface of Component passed to DOMWidget"""
+        return getattr(self.widget, trait)  # type: ignore
+
+    def __setitem__(self, trait: str, value) -> None:
+        """Facilitate trait value assignment with bracket notation"""
+        self.widget.set_trait(trait, value)  # type: ignore
+
+    def __str__(self) -> str:
+        """Return widget_name property value on str(object)"""
+        return self.widget_name  # type: ignore
+
+
+class Component(_ComponentMixin, ABCTraits):
     """Concrete Component class for communication between a concrete Mediator
     class and a DOMWidget, based on trait changes."""
 
@@ -17,35 +155,46 @@ class Component(ABCTraits):
         """Add a bool value trait to any Button widgets and assigns an on_click
         function to toggle the Button value."""
         if isinstance(kwargs["widget"], widgets.Button):
-            def on_click(w) -> None:
-                w.value = not w.value
-            # ipywidgets overwrites HasTraits.add_traits and uses depreciated
-            # trait.get_metadata. The metadata of a trait type instance should
-            # be directly accessed via the metadata attribute.
-            # Issue: https://github.com/jupyter-widgets/ipywidgets/pull/3894
-
-            # pytest depreciation warning:
-            # kwargs["widget"].add_traits(value=Bool(False))
-
-            # NOTE: HasTraits.add_traits avoids depreciation warning.
-            HasTraits.add_traits(kwargs["widget"], value=Bool(False))
-            kwargs["widget"].on_click(on_click)
+            cls._init_button(kwargs["widget"])
         return super(Component, cls).__new__(cls)
 
+    @staticmethod
+    def _init_button(widget: widgets.Button) -> None:
+        """Add a bool value trait to a Button widget, toggled on_click"""
+        def on_click(w) -> None:
+            w.value = not w.value
+        # ipywidgets overwrites HasTraits.add_traits and uses depreciated
+        # trait.get_metadata. The metadata of a trait type instance should
+        # be directly accessed via the metadata attribute.
+        # Issue: https://github.com/jupyter-widgets/ipywidgets/pull/3894
+
+        # pytest depreciation warning:
+        # kwargs["widget"].add_traits(value=Bool(False))
+
+        # NOTE: HasTraits.add_traits avoids depreciation warning.
+        HasTraits.add_traits(widget, value=Bool(False))
+        widget.on_click(on_click)
+
     def __init__(
         self,
         mediator: Mediator,
-        widget: widgets.DOMWidget,
+        widget: Union[widgets.DOMWidget, Callable[[], widgets.DOMWidget]],
         widget_name: Optional[str] = None,
         names: tuple[str, ...] = ("value",),
         notify_self: bool = False,
+        debounce: Optional[float] = None,
+        throttle: Optional[float] = None,
+        thread_safe: bool = False,
     ):
         """Initialse Component class.
 
         Params:
             mediator (Mediator): Reference to a concrete Mediator
 
-            widget (widgets.DOMWidget): Any widget from ipywidgets
+            widget (widgets.DOMWidget): Any widget from ipywidgets, or a
+                callable returning one (e.g. a widget class). A callable is
+                deferred until the widget is first accessed, so no comm is
+                opened for a widget that is never displayed or used
 
             widget_name (str): Optional name for the Component's widget.
                 If None, the default value of the widget property's class
@@ -57,27 +206,96 @@ class Component(ABCTraits):
             notify_self (bool): Determines the reference value passed to
                 Mediator's notify function - self (True) or widget_name (False)
 
+            debounce (float): Optional seconds without trait changes before
+                the latest change is passed to the Mediator. Changes must be
+                made with a running event loop (see NotifyLimiter)
+
+            throttle (float): Optional minimum seconds between changes
+                passed to the Mediator, the latest change winning, as
+                debounce
+
+            thread_safe (bool): Marshal trait assignments made from threads
+                other than the running event loop's to the loop thread, in
+                batches, so that Mediator notify calls only run there (see
+                WriteMarshal)
+
         Raises:
-            ValueError: Names param contains trait names not held by widget
+            ValueError: Names param contains trait names not held by widget,
+                or both debounce and throttle are given. Raised on first
+                access for a deferred widget. thread_safe without a running
+                event loop
 
             AttributeError: Access trait name not held by widget property
         """
         super(Component, self).__init__()
-        self.__mediator = mediator
-        self.widget = widget
+        # strong, so a Mediator reachable only through its displayed widgets
+        # is kept alive - the cycle is broken by dispose
+        self._mediator: Optional[Mediator] = mediator
+        self._paused = 0
+        if debounce is not None and throttle is not None:
+            raise ValueError("pass one of 'debounce' or 'throttle'")
+        self.__limiter = None
+        if debounce is not None:
+            self.__limiter = NotifyLimiter(self._deliver, debounce)
+        elif throttle is not None:
+            self.__limiter = NotifyLimiter(self._deliver, throttle, "throttle")
+        self.__marshal = None
+        if thread_safe:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise ValueError(
+                    "check 'thread_safe' parameter: no running event loop"
+                ) from None
+            self.__marshal = WriteMarshal.for_loop(loop)
+        self.__names = names
+        self._closed = False
+        # trait -> value assigned whilst the widget is deferred
+        self.__pending: dict[str, Any] = {}
+        if isinstance(widget, widgets.Widget):
+            self.__factory = None
+            self.__init_widget(widget)
+            widget_type = type(widget).__name__
+        else:
+            self.__factory = widget
+            self.__widget = None
+            widget_type = getattr(widget, "__name__", "Widget")
+        self.widget_name = widget_name or f"{widget_type}Component"
+        self.__reference = self if notify_self else self.widget_name
+        _register(mediator, self)
+
+    def __init_widget(self, widget: widgets.DOMWidget) -> None:
+        """Validate names and observe the widget"""
         try:
-            # returns widget trait values referenced by names (__call__)
-            self(*names)
+            # observed trait values restored by reset
+            self.__initial = {
+                name: getattr(widget, name) for name in self.__names}
         except AttributeError as e:
-            raise ValueError(f"check 'names' parameter: {names}") from e
-        self.widget.observe(self.observe_handler, names=names)  # type: ignore
-        self.widget_name = widget_name or f"{type(widget).__name__}Component"
-        self.__reference = self if notify_self else self.widget_name
+            raise ValueError(
+                f"check 'names' parameter: {self.__names}") from e
+        self.__widget = widget
+        widget.observe(self.observe_handler, names=self.__names)
+
+    @property
+    def widget(self) -> widgets.DOMWidget:
+        """The Component's widget, built on first access if deferred"""
+        if self.__widget is None:
+            if self.__factory is None:
+                raise RuntimeError(f"{self.widget_name} is closed")
+            widget = self.__factory()
+            if isinstance(widget, widgets.Button):
+                self._init_button(widget)
+            self.__init_widget(widget)
+            self.__factory = None
+            pending, self.__pending = self.__pending, {}
+            for trait, value in pending.items():
+                widget.set_trait(trait, value)
+        return self.__widget  # type: ignore
 
     @property
-    def _mediator(self) -> Mediator:
-        """Property with a reference to this Component's Mediator"""
-        return self.__mediator
+    def built(self) -> bool:
+        """False until a deferred widget is first accessed"""
+        return self.__widget is not None
 
     @property
     def _reference(self) -> Union[str, "Component"]:
@@ -85,26 +303,60 @@ class Component(ABCTraits):
         return self.__reference
 
     def observe_handler(self, change: Union[Value, Options]) -> None:
-        """Observe callback function, passing trait changes to the Mediator"""
-        self._mediator.notify(self._reference, change)
+        """Observe callback function, passing trait changes to the Mediator,
+        through the debounce or throttle limiter if any"""
+        if self.__limiter is not None and not self._paused:
+            self.__limiter(change)
+            return
+        super(Component, self).observe_handler(change)
 
-    def __call__(self, trait: str, *args):
-        """Return widget trait values by leveraging __getitem__, which directs
-        the call to the Component's DOMWidget properties"""
-        return itemgetter(trait, *args)(self)
+    def flush(self) -> None:
+        """Pass any debounced or throttled changes to the Mediator now"""
+        if self.__limiter is not None:
+            self.__limiter.flush()
 
-    def __contains__(self, trait) -> bool:
-        """"""
-        return self.widget.has_trait(trait)
+    def reset(self) -> None:
+        """Discard debounced or throttled changes and restore the observed
+        traits to their values when the widget was built, without notifying
+        the Mediator. Values held for a deferred widget are kept"""
+        if self.__limiter is not None:
+            self.__limiter.cancel()
+        if self.__widget is None:
+            return
+        with self.paused():
+            for trait, value in self.__initial.items():
+                self.__widget.set_trait(trait, value)
 
-    def __getitem__(self, trait: str):
-        """Subscriptable interface of Component passed to DOMWidget"""
-        return getattr(self.widget, trait)
+    def close(self) -> None:
+        """Stop notifying the Mediator and close the widget, with its layout
+        and style, releasing their comms. A deferred widget is never built.
+        A closed Component cannot be reused"""
+        if self._closed:
+            return
+        self._closed = True
+        if self.__limiter is not None:
+            self.__limiter.cancel()
+        self.__factory, self.__pending = None, {}
+        if (widget := self.__widget) is None:
+            return
+        widget.unobserve(self.observe_handler, names=self.__names)
+        _close_widget(widget)
 
-    def __setitem__(self, trait: str, value) -> None:
-        """Facilitate trait value assignment with bracket notation"""
-        self.widget.set_trait(trait, value)
+    def _release(self) -> None:
+        """Release the limiter and notify_self reference, which form cycles
+        with the Component"""
+        self.__limiter = None
+        self.__reference = self.widget_name
 
-    def __str__(self) -> str:
-        """Return widget_name property value on str(object)"""
-        return self.widget_name
+    def __setitem__(self, trait: str, value) -> None:
+        """Facilitate trait value assignment with bracket notation. Values
+        assigned to a deferred widget are held and set when it is built.
+        For a thread_safe Component, values assigned off the loop thread are
+        set on the loop thread"""
+        if self.__marshal is not None and not self.__marshal.on_loop():
+            self.__marshal.submit(self, trait, value)
+            return
+        if self.__widget is None:
+            self.__pending[trait] = value
+            return
+        self.__widget.set_trait(trait, value)
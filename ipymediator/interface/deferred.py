@@ -0,0 +1,69 @@
+import threading
+from typing import Any, Callable
+
+from ipymediator.interface.cascade import _equal
+from ipymediator.interface.hooks import NotifyHook
+from ipymediator.utils.dispatch import notify_key
+
+
+class NotifyQueue(NotifyHook):
+    """Run-to-completion notification mode. Whilst started (see
+    NotifyHook), a notify call made from within a handler is queued rather
+    than run, and queued calls are run in FIFO order once the outermost
+    handler returns, so the stack depth stays at one handler however far a
+    change cascades.
+
+    A queued call for a (reference, trait) already queued is collapsed into
+    it - the change keeps its first 'old' and takes the latest 'new' value,
+    and is dropped if they are equal. Use as a context manager, or via
+    Mediator.queue_notifications.
+    """
+
+    def __init__(self, mediator: Any):
+        """Initialise NotifyQueue class.
+
+        Params:
+            mediator (Mediator): Mediator whose notify calls are queued
+        """
+        super(NotifyQueue, self).__init__(mediator)
+        # notify calls queued, and collapsed into a queued call
+        self.queued = 0
+        self.collapsed = 0
+        # per thread (reference, trait) -> [reference, change], while draining
+        self._local = threading.local()
+
+    def _enqueue(self, pending: dict, reference: Any, change: Any) -> None:
+        self.queued += 1
+        if not isinstance(change, dict):
+            # not a trait change, never collapsed
+            pending[object()] = [reference, change]
+            return
+        key = (notify_key(reference), change.get("name"))
+        if (event := pending.get(key)) is None:
+            pending[key] = [reference, change]
+            return
+        self.collapsed += 1
+        merged = {**change, "old": event[1].get("old", change.get("old"))}
+        if "old" in merged and _equal(merged["old"], merged.get("new")):
+            del pending[key]
+        else:
+            event[:] = reference, merged
+
+    def _wrap(self, notify: Callable[[Any, Any], Any]) -> Callable:
+        local = self._local
+
+        def queued_notify(reference: Any, change: Any) -> Any:
+            if (pending := getattr(local, "pending", None)) is not None:
+                self._enqueue(pending, reference, change)
+                return None
+            local.pending = pending = {}
+            try:
+                result = notify(reference, change)
+                while pending:
+                    reference, change = pending.pop(next(iter(pending)))
+                    notify(reference, change)
+                return result
+            finally:
+                local.pending = None
+
+        return queued_notify
@@ -0,0 +1,58 @@
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+_MISSING = object()
+
+
+class NotifyHook(ABC):
+    """Base class for hooks wrapping a Mediator instance's notify whilst
+    started, restoring it when stopped, so that a Mediator without hooks
+    carries no overhead. Hooks on one Mediator nest, and should be stopped
+    in the reverse order to which they were started. The Mediator is held
+    weakly, as its wrapped notify references the hook.
+    """
+
+    def __init__(self, mediator: Any):
+        self._mediator_ref = weakref.ref(mediator)
+        self._saved: Any = None
+
+    @property
+    def mediator(self) -> Optional[Any]:
+        """The hooked Mediator, None once collected"""
+        return self._mediator_ref()
+
+    @property
+    def active(self) -> bool:
+        """True whilst notify is wrapped by this hook"""
+        return self._saved is not None
+
+    def start(self) -> None:
+        """Wrap the Mediator's notify"""
+        if self.active or (mediator := self.mediator) is None:
+            return
+        self._saved = vars(mediator).get("notify", _MISSING)
+        mediator.notify = self._wrap(mediator.notify)
+
+    def stop(self) -> None:
+        """Restore the Mediator's notify"""
+        if not self.active:
+            return
+        saved, self._saved = self._saved, None
+        if (mediator := self.mediator) is None:
+            return
+        if saved is _MISSING:
+            del vars(mediator)["notify"]
+        else:
+            mediator.notify = saved
+
+    @abstractmethod
+    def _wrap(self, notify: Callable[[Any, Any], Any]) -> Callable:
+        """Return the function replacing notify whilst started"""
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Optional, Union
+
+from ipymediator.enumerations import Options, Value
+
+
+class NotifyLimiter:
+    """Coalesces trait change notifications passed from a Component to its
+    Mediator, delivering the latest value for each trait once per burst.
+
+    Modes:
+        debounce: Deliver once no change has been received for wait seconds
+
+        throttle: Deliver at most once per wait seconds - the first change
+            immediately, later changes at the end of the interval
+
+    Coalesced changes keep the 'old' value of the first change and the 'new'
+    value of the latest. Delayed deliveries are scheduled on the running
+    event loop (e.g. IPython's, in a kernel), so the Mediator is notified on
+    the loop thread - changes received without a running loop raise
+    RuntimeError rather than being delivered on another thread.
+    """
+
+    MODES = ("debounce", "throttle")
+
+    def __init__(
+        self,
+        deliver: Callable[[Union[Value, Options]], None],
+        wait: float,
+        mode: str = "debounce",
+    ):
+        """Initialise NotifyLimiter class.
+
+        Params:
+            deliver (Callable): Function passed each coalesced change
+
+            wait (float): Debounce quiet period or throttle interval (s)
+
+            mode (str): 'debounce' or 'throttle'
+
+        Raises:
+            ValueError: Unknown mode or negative wait
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"check 'mode' parameter: {mode}")
+        if wait < 0:
+            raise ValueError(f"check 'wait' parameter: {wait}")
+
+        self.deliver = deliver
+        self.wait = wait
+        self.mode = mode
+        # trait name -> coalesced change awaiting delivery
+        self._pending: dict[str, Union[Value, Options]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._delivered = float("-inf")
+        self._lock = threading.RLock()
+
+    def __call__(self, change: Union[Value, Options]) -> None:
+        """Receive a trait change, delivering or scheduling it by mode.
+
+        Raises:
+            RuntimeError: No running event loop
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                f"{self.mode} requires a running event loop, on which "
+                "changes are delivered") from None
+
+        with self._lock:
+            if (pending := self._pending.get(change["name"])) is not None:
+                change = {**change, "old": pending["old"]}  # type: ignore
+            self._pending[change["name"]] = change
+
+            if self.mode == "debounce":
+                self._cancel()
+                self._timer = loop.call_later(self.wait, self.flush)
+                return
+
+            if self._timer is not None:
+                return
+            elapsed = time.monotonic() - self._delivered
+            if elapsed >= self.wait:
+                self.flush()
+            else:
+                self._timer = loop.call_later(self.wait - elapsed, self.flush)
+
+    @property
+    def pending(self) -> bool:
+        """True if changes are awaiting delivery"""
+        return bool(self._pending)
+
+    def flush(self) -> None:
+        """Deliver pending changes immediately"""
+        with self._lock:
+            self._cancel()
+            pending, self._pending = self._pending, {}
+            self._delivered = time.monotonic()
+        for change in pending.values():
+            self.deliver(change)
+
+    def cancel(self) -> None:
+        """Discard pending changes without delivering them"""
+        with self._lock:
+            self._cancel()
+            self._pending = {}
+
+    def _cancel(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import weakref
+from contextlib import ExitStack
+from typing import Any, Hashable
+
+# event loop -> WriteMarshal applying writes on it
+_marshals: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary())
+_marshals_lock = threading.Lock()
+
+
+class WriteMarshal:
+    """Applies Component trait writes made from worker threads on the event
+    loop thread (the kernel's main thread), in batches.
+
+    Writes are queued in submission order and applied by one callback per
+    batch, each Component's writes inside Component.batch so that they send
+    one sync message per widget. A write to a (Component, trait) still
+    queued replaces it, moving to the back of the queue - only the latest
+    value is applied and notified.
+
+    Happens-before: writes submitted by one thread are applied, and their
+    Mediator notify calls made on the loop thread, in the order that thread
+    submitted them. Every write submitted before a batch callback runs is
+    applied, and notified, before the loop runs any later callback, so
+    handlers never run concurrently with each other or with the UI.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """Initialise WriteMarshal class.
+
+        Params:
+            loop (asyncio.AbstractEventLoop): Loop whose thread applies writes
+        """
+        self.loop = loop
+        # (component, trait) -> value, in submission order
+        self._pending: dict[tuple[Any, str], Any] = {}
+        self._lock = threading.Lock()
+        self._scheduled = False
+        # writes submitted and batch callbacks run, for diagnostics
+        self.writes = 0
+        self.batches = 0
+
+    @classmethod
+    def for_loop(cls, loop: asyncio.AbstractEventLoop) -> "WriteMarshal":
+        """Return the WriteMarshal shared by Components of loop"""
+        with _marshals_lock:
+            if (marshal := _marshals.get(loop)) is None:
+                marshal = _marshals[loop] = cls(loop)
+            return marshal
+
+    @property
+    def idle(self) -> bool:
+        """True when no writes are awaiting the loop"""
+        return not self._scheduled
+
+    def on_loop(self) -> bool:
+        """Test whether the calling thread is running the loop"""
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def submit(self, component: Hashable, trait: str, value: Any) -> None:
+        """Queue a write, scheduling a batch callback if none is pending.
+
+        Raises:
+            RuntimeError: The loop is closed
+        """
+        with self._lock:
+            self.writes += 1
+            key = (component, trait)
+            self._pending.pop(key, None)
+            self._pending[key] = value
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self.loop.call_soon_threadsafe(self._apply)
+        except RuntimeError:
+            with self._lock:
+                self._pending.clear()
+                self._scheduled = False
+            raise
+
+    def _apply(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._scheduled = False
+        self.batches += 1
+        with ExitStack() as stack:
+            held = set()
+            for (component, trait), value in pending.items():
+                if component not in held:
+                    held.add(component)
+                    stack.enter_context(component.batch())
+                try:
+                    # on the loop thread, so written directly
+                    component[trait] = value
+                except Exception as e:
+                    self.loop.call_exception_handler({
+                        "message": f"{component} {trait!r} write failed",
+                        "exception": e})
@@ -1,10 +1,17 @@
 from abc import abstractmethod
-from typing import Union
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Iterator, Union
 
+from ipymediator.interface.cascade import CascadeGuard
+from ipymediator.interface.deferred import NotifyQueue
 from ipymediator.interface.metaclass import ABCTraits
+from ipymediator.interface.profiler import NotifyProfiler
 from ipymediator.enumerations import Value, Options
 from traitlets import HasTraits
 
+if TYPE_CHECKING:
+    from ipymediator.interface.spec import ComponentSpec
+
 
 class Mediator(ABCTraits):
     """Abstract Mediator class for Mediator interface implimentation"""
@@ -22,10 +29,140 @@ class Mediator(ABCTraits):
             change (Mapping): Trait changes from DOMWidget observe function
         """
 
+    def register_component(self, component: ABCTraits) -> None:
+        """Register a Component notifying this Mediator, called by
+        Component on initialisation"""
+        try:
+            self.__components.append(component)
+        except AttributeError:
+            self.__components = [component]
+
+    def unregister_component(self, component: ABCTraits) -> None:
+        """Remove a Component registered with this Mediator, called by
+        Component.dispose"""
+        try:
+            self.__components.remove(component)
+        except (AttributeError, ValueError):
+            pass
+
+    def dispose(self) -> None:
+        """Dispose every Component registered with this Mediator, closing
+        their widgets and releasing the references between them"""
+        for component in self.components():
+            component.dispose()  # type: ignore
+        self.__components = []
+
+    def components(self) -> tuple[ABCTraits, ...]:
+        """Return the Components registered with this Mediator"""
+        try:
+            return tuple(self.__components)
+        except AttributeError:
+            return ()
+
+    @contextmanager
+    def batch(
+            self,
+            *components: ABCTraits,
+            hold_notifications: bool = False) -> Iterator[None]:
+        """Context manager applying Component.batch to components, or to
+        every Component held by this Mediator, so that assignments across
+        them send one sync message per widget on exit.
+
+        Parameters:
+            components (Component): Components to batch - defaults to all
+
+            hold_notifications (bool): Also hold trait change notifications
+        """
+        with ExitStack() as stack:
+            for component in components or self.components():
+                stack.enter_context(
+                    component.batch(hold_notifications))  # type: ignore
+            yield
+
+    @contextmanager
+    def paused(self, *components: ABCTraits) -> Iterator[None]:
+        """Context manager applying Component.paused to components, or to
+        every Component held by this Mediator, suspending their
+        notifications to this Mediator.
+
+        Parameters:
+            components (Component): Components to pause - defaults to all
+        """
+        with ExitStack() as stack:
+            for component in components or self.components():
+                stack.enter_context(component.paused())  # type: ignore
+            yield
+
+    @contextmanager
+    def profile(self, max_samples: int = 10_000) -> Iterator[NotifyProfiler]:
+        """Context manager recording notify calls made to this Mediator, see
+        NotifyProfiler.
+
+        Parameters:
+            max_samples (int): Latencies kept per (reference, trait)
+        """
+        with NotifyProfiler(self, max_samples) as profiler:
+            yield profiler
+
+    def guard_cascades(
+        self,
+        max_depth: int = 32,
+        max_reentries: int = 1,
+        on_cycle: str = "raise",
+    ) -> CascadeGuard:
+        """Start bounding notification cascades of this Mediator, until the
+        returned CascadeGuard is stopped. Also usable as a context manager.
+
+        Parameters:
+            max_depth (int): Nested notify calls allowed in one cascade
+
+            max_reentries (int): Times a (reference, trait) may be re-entered
+                within one cascade
+
+            on_cycle (str): 'raise' CascadeError or 'log' a warning
+        """
+        guard = CascadeGuard(self, max_depth, max_reentries, on_cycle)
+        guard.start()
+        return guard
+
+    def queue_notifications(self) -> NotifyQueue:
+        """Start running notify calls made from within handlers in FIFO order
+        after the current handler returns, collapsing duplicates, until the
+        returned NotifyQueue is stopped. Also usable as a context manager.
+        """
+        queue = NotifyQueue(self)
+        queue.start()
+        return queue
+
 
 class MediatorWithTraits(Mediator, HasTraits):
     """Abstract Mediator class for Mediator interface implimentation. Extends
     the Mediator interface by allowing traits from the traitlets library,
-    through HasTraits inheritence.
+    through HasTraits inheritence, and Components declared at class level
+    with ComponentSpec.
     """
-    pass
+
+    @classmethod
+    def component_specs(cls) -> dict[str, "ComponentSpec"]:
+        """Return the ComponentSpecs declared by this class and its bases,
+        keyed by attribute name in declaration order"""
+        return {
+            name: spec
+            for name, spec in getattr(cls, "_component_specs", {}).items()
+            if getattr(cls, name, None) is spec}
+
+    def build_components(self) -> dict[str, ABCTraits]:
+        """Build every enabled ComponentSpec, assigning each Component to
+        its attribute. Mediator trait notifications are held until every
+        Component is wired.
+
+        Returns:
+            (dict[str, Component]): Components built, keyed by attribute name
+        """
+        components = {}
+        with self.hold_trait_notifications():
+            for name, spec in self.component_specs().items():
+                if spec.enabled is None or spec.enabled(self):
+                    components[name] = spec.build(self)
+                    setattr(self, name, components[name])
+        return components
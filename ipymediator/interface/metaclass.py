@@ -1,9 +1,26 @@
 # import inspect
 from abc import ABCMeta
+from typing import Any, Callable
+
+from ipymediator.utils.dispatch import singlenotifydispatch
 
 from traitlets import MetaHasTraits
 
 
+class _Namespace(dict):
+    """Class body namespace recording notify_handler functions, including
+    those whose name is reused (e.g. several methods named _)"""
+
+    def __init__(self, *args, **kwargs):
+        super(_Namespace, self).__init__(*args, **kwargs)
+        self.handlers: list[Callable] = []
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        if hasattr(value, "__notify_handler__"):
+            self.handlers.append(value)
+        super(_Namespace, self).__setitem__(name, value)
+
+
 class ABCTraitsMeta(ABCMeta, MetaHasTraits):
     """A Metaclass combining the Abstract Base Class (ABC) Metaclass ABCMeta
     from the abc module and the traitlets library Metaclass - MetaHasTraits,
@@ -12,10 +29,59 @@ class ABCTraitsMeta(ABCMeta, MetaHasTraits):
 
     This metaclass facilitates implimentation of interfaces through abstract
     methods (ABCMeta), whilst allowing child classes to also have traits
-    (MetaHasTraits) or inherit directly from DOMWidget classes."""
+    (MetaHasTraits) or inherit directly from DOMWidget classes.
+
+    singlenotifydispatch attributes (e.g. a Mediator's notify) are merged
+    along the MRO on class creation - a redefined dispatcher inherits the
+    registrations of its base class's, and notify_handler methods are
+    registered to the class's dispatcher, derived from the base class's so
+    that the base class is unaffected."""
+
+    @classmethod
+    def __prepare__(mcls, name: str, bases: tuple, **kwargs) -> _Namespace:
+        return _Namespace()
 
     def __new__(cls, *args, **kwargs):
-        return super(ABCTraitsMeta, cls).__new__(cls, *args, **kwargs)
+        new_cls = super(ABCTraitsMeta, cls).__new__(cls, *args, **kwargs)
+        namespace = args[2] if len(args) > 2 else {}
+        cls._merge_dispatchers(
+            new_cls, getattr(namespace, "handlers", ()))
+        return new_cls
+
+    @staticmethod
+    def _merge_dispatchers(cls: type, handlers: Any) -> None:
+        """Inherit base class dispatchers and register handlers"""
+        # dispatcher attribute name -> [(keys, function)]
+        marked: dict[str, list] = {}
+        for func in handlers:
+            dispatcher, keys = func.__notify_handler__
+            marked.setdefault(dispatcher, []).append((keys, func))
+
+        names = {
+            name for base in cls.__mro__ for name, value in vars(base).items()
+            if isinstance(value, singlenotifydispatch)}
+        for name in names:
+            own = vars(cls).get(name)
+            if name in vars(cls) and not isinstance(
+                    own, singlenotifydispatch):
+                # overridden by a plain method, marked handlers rejected
+                continue
+            parent = next((
+                vars(base)[name] for base in cls.__mro__[1:]
+                if isinstance(vars(base).get(name), singlenotifydispatch)),
+                None)
+            if isinstance(own, singlenotifydispatch):
+                if parent is not None:
+                    own.inherit(parent)
+            elif name in marked and parent is not None:
+                own = parent.derive()
+                setattr(cls, name, own)
+            for keys, func in marked.pop(name, ()):
+                own.register(*keys, func=func)  # type: ignore
+        if marked:
+            raise TypeError(
+                f"check 'dispatcher' parameter: {', '.join(marked)} is not a "
+                f"singlenotifydispatch of {cls.__name__!r}")
 
     # def __call__(cls, *args, **kwargs):
     #     """Calls super().__init__(*args, **kwargs) for all ABCTraitsMeta
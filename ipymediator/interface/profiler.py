@@ -0,0 +1,146 @@
+import math
+import random
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+from ipymediator.interface.hooks import NotifyHook
+from ipymediator.utils.dispatch import notify_key
+
+
+class _NotifyStats:
+    """Counts and latency samples of notify calls for a (reference, trait)"""
+
+    __slots__ = (
+        "calls", "total", "own", "triggered", "max_depth", "samples", "seen")
+
+    def __init__(self):
+        self.calls = 0
+        # inclusive and exclusive (excluding triggered notify calls) seconds
+        self.total = 0.0
+        self.own = 0.0
+        self.triggered = 0
+        self.max_depth = 0
+        self.samples: list[float] = []
+        self.seen = 0
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the nearest-rank q percentile of sampled latencies"""
+        if not self.samples:
+            return None
+        samples = sorted(self.samples)
+        return samples[max(0, math.ceil(q / 100 * len(samples)) - 1)]
+
+
+class NotifyProfiler(NotifyHook):
+    """Records notify calls made to a Mediator - counts per (reference,
+    trait), cumulative and p50/p99 handler latency, and cascade depth, where
+    a handler sets traits which notify the Mediator again.
+
+    Calls are recorded whilst started (see NotifyHook), so a Mediator not
+    being profiled carries no overhead. Use as a context manager, or via
+    Mediator.profile.
+    """
+
+    def __init__(self, mediator: Any, max_samples: int = 10_000):
+        """Initialise NotifyProfiler class.
+
+        Params:
+            mediator (Mediator): Mediator whose notify calls are recorded
+
+            max_samples (int): Latencies kept per (reference, trait) for
+                percentiles, by reservoir sampling beyond this count
+
+        Raises:
+            ValueError: max_samples less than 1
+        """
+        if max_samples < 1:
+            raise ValueError(f"check 'max_samples' parameter: {max_samples}")
+        super(NotifyProfiler, self).__init__(mediator)
+        self.max_samples = max_samples
+        self._stats: dict[tuple[Hashable, Optional[str]], _NotifyStats] = {}
+        self._lock = threading.Lock()
+        # per thread stack of [key, seconds spent in triggered notify calls]
+        self._local = threading.local()
+
+    def reset(self) -> None:
+        """Discard recorded calls"""
+        with self._lock:
+            self._stats = {}
+
+    def _wrap(self, notify: Callable[[Any, Any], Any]) -> Callable:
+        local, perf_counter = self._local, time.perf_counter
+
+        def profiled_notify(reference: Any, change: Any) -> Any:
+            trait = change.get("name") if isinstance(change, dict) else None
+            key = (notify_key(reference), trait)
+            stack = local.__dict__.setdefault("stack", [])
+            parent = stack[-1][0] if stack else None
+            stack.append([key, 0.0])
+            start = perf_counter()
+            try:
+                return notify(reference, change)
+            finally:
+                elapsed = perf_counter() - start
+                depth = len(stack)
+                _, triggered = stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+                self._record(key, parent, elapsed, triggered, depth)
+
+        return profiled_notify
+
+    def _record(
+        self,
+        key: tuple[Hashable, Optional[str]],
+        parent: Optional[tuple[Hashable, Optional[str]]],
+        elapsed: float,
+        triggered: float,
+        depth: int,
+    ) -> None:
+        with self._lock:
+            if (stats := self._stats.get(key)) is None:
+                stats = self._stats[key] = _NotifyStats()
+            stats.calls += 1
+            stats.total += elapsed
+            stats.own += elapsed - triggered
+            stats.max_depth = max(stats.max_depth, depth)
+            if parent is not None:
+                if (parent_stats := self._stats.get(parent)) is None:
+                    parent_stats = self._stats[parent] = _NotifyStats()
+                parent_stats.triggered += 1
+            # reservoir sampling bounds memory for long sessions
+            stats.seen += 1
+            if len(stats.samples) < self.max_samples:
+                stats.samples.append(elapsed)
+            elif (i := random.randrange(stats.seen)) < self.max_samples:
+                stats.samples[i] = elapsed
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Return recorded statistics as one dict per (reference, trait),
+        most costly first, e.g. for pandas.DataFrame(profiler.snapshot()).
+
+        Returns:
+            (list[dict]): reference, trait, calls, total_s (inclusive of
+                triggered notify calls), own_s, mean_s, p50_s, p99_s,
+                triggered (notify calls made by the handler) and max_depth
+                (1 for a notify from a widget, >1 within a cascade)
+        """
+        with self._lock:
+            stats = tuple(self._stats.items())
+        rows = [
+            {
+                "reference": reference,
+                "trait": trait,
+                "calls": stats_.calls,
+                "total_s": stats_.total,
+                "own_s": stats_.own,
+                "mean_s": stats_.total / stats_.calls if stats_.calls else 0,
+                "p50_s": stats_.percentile(50),
+                "p99_s": stats_.percentile(99),
+                "triggered": stats_.triggered,
+                "max_depth": stats_.max_depth,
+            }
+            for (reference, trait), stats_ in stats]
+        rows.sort(key=lambda row: row["total_s"], reverse=True)
+        return rows
@@ -0,0 +1,111 @@
+import functools
+from typing import Any, Callable, Mapping, Optional, TYPE_CHECKING, Union
+
+from ipymediator.interface.component import Component
+
+from ipywidgets import widgets
+
+if TYPE_CHECKING:
+    from ipymediator.interface.mediator import Mediator
+
+
+class ComponentSpec:
+    """Class-level declaration of a Mediator's Component, built by
+    MediatorWithTraits.build_components. Initial trait, layout and style
+    values are passed to the widget constructor, so they are sent with the
+    widget's initial state and fire no notifications to the Mediator.
+
+    Until built, accessing the Component on an instance raises
+    AttributeError. Once built, the Component is held in the instance
+    __dict__, shadowing this descriptor.
+    """
+
+    def __init__(
+        self,
+        widget: Callable[..., widgets.Widget],
+        widget_name: Optional[str] = None,
+        names: tuple[str, ...] = ("value",),
+        notify_self: bool = False,
+        traits: Optional[Mapping[str, Any]] = None,
+        layout: Optional[Mapping[str, Any]] = None,
+        style: Optional[Mapping[str, Any]] = None,
+        enabled: Optional[Callable[["Mediator"], bool]] = None,
+        lazy: Union[bool, Callable[["Mediator"], bool]] = False,
+        component: type = Component,
+        **options,
+    ):
+        """Initialise ComponentSpec class.
+
+        Params:
+            widget (Callable): Widget class or factory, passed the initial
+                traits as keyword arguments
+
+            widget_name (str): Optional name for the Component's widget
+
+            names (tuple[str, ...]): Trait names observed by the Component
+
+            notify_self (bool): Pass the Component (True) or widget_name
+                (False) as the Mediator notify reference
+
+            traits (Mapping): Initial widget trait values
+
+            layout (Mapping): Initial widget layout trait values
+
+            style (Mapping): Initial widget style trait values
+
+            enabled (Callable): Optional predicate passed the Mediator,
+                building the Component only if it returns True
+
+            lazy (bool | Callable): Defer widget construction until the
+                Component's widget is first accessed (Component only), or a
+                predicate passed the Mediator deciding so
+
+            component (type): Component class, e.g. CompactComponent
+
+            **options: Further Component keyword arguments, e.g. debounce
+        """
+        self.widget = widget
+        self.widget_name = widget_name
+        self.names = names
+        self.notify_self = notify_self
+        self.traits = dict(traits or {})
+        self.layout = dict(layout or {})
+        self.style = dict(style or {})
+        self.enabled = enabled
+        self.lazy = lazy
+        self.component = component
+        self.options = options
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        # name -> ComponentSpec, in declaration order after base classes
+        if "_component_specs" not in owner.__dict__:
+            owner._component_specs = dict(  # type: ignore
+                getattr(owner, "_component_specs", {}))
+        owner._component_specs[name] = self  # type: ignore
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        raise AttributeError(
+            f"{type(instance).__name__!r} Component {self.name!r} is not "
+            f"built, see build_components")
+
+    def build(self, mediator: "Mediator") -> Component:
+        """Construct the widget with its initial values and its Component"""
+        kwargs = dict(self.traits)
+        if self.layout:
+            kwargs["layout"] = dict(self.layout)
+        if self.style:
+            kwargs["style"] = dict(self.style)
+        widget = functools.partial(self.widget, **kwargs)
+        lazy = self.lazy(mediator) if callable(self.lazy) else self.lazy
+        return self.component(
+            mediator=mediator,
+            widget=widget if lazy else widget(),
+            widget_name=self.widget_name or (
+                f"{getattr(self.widget, '__name__', 'Widget')}Component"),
+            names=self.names,
+            notify_self=self.notify_self,
+            **self.options)
@@ -0,0 +1,3 @@
+from .comms import CommMessage, CommRecorder
+
+__all__ = ("CommMessage", "CommRecorder")
@@ -0,0 +1,260 @@
+import json
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Iterator, NamedTuple, Optional
+
+from ipymediator.exceptions import CommBudgetError
+
+from ipywidgets import widgets
+
+try:
+    # private to ipywidgets - splits binary buffers from the opened state
+    from ipywidgets.widgets.widget import _remove_buffers
+except ImportError:  # pragma: no cover
+    _remove_buffers = None
+
+
+class CommMessage(NamedTuple):
+    """A widget comm message captured by CommRecorder"""
+
+    # label of the CommRecorder.action in progress, or None
+    action: Optional[str]
+    # widget_name of the Component owning the widget (or its layout or
+    # style), otherwise the widget class name
+    component: str
+    model_id: str
+    # 'open' for a comm opened with the widget state, otherwise the message
+    # method, e.g. 'update'
+    method: str
+    # state keys sent
+    keys: tuple[str, ...]
+    # serialised JSON payload and binary buffer bytes
+    size: int
+
+
+def _payload_size(data: Any, buffers: Any = None) -> int:
+    """Return the serialised bytes of a comm message's data and buffers"""
+    size = len(json.dumps(
+        data, separators=(",", ":"), default=str).encode("utf-8"))
+    for buffer in buffers or ():
+        size += memoryview(buffer).nbytes
+    return size
+
+
+def _open_size(state: Any) -> int:
+    """Return the serialised bytes of the comm open message of state"""
+    if _remove_buffers is None:
+        # buffers are then sized as their str value
+        return _payload_size({"state": state, "buffer_paths": []})
+    state, buffer_paths, buffers = _remove_buffers(state)
+    return _payload_size(
+        {"state": state, "buffer_paths": buffer_paths}, buffers)
+
+
+# started CommRecorders - Widget._send and Widget.open are patched once,
+# whilst any is started, so recorders may overlap and stop in any order
+_RECORDERS: list["CommRecorder"] = []
+_RECORDERS_LOCK = threading.Lock()
+_send = widgets.Widget._send
+_open = widgets.Widget.open
+
+
+def _recorded_send(widget, msg, buffers=None):
+    if recorders := tuple(_RECORDERS):
+        state, size = msg.get("state", {}), _payload_size(msg, buffers)
+        for recorder in recorders:
+            recorder._record(widget, msg.get("method", ""), state, size)
+    return _send(widget, msg, buffers)
+
+
+def _recorded_open(widget):
+    if widget.comm is not None or not _RECORDERS:
+        return _open(widget)
+    state = widget.get_state()
+    result = _open(widget)
+    # recorded once opened, with a model_id
+    size = _open_size(state)
+    for recorder in tuple(_RECORDERS):
+        recorder._record(widget, "open", state, size)
+    return result
+
+
+def _add_recorder(recorder: "CommRecorder") -> None:
+    with _RECORDERS_LOCK:
+        if not _RECORDERS:
+            widgets.Widget._send = _recorded_send
+            widgets.Widget.open = _recorded_open
+        _RECORDERS.append(recorder)
+
+
+def _remove_recorder(recorder: "CommRecorder") -> None:
+    with _RECORDERS_LOCK:
+        _RECORDERS.remove(recorder)
+        if not _RECORDERS:
+            widgets.Widget._send = _send
+            widgets.Widget.open = _open
+
+
+class CommRecorder:
+    """In-process comm backend for tests and diagnostics. Whilst started,
+    every widget comm opened and message sent (state syncs) is captured
+    without a kernel or front end, attributed to the Component owning the
+    widget and to the labelled action in progress, so that message and byte
+    budgets can be asserted. Messages sent from any thread are captured by
+    every started recorder, e.g.
+
+        with CommRecorder(dialog) as recorder:
+            with recorder.action("select file"):
+                dialog.directory_files["value"] = path
+        recorder.check(max_messages=4, action="select file")
+    """
+
+    def __init__(self, *mediators: Any):
+        """Initialise CommRecorder class.
+
+        Params:
+            *mediators (Mediator): Mediators whose Components messages are
+                attributed to
+        """
+        self.mediators = mediators
+        self.messages: list[CommMessage] = []
+        self._action: Optional[str] = None
+        # model_id -> Component widget_name
+        self._names: dict[str, str] = {}
+        self._active = False
+        # messages may be recorded from threads other than the caller's
+        self._lock = threading.RLock()
+
+    @property
+    def active(self) -> bool:
+        """True whilst messages are captured"""
+        return self._active
+
+    def start(self) -> None:
+        """Capture widget comm messages"""
+        if self.active:
+            return
+        self._active = True
+        _add_recorder(self)
+
+    def stop(self) -> None:
+        """Stop capturing widget comm messages"""
+        if not self.active:
+            return
+        _remove_recorder(self)
+        self._active = False
+        self._resolve()
+
+    def reset(self) -> None:
+        """Discard captured messages"""
+        with self._lock:
+            self.messages = []
+
+    @contextmanager
+    def action(self, label: str) -> Iterator[None]:
+        """Context manager attributing messages to the action label"""
+        previous, self._action = self._action, label
+        try:
+            yield
+        finally:
+            self._action = previous
+
+    def _index(self) -> None:
+        """Map the model_ids of built Component widgets, layouts and styles
+        to the Component widget_name"""
+        for mediator in self.mediators:
+            for component in mediator.components():
+                if not getattr(component, "built", True):
+                    # deferred, must not be built by the lookup
+                    continue
+                widget = component.widget
+                for owned in (
+                        widget,
+                        getattr(widget, "layout", None),
+                        getattr(widget, "style", None)):
+                    if isinstance(owned, widgets.Widget) and (
+                            owned.comm is not None):
+                        self._names[owned.model_id] = component.widget_name
+
+    def _resolve(self) -> None:
+        """Attribute messages of widgets since owned by a Component, e.g. a
+        deferred widget opened before its Component held it"""
+        with self._lock:
+            self._index()
+            self.messages = [
+                message._replace(component=self._names[message.model_id])
+                if message.model_id in self._names else message
+                for message in self.messages]
+
+    def _record(
+        self, widget: widgets.Widget, method: str, state: Any, size: int
+    ) -> None:
+        model_id = widget.model_id
+        with self._lock:
+            if model_id not in self._names:
+                self._index()
+            self.messages.append(CommMessage(
+                self._action,
+                self._names.get(model_id, type(widget).__name__),
+                model_id, method, tuple(state), size))
+
+    def summary(self, by: str = "component") -> dict[Any, dict[str, int]]:
+        """Return message counts and bytes grouped by 'component', 'action'
+        or 'method'.
+
+        Returns:
+            (dict): group -> {'messages': count, 'bytes': size}
+
+        Raises:
+            ValueError: by is not a CommMessage field
+        """
+        if by not in CommMessage._fields:
+            raise ValueError(f"check 'by' parameter: {by!r}")
+        self._resolve()
+        groups: dict[Any, dict[str, int]] = defaultdict(
+            lambda: {"messages": 0, "bytes": 0})
+        for message in self.messages:
+            group = groups[getattr(message, by)]
+            group["messages"] += 1
+            group["bytes"] += message.size
+        return dict(groups)
+
+    def check(
+        self,
+        max_messages: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        action: Optional[str] = None,
+        component: Optional[str] = None,
+    ) -> None:
+        """Check captured messages, optionally of one action and/or
+        Component, are within budget.
+
+        Raises:
+            CommBudgetError: Message count or bytes over budget
+        """
+        self._resolve()
+        messages = [
+            message for message in self.messages
+            if (action is None or message.action == action)
+            and (component is None or message.component == component)]
+        size = sum(message.size for message in messages)
+        scope = ", ".join(
+            f"{name}={value!r}" for name, value in (
+                ("action", action), ("component", component))
+            if value is not None) or "all"
+        if max_messages is not None and len(messages) > max_messages:
+            raise CommBudgetError(
+                f"{len(messages)} comm messages sent ({scope}), budget "
+                f"{max_messages}", messages)
+        if max_bytes is not None and size > max_bytes:
+            raise CommBudgetError(
+                f"{size} comm message bytes sent ({scope}), budget "
+                f"{max_bytes}", messages)
+
+    def __enter__(self) -> "CommRecorder":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
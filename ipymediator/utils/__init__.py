@@ -1,15 +1,53 @@
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_module
 from .common_functions import (
     deiconify_str,
+    directory_children,
+    directory_children_options,
+    directory_content_options,
     directory_contents,
+    directory_path_options,
     directory_paths,
     iconify_str,
-    singlenotifydispatch,
+    path_option,
+    unique_everseen,
+)
+from .directory_index import (
+    DirectoryDelta,
+    DirectoryIndex,
+    directory_index,
+    invalidate_directory_index,
+    refresh_directory_index,
 )
+from .dispatch import notify_handler, notify_key, singlenotifydispatch
+
+if TYPE_CHECKING:
+    from .watchers import DirectoryWatcher
 
 __all__ = (
+    "DirectoryDelta",
+    "DirectoryIndex",
+    "DirectoryWatcher",
     "deiconify_str",
+    "directory_children",
+    "directory_children_options",
+    "directory_content_options",
     "directory_contents",
+    "directory_index",
+    "directory_path_options",
     "directory_paths",
     "iconify_str",
+    "invalidate_directory_index",
+    "notify_handler",
+    "notify_key",
+    "path_option",
+    "refresh_directory_index",
     "singlenotifydispatch",
+    "unique_everseen",
 )
+
+# attribute -> submodule, imported on first access (watchers loads ctypes)
+_LAZY = {"DirectoryWatcher": "ipymediator.utils.watchers"}
+
+__getattr__, __dir__ = lazy_module(globals(), _LAZY)
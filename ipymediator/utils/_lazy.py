@@ -0,0 +1,34 @@
+from typing import Any, Callable
+
+
+def lazy_module(
+    namespace: dict[str, Any], mapping: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return module __getattr__ and __dir__ functions, importing attributes
+    from their module on first access and caching them in the namespace
+
+    Parameters:
+        namespace (dict[str, Any]): globals() of the lazy module
+
+        mapping (dict[str, str]): attribute -> module it is imported from
+
+    Returns:
+        (tuple[Callable, Callable]): __getattr__ and __dir__ functions
+    """
+
+    def __getattr__(name: str) -> Any:
+        # __import__ rather than importlib.import_module, which python -X
+        # importtime does not report
+        try:
+            module = __import__(mapping[name], fromlist=(name,))
+        except KeyError:
+            raise AttributeError(
+                f"module {namespace['__name__']!r} has no attribute {name!r}"
+            ) from None
+        value = namespace[name] = getattr(module, name)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *mapping})
+
+    return __getattr__, __dir__
@@ -1,8 +1,19 @@
 import functools
+import os
 import pathlib
-from typing import Callable, Optional
+from typing import Iterable, Iterator, Union
 
 from ipymediator.enumerations import IconUnicode
+from ipymediator.utils.directory_index import directory_index
+from ipymediator.utils.dispatch import singlenotifydispatch  # noqa: F401
+
+
+def _label(icon: IconUnicode, path: str) -> str:
+    """Return the widget label of a path str - a DIR icon prefixes the path
+    with its "/" prefix stripped, a FILE icon prefixes the file name"""
+    if icon is IconUnicode.DIR:
+        return f"{icon}{path[1:]}"
+    return f"{icon}{os.path.basename(path)}"
 
 
 def iconify_str(icon: IconUnicode, path: pathlib.Path) -> str:
@@ -15,15 +26,12 @@ def iconify_str(icon: IconUnicode, path: pathlib.Path) -> str:
     Returns:
         (str): str value with path prefixed by unicode icon
     """
+    if icon is IconUnicode.FILE:
+        return _label(icon, str(path))
+
     if (path_parent := path.parent).match("/"):
         path_parent = path
-
-    icon_map = {  # for DIR, we strip the "/" prefix
-        IconUnicode.DIR: f"{icon}{str(path_parent)[1:]}",
-        IconUnicode.FILE: f"{icon}{path.name}",
-    }
-
-    return icon_map[icon]
+    return _label(icon, str(path_parent))
 
 
 def deiconify_str(iconified_path: str) -> str:
@@ -43,89 +51,229 @@ def deiconify_str(iconified_path: str) -> str:
     return iconified_path.replace(icon, "")
 
 
+# (label, value) widget option of a directory or file path
+PathOption = tuple[str, pathlib.Path]
+
+
+@functools.lru_cache(maxsize=65_536)
+def _directory_option(directory: str) -> PathOption:
+    return _label(IconUnicode.DIR, directory), pathlib.Path(directory)
+
+
+@functools.lru_cache(maxsize=65_536)
+def _file_option(directory: str, name: str) -> PathOption:
+    return _label(IconUnicode.FILE, name), pathlib.Path(directory, name)
+
+
+def path_option(
+    icon: IconUnicode, path: Union[str, os.PathLike]
+) -> PathOption:
+    """Return the (label, Path) widget option of a directory or file, e.g.
+    ('📁 root/content', PosixPath('/root/content')). Options are cached per
+    path, so each label and Path is built once and shared between listings.
+
+    Parameters:
+        icon (Icon): Icon Enum member, DIR or FILE
+        path (str | PathLike): Absolute directory or file path
+
+    Returns:
+        (tuple[str, Path]): Iconified label and path
+    """
+    path = os.fspath(path)
+    if icon is IconUnicode.DIR:
+        return _directory_option(path)
+    return _file_option(*os.path.split(path))
+
+
+def unique_everseen(iterable: Iterable[str]) -> Iterator[str]:
+    """Stream str values in first-seen order, skipping duplicates. Membership
+    is tested against a set, so de-duplication is a single O(n) pass.
+
+    Parameters:
+        iterable (Iterable[str]): str values, possibly containing duplicates
+
+    Returns:
+        (Iterator[str]): Unique str values in their original order
+    """
+    seen: set[str] = set()
+    add = seen.add
+    for value in iterable:
+        if value not in seen:
+            add(value)
+            yield value
+
+
 def directory_paths(
     root_path: pathlib.Path, pattern: str, rglob: bool = True
 ) -> tuple[str, ...]:
-    """"""
+    """Return iconified directories holding entries which match pattern,
+    prefixed by the iconified root_path, e.g. ('📁 root', '📁 root/content')
 
-    def reduce_fn(acc: list[str], path: pathlib.Path) -> list[str]:
-        # e.g. '📁 content'
-        iconified_directory = iconify_str(IconUnicode.DIR, path)
-        if iconified_directory in acc:
-            return acc
+    Parameters:
+        root_path (Path): Root directory to search
 
-        acc.append(iconified_directory)
-        return acc
+        pattern (str): glob pattern matched against directory entries
 
-    iconified_root = iconify_str(IconUnicode.DIR, root_path)
-    initialiser = [iconified_root]
+        rglob (bool): Search subdirectories of root_path recursively
 
-    if rglob:
-        return tuple(
-            functools.reduce(reduce_fn, root_path.rglob(pattern), initialiser)
-        )
+    Returns:
+        (tuple[str, ...]): Unique iconified directories in traversal order
+    """
+    icon = f"{IconUnicode.DIR}"
+    entries = directory_index(root_path, pattern, rglob).entries(
+        None if rglob else root_path)
 
-    return tuple(
-        functools.reduce(reduce_fn, root_path.glob(pattern), initialiser)
-    )
+    def iconified_directories() -> Iterator[str]:
+        yield iconify_str(IconUnicode.DIR, root_path)
+        for directory, name, _ in entries:
+            # as iconify_str, the matched entry itself is used beneath '/'
+            if directory == os.sep:
+                yield f"{icon}{name}"
+            else:
+                yield f"{icon}{directory[1:]}"
+
+    return tuple(unique_everseen(iconified_directories()))
 
 
 def directory_contents(
     root_path: pathlib.Path, pattern: str, rglob: bool = True
 ) -> tuple[str, ...]:
-    """"""
+    """Return iconified names of files which match pattern,
+    e.g. ('📄 file_one.csv', '📄 file_two.csv')
 
-    def reduce_fn(acc: list[str], path: pathlib.Path) -> list[str]:
-        if path.is_dir():
-            return acc
+    Parameters:
+        root_path (Path): Root directory to search
 
-        # e.g. '📄 file_one.csv'
-        iconified_file = iconify_str(IconUnicode.FILE, path)
-        if iconified_file in acc:
-            return acc
+        pattern (str): glob pattern matched against directory entries
 
-        acc.append(iconified_file)
-        return acc
+        rglob (bool): Search subdirectories of root_path recursively
 
-    initialiser = list()
-    if rglob:
-        return tuple(
-            functools.reduce(reduce_fn, root_path.rglob(pattern), initialiser)
-        )
-    return tuple(
-        functools.reduce(reduce_fn, root_path.glob(pattern), initialiser)
-    )
+    Returns:
+        (tuple[str, ...]): Unique iconified file names in traversal order
+    """
+    icon = f"{IconUnicode.FILE}"
+    entries = directory_index(root_path, pattern, rglob).entries(
+        None if rglob else root_path)
+
+    return tuple(unique_everseen(
+        f"{icon}{name}" for _, name, is_dir in entries if not is_dir))
 
 
-def singlenotifydispatch(func):
-    """A class method decorator function, which replicates the logic from
-    functools.singledispatchmethod, but with a function dipatch based on the
-    value of the first parameter preceding self"""
+def directory_path_options(
+    root_path: pathlib.Path, pattern: str, rglob: bool = True
+) -> tuple[PathOption, ...]:
+    """As directory_paths, but return (label, Path) widget options built
+    from the scanned directory str values, with no iconified str parsed back
+    to a path, e.g. (('📁 root', PosixPath('/root')), ...)
 
-    # value -> function map
-    registry = dict()
+    Parameters:
+        root_path (Path): Root directory to search
 
-    def dispatch(value: str) -> Callable:
-        """Returns a function based on registry key (value)"""
+        pattern (str): glob pattern matched against directory entries
+
+        rglob (bool): Search subdirectories of root_path recursively
+
+    Returns:
+        (tuple[tuple[str, Path], ...]): Unique directory options in
+            traversal order
+    """
+    entries = directory_index(root_path, pattern, rglob).entries(
+        None if rglob else root_path)
+    if (path_parent := root_path.parent).match("/"):
+        path_parent = root_path
+
+    def directories() -> Iterator[str]:
+        yield str(path_parent)
+        for directory, name, _ in entries:
+            # as directory_paths, the matched entry itself is used beneath '/'
+            yield os.path.join(directory, name) if (
+                directory == os.sep) else directory
+
+    return tuple(map(_directory_option, unique_everseen(directories())))
+
+
+def directory_content_options(
+    root_path: pathlib.Path, pattern: str, rglob: bool = True
+) -> tuple[PathOption, ...]:
+    """As directory_contents, but return (label, Path) widget options of
+    files which match pattern, e.g.
+    (('📄 file_one.csv', PosixPath('/root/file_one.csv')), ...)
+
+    Parameters:
+        root_path (Path): Root directory to search
+
+        pattern (str): glob pattern matched against directory entries
+
+        rglob (bool): Search subdirectories of root_path recursively
+
+    Returns:
+        (tuple[tuple[str, Path], ...]): File options, unique by name, in
+            traversal order
+    """
+    entries = directory_index(root_path, pattern, rglob).entries(
+        None if rglob else root_path)
+
+    def files() -> Iterator[PathOption]:
+        seen: set[str] = set()
+        for directory, name, is_dir in entries:
+            if not is_dir and name not in seen:
+                seen.add(name)
+                yield _file_option(directory, name)
+
+    return tuple(files())
+
+
+def _subdirectories(root_path: pathlib.Path, depth: int) -> Iterator[str]:
+    """Stream subdirectories of root_path, depth levels below it, in
+    pre-order"""
+
+    def walk(directory: str, level: int) -> Iterator[str]:
         try:
-            return registry[value]
-        except Exception:
-            return func
-
-    def register(value: str, func: Optional[Callable] = None) -> Callable:
-        """Register a function as the dipatch target based on value key"""
-        if func is None:
-            return lambda f: register(value, f)
-        registry[value] = func
-        return func
-
-    def wrapper(*args, **kwargs):
-        """Wrapper function for method decoration"""
-        return dispatch(kwargs.get("reference") or args[1])(*args, **kwargs)
-
-    # set wrapper function object properties
-    wrapper.register = register
-    wrapper.dispatch = dispatch
-    wrapper.registry = registry
-
-    return wrapper
+            with os.scandir(directory) as it:
+                subdirectories = [
+                    entry.path for entry in it
+                    # symlinked directories are not followed, as with rglob
+                    if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+        for subdirectory in subdirectories:
+            yield subdirectory
+            if level < depth:
+                yield from walk(subdirectory, level + 1)
+
+    return walk(str(root_path), 1) if depth > 0 else iter(())
+
+
+def directory_children(
+    root_path: pathlib.Path, depth: int = 1
+) -> tuple[str, ...]:
+    """Return iconified subdirectories of root_path, listing only depth
+    levels below it, e.g. ('📁 root/content', '📁 root/content/data')
+
+    Parameters:
+        root_path (Path): Directory whose subdirectories are listed
+
+        depth (int): Number of directory levels listed below root_path
+
+    Returns:
+        (tuple[str, ...]): Iconified subdirectories in pre-order
+    """
+    return tuple(
+        _label(IconUnicode.DIR, subdirectory)
+        for subdirectory in _subdirectories(root_path, depth))
+
+
+def directory_children_options(
+    root_path: pathlib.Path, depth: int = 1
+) -> tuple[PathOption, ...]:
+    """As directory_children, but return (label, Path) widget options
+
+    Parameters:
+        root_path (Path): Directory whose subdirectories are listed
+
+        depth (int): Number of directory levels listed below root_path
+
+    Returns:
+        (tuple[tuple[str, Path], ...]): Subdirectory options in pre-order
+    """
+    return tuple(map(_directory_option, _subdirectories(root_path, depth)))
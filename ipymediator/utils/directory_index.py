@@ -0,0 +1,281 @@
+import fnmatch
+import os
+import pathlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+
+class _DirectoryNode(NamedTuple):
+    """Snapshot of a single directory held by a DirectoryIndex"""
+
+    mtime_ns: int
+    # (name, is_dir) pairs of the directory entries matching the pattern
+    matches: tuple[tuple[str, bool], ...]
+    subdirectories: tuple[str, ...]
+
+
+class DirectoryDelta(NamedTuple):
+    """(name, is_dir) matches added to and removed from a directory"""
+
+    added: tuple[tuple[str, bool], ...]
+    removed: tuple[tuple[str, bool], ...]
+
+
+def _delta(
+    old: Optional[_DirectoryNode], new: Optional[_DirectoryNode]
+) -> DirectoryDelta:
+    """Return the matches added and removed between directory snapshots"""
+    old_matches = old.matches if old is not None else ()
+    new_matches = new.matches if new is not None else ()
+    old_set, new_set = set(old_matches), set(new_matches)
+    return DirectoryDelta(
+        tuple(match for match in new_matches if match not in old_set),
+        tuple(match for match in old_matches if match not in new_set))
+
+
+class DirectoryIndex:
+    """In-process index of the paths matching a glob pattern beneath a root
+    directory. The index is built once, answers lookups from memory and is
+    refreshed incrementally - only directories whose mtime has changed since
+    the last scan are listed again.
+
+    Directories are listed with os.scandir and entries are held as str
+    values, so no pathlib objects are created per directory entry.
+
+    Name patterns (e.g. '*.csv') are matched per directory entry. Patterns
+    containing a path separator cannot be matched incrementally and fall back
+    to a full pathlib glob on each refresh.
+    """
+
+    def __init__(
+        self, root_path: pathlib.Path, pattern: str, rglob: bool = True
+    ):
+        """Initialise DirectoryIndex class.
+
+        Params:
+            root_path (Path): Root directory of the index
+
+            pattern (str): glob pattern matched against directory entries
+
+            rglob (bool): Index subdirectories of root_path recursively
+        """
+        self.root_path = root_path
+        self.pattern = pattern
+        self.rglob = rglob
+        self._match = re.compile(
+            fnmatch.translate(os.path.normcase(pattern))).match
+        self._incremental = "/" not in pattern and os.sep not in pattern
+        self._nodes: dict[str, _DirectoryNode] = {}
+        self.refresh()
+
+    def _scan(self, directory: str, mtime_ns: int) -> _DirectoryNode:
+        """List a single directory, returning its matches and subdirectories"""
+        match, normcase = self._match, os.path.normcase
+        matches, subdirectories = [], []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if match(normcase(entry.name)):
+                        matches.append((entry.name, entry.is_dir()))
+                    # symlinked directories are not followed, as with rglob
+                    if self.rglob and entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+        except OSError:
+            pass
+        return _DirectoryNode(mtime_ns, tuple(matches), tuple(subdirectories))
+
+    def refresh(
+        self, directories: Optional[Iterable[os.PathLike]] = None
+    ) -> dict[str, DirectoryDelta]:
+        """Update the index, re-listing only directories with a changed mtime.
+        Directories which no longer exist are dropped from the index.
+
+        Params:
+            directories (Iterable): Optionally restrict the mtime check to
+                directories known to be modified (e.g. by a watcher). New
+                subdirectories found within them are indexed in full
+
+        Returns:
+            (dict[str, DirectoryDelta]): Matches added and removed, keyed by
+                each directory whose matches changed
+        """
+        old_nodes = self._nodes
+        if not self._incremental:
+            glob = self.root_path.rglob if self.rglob else self.root_path.glob
+            matches: dict[str, list[tuple[str, bool]]] = {}
+            for path in glob(self.pattern):
+                matches.setdefault(str(path.parent), []).append(
+                    (path.name, path.is_dir()))
+            nodes = {
+                directory: _DirectoryNode(0, tuple(matches_), ())
+                for directory, matches_ in matches.items()}
+        else:
+            stale = None if directories is None else {
+                os.fspath(directory) for directory in directories}
+            nodes = {}
+            stack = [str(self.root_path)]
+            while stack:
+                directory = stack.pop()
+                node = old_nodes.get(directory)
+                if node is None or stale is None or directory in stale:
+                    try:
+                        mtime_ns = os.stat(directory).st_mtime_ns
+                    except OSError:
+                        continue
+                    if node is None or node.mtime_ns != mtime_ns:
+                        node = self._scan(directory, mtime_ns)
+                nodes[directory] = node
+                # reversed, so the traversal remains in scandir pre-order
+                stack.extend(reversed(node.subdirectories))
+
+        self._nodes = nodes
+        deltas = {}
+        for directory in nodes.keys() | old_nodes.keys():
+            old, new = old_nodes.get(directory), nodes.get(directory)
+            if old is not new and (delta := _delta(old, new)) != ((), ()):
+                deltas[directory] = delta
+        return deltas
+
+    def directories(self) -> tuple[str, ...]:
+        """Return the directories held by this index in traversal order"""
+        return tuple(self._nodes)
+
+    def invalidate(self) -> None:
+        """Discard every directory snapshot and rebuild the index"""
+        self._nodes = {}
+        self.refresh()
+
+    def entries(
+        self, directory: Optional[pathlib.Path] = None
+    ) -> Iterator[tuple[str, str, bool]]:
+        """Stream indexed matches in traversal order, as (directory, name,
+        is_dir) tuples of the matching entry's parent directory and name.
+
+        Params:
+            directory (Path): Optionally restrict matches to the immediate
+                contents of an indexed directory. Directories not held by
+                the index (e.g. deleted directories) have no matches
+        """
+        if directory is None or not self._incremental:
+            nodes = self._nodes.items()
+        else:
+            directory_str = os.fspath(directory)
+            node = self._nodes.get(directory_str)
+            nodes = ((directory_str, node),) if node is not None else ()
+
+        for directory_str, node in nodes:
+            for name, is_dir in node.matches:
+                yield directory_str, name, is_dir
+
+    def matches(self, directory: Optional[pathlib.Path] = None) -> tuple[
+        pathlib.Path, ...
+    ]:
+        """Return indexed matches in traversal order as Path objects.
+
+        Params:
+            directory (Path): Optionally restrict matches to the immediate
+                contents of an indexed directory
+        """
+        return tuple(
+            pathlib.Path(directory_str, name)
+            for directory_str, name, _ in self.entries(directory))
+
+    def __contains__(self, directory: pathlib.Path) -> bool:
+        """Test whether directory has a snapshot held by this index"""
+        return os.fspath(directory) in self._nodes
+
+
+# (root_path, pattern, rglob) -> DirectoryIndex, least recently used first.
+# Beyond _MAX_INDEXES, the least recently used index is discarded
+_INDEXES: "OrderedDict[tuple[pathlib.Path, str, bool], DirectoryIndex]" = (
+    OrderedDict())
+_INDEXES_LOCK = threading.Lock()
+_MAX_INDEXES = 32
+
+
+def _indexes_within(
+    root_path: Optional[pathlib.Path],
+) -> Iterator[tuple[tuple[pathlib.Path, str, bool], DirectoryIndex]]:
+    """Yield registered indexes rooted at or beneath root_path"""
+    with _INDEXES_LOCK:
+        indexes = tuple(_INDEXES.items())
+    for key, index in indexes:
+        if root_path is None or key[0].is_relative_to(root_path):
+            yield key, index
+
+
+def directory_index(
+    root_path: pathlib.Path,
+    pattern: str,
+    rglob: bool = True,
+    validate: bool = True,
+) -> DirectoryIndex:
+    """Return the DirectoryIndex registered for root_path and pattern,
+    building it on first use. A registered index is validated by an
+    incremental refresh, re-listing only directories whose mtime changed.
+    A non-recursive lookup is answered from a recursive index of an ancestor
+    directory where one exists. At most _MAX_INDEXES indexes are held, the
+    least recently used is discarded.
+
+    Parameters:
+        root_path (Path): Root directory of the index
+
+        pattern (str): glob pattern matched against directory entries
+
+        rglob (bool): Index subdirectories of root_path recursively
+
+        validate (bool): Refresh a registered index, False where the
+            caller refreshes it (e.g. for the returned DirectoryDelta)
+
+    Returns:
+        (DirectoryIndex): Index holding a snapshot of root_path
+    """
+    key = (root_path, pattern, rglob)
+    index: Optional[DirectoryIndex] = None
+    # directories checked by the validating refresh, None for every one
+    stale: Optional[tuple[pathlib.Path, ...]] = None
+    with _INDEXES_LOCK:
+        if key in _INDEXES:
+            _INDEXES.move_to_end(key)
+            index = _INDEXES[key]
+        elif not rglob:
+            for key_, index_ in _INDEXES.items():
+                _, pattern_, rglob_ = key_
+                if (rglob_ and pattern_ == pattern and index_._incremental
+                        and root_path in index_):
+                    _INDEXES.move_to_end(key_)
+                    index, stale = index_, (root_path,)
+                    break
+
+    if index is not None:
+        if validate:
+            index.refresh(stale)
+        return index
+
+    # built outside the lock, so scans of other roots are not blocked
+    index = DirectoryIndex(root_path, pattern, rglob)
+    with _INDEXES_LOCK:
+        index = _INDEXES.setdefault(key, index)
+        _INDEXES.move_to_end(key)
+        while len(_INDEXES) > _MAX_INDEXES:
+            _INDEXES.popitem(last=False)
+    return index
+
+
+def refresh_directory_index(root_path: Optional[pathlib.Path] = None) -> None:
+    """Incrementally refresh registered indexes rooted at or beneath
+    root_path, or every registered index if root_path is None"""
+    for _, index in _indexes_within(root_path):
+        index.refresh()
+
+
+def invalidate_directory_index(
+    root_path: Optional[pathlib.Path] = None,
+) -> None:
+    """Discard registered indexes rooted at or beneath root_path, or every
+    registered index if root_path is None"""
+    for key, _ in _indexes_within(root_path):
+        with _INDEXES_LOCK:
+            _INDEXES.pop(key, None)
@@ -0,0 +1,318 @@
+import fnmatch
+import functools
+import re
+import types
+import weakref
+from typing import Any, Callable, Hashable, Mapping, Optional, Union
+
+# registry key - widget_name, glob pattern or (widget_name, trait) pair
+NotifyKey = Union[str, tuple[str, str]]
+_MAGIC = re.compile(r"[*?[]")
+# references resolved by pattern or to the default function, cached per
+# dispatcher beyond its exact keys - further references are resolved per call
+_MAX_RESOLVED = 4096
+
+
+def _check_keys(keys: tuple) -> None:
+    """Raise TypeError for no keys or a key of unsupported type"""
+    if not keys:
+        raise TypeError("register requires at least one key")
+    for key in keys:
+        if not (isinstance(key, str) or (
+                isinstance(key, tuple) and len(key) == 2
+                and all(isinstance(value, str) for value in key))):
+            raise TypeError(f"check 'key' parameter: {key!r}")
+
+
+def notify_handler(
+    *keys: NotifyKey, dispatcher: str = "notify"
+) -> Callable[[Callable], Callable]:
+    """Mark a method as the handler of keys in its class's dispatcher (a
+    singlenotifydispatch attribute), registered by ABCTraitsMeta on class
+    creation. A subclass may so add or override handlers of an inherited
+    notify without redefining it, or affecting the base class.
+
+    Params:
+        *keys (str | tuple[str, str]): widget_name, glob pattern or
+            (widget_name, trait) pair
+
+        dispatcher (str): Attribute name of the singlenotifydispatch
+
+    Raises:
+        TypeError: No keys or a key of unsupported type
+    """
+    _check_keys(keys)
+
+    def decorator(func: Callable) -> Callable:
+        func.__notify_handler__ = (dispatcher, keys)  # type: ignore
+        return func
+
+    return decorator
+
+
+def notify_key(reference: Any) -> Any:
+    """Return the registry key for a notify reference - the reference itself
+    if it is a str, otherwise its widget_name (e.g. a Component initialised
+    with notify_self=True)"""
+    if reference.__class__ is str:
+        return reference
+    return getattr(reference, "widget_name", reference)
+
+
+class _NotifyTable:
+    """Registry keys compiled for lookup - exact keys in a dict, 'prefix*'
+    patterns in a prefix trie and any other glob patterns in a list.
+
+    Precedence: exact (widget_name, trait) pair, exact widget_name, longest
+    prefix, then glob patterns in registration order. Trait specific
+    patterns take precedence over widget_name patterns of equal length.
+    """
+
+    __slots__ = ("exact", "trie", "globs", "pairs")
+
+    # trie node key holding {trait or None: function}
+    _FUNCS = None
+
+    def __init__(self, registry: dict[NotifyKey, Callable]):
+        self.exact: dict[Hashable, Callable] = {}
+        self.trie: dict = {}
+        self.globs: list[tuple[Callable, Optional[str], Callable]] = []
+        # True if any key is a (widget_name, trait) pair
+        self.pairs = False
+
+        for key, func in registry.items():
+            name, trait = key if isinstance(key, tuple) else (key, None)
+            self.pairs |= trait is not None
+            if not _MAGIC.search(name):
+                self.exact[key] = func
+            elif name.endswith("*") and not _MAGIC.search(name[:-1]):
+                node = self.trie
+                for char in name[:-1]:
+                    node = node.setdefault(char, {})
+                node.setdefault(self._FUNCS, {})[trait] = func
+            else:
+                self.globs.append(
+                    (re.compile(fnmatch.translate(name)).match, trait, func))
+
+    def resolve(self, name: Any, trait: Optional[str] = None) -> Optional[
+        Callable
+    ]:
+        """Return the function registered for name and trait, or None"""
+        exact = self.exact
+        if trait is not None and (func := exact.get((name, trait))):
+            return func
+        if (func := exact.get(name)) is not None:
+            return func
+        if name.__class__ is not str:
+            return None
+
+        node, found = self.trie, None
+        for char in name:
+            if (funcs := node.get(self._FUNCS)) is not None:
+                found = funcs.get(trait, funcs.get(None, found))
+            if (node := node.get(char)) is None:
+                break
+        else:
+            if (funcs := node.get(self._FUNCS)) is not None:
+                found = funcs.get(trait, funcs.get(None, found))
+        if found is not None:
+            return found
+
+        for match, trait_, func in self.globs:
+            if (trait_ is None or trait_ == trait) and match(name):
+                return func
+        return None
+
+
+class _BoundNotifyDispatch:
+    """Per-instance handler table of a singlenotifydispatch. The instance is
+    weakly referenced, so that the table cached in the instance __dict__
+    forms no reference cycle with it"""
+
+    __slots__ = ("_self_ref", "_dispatcher", "_cache", "_pairs",
+                 "__weakref__")
+
+    def __init__(self, dispatcher: "singlenotifydispatch", instance: Any):
+        try:
+            self._self_ref = weakref.ref(instance)
+        except TypeError:
+            # instance without __weakref__ slot, never cached (no __dict__)
+            self._self_ref = lambda: instance
+        self._dispatcher = dispatcher
+        self.bind()
+
+    @property
+    def __self__(self) -> Any:
+        """The instance handlers are called with, None once collected"""
+        return self._self_ref()
+
+    def bind(self) -> None:
+        """Share the dispatcher's current handler cache"""
+        self._cache = self._dispatcher._cache
+        self._pairs = self._dispatcher._table.pairs
+
+    def _resolve(self, key: Hashable) -> Callable:
+        return self._dispatcher._resolve(key)
+
+    def __call__(self, reference: Any, change: Any) -> Any:
+        """Call the handler registered for reference"""
+        if reference.__class__ is str:
+            key = reference
+        else:
+            key = getattr(reference, "widget_name", reference)
+        if self._pairs and change:
+            key = (key, change.get("name"))
+        if (func := self._cache.get(key)) is None:
+            func = self._resolve(key)
+        return func(self._self_ref(), reference, change)
+
+
+class singlenotifydispatch:
+    """A class method decorator, which replicates the logic from
+    functools.singledispatchmethod, but with a function dispatch based on the
+    value of the first parameter following self (reference).
+
+    Registered functions are looked up by reference str value, or by the
+    widget_name of a Component reference (notify_self=True). Functions may be
+    registered to several keys at once, to glob patterns (e.g. 'Row*Button')
+    and to (widget_name, trait) pairs.
+
+    Within an ABCTraitsMeta class (e.g. a Mediator), a subclass inherits the
+    registrations of its base class's dispatcher of the same name - whether
+    it redefines the dispatcher or adds handlers with notify_handler - its
+    own registrations taking precedence. The merged table is compiled once
+    per class, and its handler cache shared by every instance, so that
+    dispatch is a single dict lookup and call after a reference is first
+    resolved.
+    """
+
+    def __init__(self, func: Callable):
+        """Initialise singlenotifydispatch class.
+
+        Params:
+            func (Callable): Default function, called for references with no
+                registered function
+        """
+        functools.update_wrapper(self, func)
+        self.func = func
+        # key -> function map, registered to this dispatcher
+        self.registry: dict[NotifyKey, Callable] = {}
+        self.attrname: Optional[str] = None
+        # dispatcher of a base class, see inherit
+        self.parent: Optional["singlenotifydispatch"] = None
+        self._children: "weakref.WeakSet[singlenotifydispatch]" = (
+            weakref.WeakSet())
+        self._bound: "weakref.WeakSet[_BoundNotifyDispatch]" = (
+            weakref.WeakSet())
+        self._compile()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attrname = name
+
+    @property
+    def handlers(self) -> Mapping[NotifyKey, Callable]:
+        """Read-only key -> function map merged along base dispatchers, in
+        precedence order"""
+        return self._handlers
+
+    def inherit(self, parent: "singlenotifydispatch") -> None:
+        """Merge the registrations of parent, a base class's dispatcher,
+        beneath this dispatcher's own. Later registrations to parent are
+        merged too"""
+        self.parent = parent
+        parent._children.add(self)
+        self._compile()
+
+    def derive(self) -> "singlenotifydispatch":
+        """Return a dispatcher inheriting this one, with the same default
+        function, for a subclass adding handlers"""
+        child = type(self)(self.func)
+        child.attrname = self.attrname
+        child.inherit(self)
+        return child
+
+    def _compile(self) -> None:
+        """Merge and compile registrations, rebinding instances and
+        recompiling inheriting dispatchers"""
+        # own keys first, so own glob patterns are matched before a parent's
+        handlers = dict(self.registry)
+        if self.parent is not None:
+            for key, func in self.parent.handlers.items():
+                handlers.setdefault(key, func)
+        self._handlers = types.MappingProxyType(handlers)
+        self._table = _NotifyTable(handlers)
+        # key -> function shared by bound tables, extended as pattern
+        # matches are resolved
+        self._cache: dict[Hashable, Callable] = dict(self._table.exact)
+        self._cache_limit = len(self._cache) + _MAX_RESOLVED
+        for bound in tuple(self._bound):
+            bound.bind()
+        for child in tuple(self._children):
+            child._compile()
+
+    def _resolve(self, key: Hashable) -> Callable:
+        if self._table.pairs and key.__class__ is tuple:
+            func = self._table.resolve(*key)
+        else:
+            func = self._table.resolve(key)
+        func = func or self.func
+        # bounded, as references may be unbounded (e.g. generated names)
+        if len(self._cache) < self._cache_limit:
+            self._cache[key] = func
+        return func
+
+    def register(
+        self,
+        *keys: Union[NotifyKey, Callable],
+        func: Optional[Callable] = None,
+    ) -> Callable:
+        """Register a function as the dispatch target of one or more keys.
+
+        Params:
+            *keys (str | tuple[str, str]): widget_name, glob pattern or
+                (widget_name, trait) pair. A trailing callable is taken as
+                func, e.g. register('name', function)
+
+            func (Callable): Function to register, or None to return a
+                decorator
+
+        Raises:
+            TypeError: No keys or a key of unsupported type
+        """
+        if func is None and keys and callable(keys[-1]):
+            keys, func = keys[:-1], keys[-1]
+        _check_keys(keys)
+        if func is None:
+            return lambda f: self.register(*keys, func=f)
+
+        for key in keys:
+            self.registry[key] = func  # type: ignore
+        self._compile()
+        return func
+
+    def dispatch(self, value: Any, trait: Optional[str] = None) -> Callable:
+        """Returns a function based on registry key (value) and trait name"""
+        return self._table.resolve(notify_key(value), trait) or self.func
+
+    def __get__(
+        self, instance: Any, owner: Optional[type] = None
+    ) -> Union["singlenotifydispatch", _BoundNotifyDispatch]:
+        if instance is None:
+            return self
+        bound = _BoundNotifyDispatch(self, instance)
+        self._bound.add(bound)
+        if getattr(type(instance), self.attrname, None) is not self:
+            # looked up through super() from a subclass override, which the
+            # cached table would shadow
+            return bound
+        try:
+            # cache on the instance, shadowing this non-data descriptor
+            instance.__dict__[self.attrname] = bound
+        except (AttributeError, TypeError):
+            pass
+        return bound
+
+    def __call__(self, instance: Any, reference: Any, change: Any) -> Any:
+        """Dispatch when called through the class, e.g. Cls.notify(obj, ...)"""
+        trait = change.get("name") if self._table.pairs and change else None
+        return self.dispatch(reference, trait)(instance, reference, change)
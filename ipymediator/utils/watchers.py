@@ -0,0 +1,230 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+# inotify(7) event masks for entries created, deleted or moved in a directory
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+# always reported, with wd -1, when the kernel event queue overflowed
+_IN_Q_OVERFLOW = 0x00004000
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_ONLYDIR = 0x01000000
+_IN_MASK = (
+    _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+# struct inotify_event {int wd; uint32_t mask, cookie, len; char name[];}
+_EVENT = struct.Struct("iIII")
+
+
+class _PollingBackend:
+    """Watch backend comparing directory mtimes on each poll"""
+
+    def __init__(self, sleep: Callable[[float], object] = time.sleep):
+        self._mtimes: dict[str, Optional[int]] = {}
+        self._sleep = sleep
+
+    @staticmethod
+    def _mtime(directory: str) -> Optional[int]:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def add(self, directory: str) -> None:
+        self._mtimes[directory] = self._mtime(directory)
+
+    def remove(self, directory: str) -> None:
+        self._mtimes.pop(directory, None)
+
+    def poll(self, timeout: float) -> Optional[set[str]]:
+        """Sleep for timeout, returning directories modified meanwhile"""
+        self._sleep(timeout)
+        changed = set()
+        for directory, mtime in tuple(self._mtimes.items()):
+            if (current := self._mtime(directory)) != mtime:
+                self._mtimes[directory] = current
+                changed.add(directory)
+        return changed
+
+    def close(self) -> None:
+        self._mtimes.clear()
+
+
+class _InotifyBackend:
+    """Watch backend using Linux inotify(7) through ctypes"""
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        # watch descriptor <-> directory
+        self._directories: dict[int, str] = {}
+        self._descriptors: dict[str, int] = {}
+
+    def add(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), _IN_MASK)
+        if wd >= 0:
+            self._directories[wd] = directory
+            self._descriptors[directory] = wd
+
+    def remove(self, directory: str) -> None:
+        if (wd := self._descriptors.pop(directory, None)) is not None:
+            self._directories.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def poll(self, timeout: float) -> Optional[set[str]]:
+        """Wait up to timeout for events, returning directories modified, or
+        None if events were lost to a queue overflow"""
+        changed: set[str] = set()
+        if not select.select((self._fd,), (), (), timeout)[0]:
+            return changed
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = _EVENT.unpack_from(buffer, offset)
+            offset += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            if (directory := self._directories.get(wd)) is not None:
+                changed.add(directory)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+        self._directories.clear()
+        self._descriptors.clear()
+
+
+class DirectoryWatcher:
+    """Watches a set of directories on a daemon thread, passing the set of
+    modified directories to a callback. Modifications are coalesced, so the
+    callback runs at most once per interval however many entries are
+    written within it. Where events were lost (an inotify queue overflow)
+    the callback is passed None - any watched directory may have changed.
+
+    The 'inotify' backend receives kernel events on Linux. The 'polling'
+    backend compares directory mtimes once per interval on any platform.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Optional[set[str]]], None],
+        interval: float = 1.0,
+        backend: str = "auto",
+    ):
+        """Initialise DirectoryWatcher class.
+
+        Params:
+            callback (Callable): Called on the watcher thread with the set of
+                directories modified since the previous call, or None if
+                modifications were lost
+
+            interval (float): Minimum seconds between callback calls
+
+            backend (str): 'inotify', 'polling' or 'auto' - inotify where
+                available, falling back to polling
+
+        Raises:
+            ValueError: Unknown backend name
+
+            OSError: inotify backend requested but unavailable
+        """
+        if backend not in ("auto", "inotify", "polling"):
+            raise ValueError(f"check 'backend' parameter: {backend}")
+
+        self.callback = callback
+        self.interval = interval
+        self._directories: set[str] = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._backend: "_PollingBackend | _InotifyBackend"
+        if backend == "polling" or (
+                backend == "auto" and not sys.platform.startswith("linux")):
+            self._backend = _PollingBackend(sleep=self._stopped.wait)
+        else:
+            try:
+                self._backend = _InotifyBackend()
+            except (AttributeError, OSError):
+                if backend == "inotify":
+                    raise
+                self._backend = _PollingBackend(sleep=self._stopped.wait)
+
+    @property
+    def backend(self) -> str:
+        """Name of the backend in use"""
+        if isinstance(self._backend, _InotifyBackend):
+            return "inotify"
+        return "polling"
+
+    @property
+    def directories(self) -> frozenset[str]:
+        """Directories currently watched"""
+        return frozenset(self._directories)
+
+    def watch(self, directories: Iterable[os.PathLike]) -> None:
+        """Replace the set of watched directories"""
+        directories = {os.fspath(directory) for directory in directories}
+        with self._lock:
+            for directory in self._directories - directories:
+                self._backend.remove(directory)
+            for directory in directories - self._directories:
+                self._backend.add(directory)
+            self._directories = directories
+
+    def start(self) -> None:
+        """Start the watcher thread"""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release backend resources. A stopped
+        watcher cannot be restarted"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self._backend.close()
+            self._directories = set()
+
+    def _run(self) -> None:
+        changed: set[str] = set()
+        overflowed = False
+        delivered = time.monotonic()
+        while not self._stopped.is_set():
+            wait = max(0.0, self.interval - (time.monotonic() - delivered))
+            polled = self._backend.poll(
+                wait if changed or overflowed else self.interval)
+            if polled is None:
+                overflowed = True
+            else:
+                changed |= polled
+            # rate limit - coalesce changes until interval has elapsed
+            if (changed or overflowed) and (
+                    time.monotonic() - delivered >= self.interval):
+                if not self._stopped.is_set():
+                    self.callback(None if overflowed else changed)
+                changed, overflowed = set(), False
+                delivered = time.monotonic()
@@ -0,0 +1,26 @@
+import json
+
+from benchmarks.__main__ import main
+
+
+def test_benchmark_suite(tmp_path, capsys):
+    """Test the benchmark suite runs headless on a small tree, writing and
+    comparing JSON results"""
+    argv = [
+        "--size", "40", "--components", "10", "--number", "100",
+        "--repeat", "1", "--output", str(tmp_path / "before.json")]
+    document = main(argv)
+    assert json.loads((tmp_path / "before.json").read_text()) == document
+    assert document["results"].keys() == {
+        "component_construction",
+        "notify_roundtrip",
+        "dispatch",
+        "dialog_construction",
+        "filter_populate_cold",
+        "filter_populate_cached"}
+    assert all(
+        result["value"] > 0 and result["unit"] == "s"
+        for result in document["results"].values())
+
+    main(argv[:-2] + ["--compare", str(tmp_path / "before.json")])
+    assert "ratio" in capsys.readouterr().out
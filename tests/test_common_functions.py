@@ -1,16 +1,36 @@
 # pyright: reportGeneralTypeIssues=false, reportAttributeAccessIssue=false
+import importlib
 import pathlib
+import time
 from typing import Union
 from ipymediator.enumerations import Value, IconUnicode
 from ipymediator.interface import Component, Mediator
 from ipymediator.utils import (
+    DirectoryIndex,
+    DirectoryWatcher,
+    directory_children,
+    directory_children_options,
+    directory_content_options,
     directory_contents,
+    directory_index,
+    directory_path_options,
     directory_paths,
     iconify_str,
+    invalidate_directory_index,
     deiconify_str,
-    singlenotifydispatch)
+    notify_handler,
+    path_option,
+    refresh_directory_index,
+    singlenotifydispatch,
+    unique_everseen)
 from ipywidgets import widgets as w
 from traitlets import traitlets as t
+import pytest
+
+# the submodule, shadowed in ipymediator.utils by its directory_index function
+directory_index_module = importlib.import_module(
+    "ipymediator.utils.directory_index")
+dispatch_module = importlib.import_module("ipymediator.utils.dispatch")
 
 
 class MediatorWithSingleNotifyDispatch(Mediator, t.HasTraits):
@@ -53,6 +73,197 @@ def test_notify_dispatch():
     assert mediator.reference == "component_two"
 
 
+class MediatorWithReferences(MediatorWithSingleNotifyDispatch):
+    reference = t.Any(default_value=None, allow_none=True)
+
+
+def test_notify_dispatch_bound():
+    mediator = MediatorWithReferences()
+    # handler table bound once per instance
+    assert mediator.notify is mediator.notify
+    assert mediator.notify.__self__ is mediator
+
+    component = Component(
+        mediator=mediator,
+        widget=w.ToggleButton(),
+        widget_name="component_one",
+        names=("value",),
+        notify_self=True)
+
+    # Component reference dispatched by its widget_name
+    component.widget.value = True
+    assert mediator.reference is component
+
+
+class MediatorWithNotifyOverride(MediatorWithSingleNotifyDispatch):
+    """Overrides notify with a plain method calling the dispatcher"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def notify(self, reference: str, change: Value) -> None:
+        self.calls.append(reference)
+        super().notify(reference, change)
+
+
+def test_notify_dispatch_override():
+    """Test a subclass override of notify is not shadowed by the handler
+    table cached on the instance"""
+    mediator = MediatorWithNotifyOverride()
+    for _ in range(3):
+        mediator.notify("component_one", {"name": "value"})
+    assert mediator.calls == ["component_one"] * 3
+    assert mediator.reference == "component_one"
+    assert "notify" not in vars(mediator)
+
+
+def test_notify_dispatch_keys(monkeypatch):
+    class MediatorWithKeys(Mediator, t.HasTraits):
+        handler = t.Unicode(default_value=None, allow_none=True)
+
+        @singlenotifydispatch
+        def notify(self, reference: Union[str, Component], change) -> None:
+            self.handler = "default"
+
+        @notify.register("Exact", "Other")
+        def _(self, reference: str, change) -> None:
+            self.handler = "exact"
+
+        @notify.register("Row*")
+        def _(self, reference: str, change) -> None:
+            self.handler = "prefix"
+
+        @notify.register("Row1*")
+        def _(self, reference: str, change) -> None:
+            self.handler = "longer prefix"
+
+        @notify.register("*Button")
+        def _(self, reference: str, change) -> None:
+            self.handler = "glob"
+
+        @notify.register(("Row*", "disabled"), ("Exact", "disabled"))
+        def _(self, reference: str, change) -> None:
+            self.handler = "trait"
+
+    mediator = MediatorWithKeys()
+    for reference, name, handler in (
+            ("Exact", "value", "exact"),
+            ("Other", "value", "exact"),
+            ("Exact", "disabled", "trait"),
+            ("Row0Button", "value", "prefix"),
+            ("Row10Button", "value", "longer prefix"),
+            ("Row0Button", "disabled", "trait"),
+            ("Row10Button", "disabled", "longer prefix"),
+            ("SaveButton", "value", "glob"),
+            ("Unknown", "value", "default")):
+        # repeated to dispatch from the resolved cache
+        for _ in range(2):
+            mediator.handler = None
+            mediator.notify(reference, {"name": name})
+            assert mediator.handler == handler, (reference, name)
+
+    # registered after binding
+    MediatorWithKeys.notify.register(
+        "Unknown", lambda self, reference, change: setattr(
+            self, "handler", "late"))
+    mediator.notify("Unknown", {"name": "value"})
+    assert mediator.handler == "late"
+
+    # change dicts without a name (e.g. synthesized) match no trait pair
+    mediator.notify("Row0Button", {"new": True})
+    assert mediator.handler == "prefix"
+    MediatorWithKeys.notify(mediator, "Exact", {"new": True})
+    assert mediator.handler == "exact"
+
+    # resolved references are cached up to a bound
+    monkeypatch.setattr(dispatch_module, "_MAX_RESOLVED", 2)
+    MediatorWithKeys.notify.register(
+        "Late", lambda self, reference, change: None)
+    for i in range(5):
+        mediator.notify(f"Row{i}Button", {"name": "value"})
+        assert mediator.handler == (
+            "longer prefix" if i == 1 else "prefix")
+    assert len(MediatorWithKeys.notify._cache) <= (
+        len(MediatorWithKeys.notify._table.exact) + 2)
+
+    with pytest.raises(TypeError):
+        MediatorWithKeys.notify.register(("Row*",))
+
+
+class MediatorWithOverride(MediatorWithSingleNotifyDispatch):
+    """Overrides one handler and adds another with notify_handler"""
+
+    @notify_handler("component_two")
+    def _(self, reference: str, change: Value) -> None:
+        self.reference = "overridden"
+
+    @notify_handler("component_three", ("Row*", "disabled"))
+    def _(self, reference: str, change: Value) -> None:
+        self.reference = "added"
+
+
+class MediatorWithRedefined(MediatorWithOverride):
+    """Redefines notify, inheriting registrations beneath its own"""
+
+    @singlenotifydispatch
+    def notify(self, reference: Union[str, Component], change: Value) -> None:
+        self.reference = "redefined default"
+
+    @notify.register("component_three")
+    def _(self, reference: str, change: Value) -> None:
+        self.reference = "redefined"
+
+
+def test_notify_dispatch_inheritance():
+    """Test subclass dispatchers merge base class registrations, with their
+    own taking precedence, without affecting the base class"""
+    base = MediatorWithSingleNotifyDispatch.notify
+    assert MediatorWithOverride.notify is not base
+    assert MediatorWithOverride.notify.parent is base
+    assert base.handlers.keys() == {"component_one", "component_two"}
+
+    for cls, expected in (
+            (MediatorWithSingleNotifyDispatch, (
+                "component_one", "component_two", None, None)),
+            (MediatorWithOverride, (
+                "component_one", "overridden", "added", None)),
+            (MediatorWithRedefined, (
+                "component_one", "overridden", "redefined",
+                "redefined default"))):
+        mediator = cls()
+        for reference, handled in zip((
+                "component_one", "component_two", "component_three",
+                "unknown"), expected):
+            mediator.reference = None
+            mediator.notify(reference, {"name": "value"})
+            assert mediator.reference == handled, (cls, reference)
+        mediator.notify("Row1", {"name": "disabled"})
+    assert mediator.reference == "added"
+
+    # later base class registrations are merged beneath subclass handlers
+    class MediatorWithLate(MediatorWithRedefined):
+        @notify_handler("component_five")
+        def _(self, reference: str, change: Value) -> None:
+            pass
+
+    MediatorWithRedefined.notify.register(
+        "component_four", lambda self, reference, change: setattr(
+            self, "reference", "late"))
+    mediator = MediatorWithLate()
+    mediator.notify("component_four", {"name": "value"})
+    assert mediator.reference == "late"
+    assert "component_four" not in MediatorWithOverride.notify.handlers
+    with pytest.raises(TypeError):
+        MediatorWithRedefined.notify.handlers["x"] = None
+
+    with pytest.raises(TypeError):
+        class MediatorWithoutDispatcher(Mediator):
+            @notify_handler("component_one", dispatcher="dispatch")
+            def _(self, reference: str, change: Value) -> None:
+                pass
+
+
 def test_pathlib_functions():
     """"""
     root_path = pathlib.Path("/").absolute()
@@ -128,3 +339,131 @@ def test_pathlib_functions():
         # all valid .py files in the tests dir
         for filename in file_paths:
             assert (dir / filename.name).is_file()
+
+
+def test_directory_index(tmp_path, monkeypatch):
+    """Test DirectoryIndex lookups and incremental refresh"""
+    (tmp_path / "sub_one").mkdir()
+    (tmp_path / "sub_two").mkdir()
+    (tmp_path / "sub_one" / "file_one.csv").touch()
+    (tmp_path / "sub_two" / "file_two.csv").touch()
+
+    index = directory_index(tmp_path, "*.csv", rglob=True)
+    # index is registered and reused for the same root_path and pattern
+    assert directory_index(tmp_path, "*.csv", rglob=True) is index
+    # non-recursive lookups are answered by the recursive ancestor index
+    assert directory_index(tmp_path / "sub_one", "*.csv", False) is index
+    assert set(index.matches()) == {
+        tmp_path / "sub_one" / "file_one.csv",
+        tmp_path / "sub_two" / "file_two.csv"}
+
+    # count directory listings made by refresh
+    scanned = []
+    scan = DirectoryIndex._scan
+
+    def counting_scan(self, directory, mtime_ns):
+        scanned.append(directory)
+        return scan(self, directory, mtime_ns)
+
+    monkeypatch.setattr(DirectoryIndex, "_scan", counting_scan)
+
+    (tmp_path / "sub_two" / "file_three.csv").touch()
+    # lookups are validated - only the modified directory is listed again
+    assert set(directory_contents(tmp_path / "sub_two", "*.csv", False)) == {
+        iconify_str(IconUnicode.FILE, tmp_path / "sub_two" / "file_two.csv"),
+        iconify_str(IconUnicode.FILE, tmp_path / "sub_two" / "file_three.csv")}
+    assert scanned == [str(tmp_path / "sub_two")]
+    assert directory_index(tmp_path, "*.csv", rglob=True) is index
+    assert scanned == [str(tmp_path / "sub_two")]
+
+    (tmp_path / "sub_one" / "file_four.csv").touch()
+    # unless validation is left to the caller
+    directory_index(tmp_path, "*.csv", rglob=True, validate=False)
+    assert scanned == [str(tmp_path / "sub_two")]
+    refresh_directory_index(tmp_path)
+    assert scanned == [str(tmp_path / "sub_two"), str(tmp_path / "sub_one")]
+
+    # invalidated indexes are rebuilt on the next lookup
+    invalidate_directory_index(tmp_path)
+    assert directory_index(tmp_path, "*.csv", rglob=True) is not index
+
+    # the least recently used index is discarded beyond _MAX_INDEXES
+    monkeypatch.setattr(directory_index_module, "_MAX_INDEXES", 2)
+    index = directory_index(tmp_path, "*.csv", rglob=True)
+    directory_index(tmp_path / "sub_one", "*.txt", rglob=True)
+    assert directory_index(tmp_path, "*.csv", rglob=True) is index
+    directory_index(tmp_path / "sub_two", "*.txt", rglob=True)
+    assert directory_index(tmp_path, "*.csv", rglob=True) is index
+    assert len(directory_index_module._INDEXES) <= 2
+    assert (tmp_path / "sub_one", "*.txt", True) not in (
+        directory_index_module._INDEXES)
+    invalidate_directory_index(tmp_path)
+
+
+def test_path_options(tmp_path):
+    """Test (label, Path) options match the iconified str functions, with
+    Path values built from the scan rather than parsed from labels"""
+    (tmp_path / "sub_one" / "deep").mkdir(parents=True)
+    (tmp_path / "sub_one" / "file_one.csv").touch()
+    (tmp_path / "file_two.csv").touch()
+
+    for options, labels in (
+            (directory_path_options(tmp_path, "*.csv"),
+             directory_paths(tmp_path, "*.csv")),
+            (directory_content_options(tmp_path, "*.csv"),
+             directory_contents(tmp_path, "*.csv")),
+            (directory_children_options(tmp_path, depth=2),
+             directory_children(tmp_path, depth=2))):
+        assert tuple(label for label, _ in options) == labels
+        assert all(
+            isinstance(path, pathlib.Path) and path.exists()
+            for _, path in options)
+
+    assert set(directory_content_options(tmp_path, "*.csv")) == {
+        (f"{IconUnicode.FILE}file_one.csv",
+         tmp_path / "sub_one" / "file_one.csv"),
+        (f"{IconUnicode.FILE}file_two.csv", tmp_path / "file_two.csv")}
+    assert directory_path_options(tmp_path, "*.csv", rglob=False) == (
+        path_option(IconUnicode.DIR, tmp_path.parent),
+        path_option(IconUnicode.DIR, tmp_path))
+
+    # options are built once per path and shared between listings
+    assert path_option(IconUnicode.FILE, tmp_path / "file_two.csv") is (
+        directory_content_options(tmp_path, "*.csv", rglob=False)[0])
+    invalidate_directory_index(tmp_path)
+
+
+def test_unique_everseen():
+    """Test order-preserving de-duplication is lazy and stable"""
+    values = iter(("b", "a", "b", "c", "a"))
+    unique = unique_everseen(values)
+    assert next(unique) == "b"
+    assert tuple(unique) == ("a", "c")
+
+
+def test_directory_watcher(tmp_path):
+    """Test modified directories are coalesced into one callback"""
+    changes = []
+    watcher = DirectoryWatcher(changes.append, interval=0.1, backend="auto")
+    watcher.watch((tmp_path,))
+    watcher.start()
+    for i in range(20):
+        (tmp_path / f"file_{i}.csv").touch()
+    deadline = time.monotonic() + 5
+    while not changes and time.monotonic() < deadline:
+        time.sleep(0.05)
+    watcher.stop()
+
+    assert changes[0] == {str(tmp_path)}
+    assert len(changes) <= 2
+
+    # lost events (an inotify queue overflow) are passed as None
+    changes = []
+    watcher = DirectoryWatcher(changes.append, interval=0.05, backend="auto")
+    watcher._backend.poll = lambda timeout: None
+    watcher.start()
+    deadline = time.monotonic() + 5
+    while not changes and time.monotonic() < deadline:
+        time.sleep(0.05)
+    watcher.stop()
+    assert changes[0] is None
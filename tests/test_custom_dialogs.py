@@ -1,5 +1,15 @@
 # pyright: reportGeneralTypeIssues=false, reportAttributeAccessIssue=false
-from ipymediator.dialogs import FileDialog
+import asyncio
+import gc
+import time
+import weakref
+
+from ipymediator.dialogs import FileDialog, FileDialogPool
+from ipymediator.enumerations import IconUnicode
+from ipymediator.exceptions import CommBudgetError
+from ipymediator.testing import CommRecorder
+from ipymediator.utils import path_option
+import pytest
 
 ##############################################
 # poetry run pytest --cov=ipymediator tests/ #
@@ -14,8 +24,11 @@ def test_file_dialog():
     # test traits are present
     assert dialog_one.has_trait("dialog_open")
     assert dialog_one.has_trait("dialog_selection")
-    # filter_pattern is None
+    # filter_pattern is None - hidden file_option built on first access
+    assert not dialog_one.file_option.built
+    assert not dialog_one.button_min.built
     assert dialog_one.file_option["layout"].visibility == "hidden"
+    assert dialog_one.file_option["layout"].grid_area == "FileOption"
     assert dialog_one.file_option["disabled"] is True
     assert dialog_one.file_option["options"] == (("", "*"),)
 
@@ -28,3 +41,373 @@ def test_file_dialog():
     # print(dialog_two.directory["options"])
 
     # assert dialog_two.file_option["options"] is False
+
+
+def test_file_dialog_refresh(tmp_path, monkeypatch):
+    """Test FileDialog refresh picks up files added after construction"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    (tmp_path / "file_one.csv").touch()
+
+    dialog = FileDialog(filter_pattern=(("CSV", "*.csv"),))
+    dialog.file_option["value"] = "*.csv"
+    dialog.directory["value"] = dialog.directory["options"][1][1]
+    assert len(dialog.directory_files["options"]) == 1
+
+    (tmp_path / "file_two.csv").touch()
+    dialog.refresh()
+    # the selected directory is retained and its listing updated
+    assert dialog.directory["value"] == tmp_path
+    assert len(dialog.directory_files["options"]) == 2
+
+    (tmp_path / "file_three.csv").touch()
+    dialog.invalidate()
+    assert len(dialog.directory_files["options"]) == 3
+
+
+def test_file_dialog_async_scan(tmp_path, monkeypatch):
+    """Test async_scan populates Components once superseding scans finish"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    (tmp_path / "file_one.csv").touch()
+    (tmp_path / "file_two.txt").touch()
+
+    dialog = FileDialog(
+        filter_pattern=(("CSV", "*.csv"), ("TXT", "*.txt")), async_scan=True)
+
+    dialog.file_option["value"] = "*.csv"
+    # disabled without options until the scan completes
+    assert dialog.directory["disabled"] is True
+    assert dialog.directory["options"] == ()
+    # a newer filter change supersedes the in-flight scan
+    dialog.file_option["value"] = "*.txt"
+    # without a running loop, results are populated by wait_scans on this
+    # thread, never by the worker thread
+    time.sleep(0.1)
+    assert dialog.directory["disabled"] is True
+    assert dialog.wait_scans(timeout=5)
+
+    assert dialog.directory["disabled"] is False
+    assert dialog.directory["options"]
+
+    dialog.directory["value"] = dialog.directory["options"][1][1]
+    assert dialog.directory_files["disabled"] is True
+    assert dialog.directory_files["options"] == ()
+    assert dialog.wait_scans(timeout=5)
+    # (label, Path) options
+    assert dialog.directory_files["options"] == (
+        (f"{IconUnicode.FILE}file_two.txt", tmp_path / "file_two.txt"),)
+
+
+def test_file_dialog_pages(tmp_path, monkeypatch):
+    """Test page_size bounds DirectoryFiles options and FileFilter narrows
+    the listing server-side"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    for i in range(25):
+        (tmp_path / f"file_{i:02}.csv").touch()
+
+    for page_size in (0, -1):
+        with pytest.raises(ValueError):
+            FileDialog(page_size=page_size)
+
+    dialog = FileDialog(filter_pattern=(("CSV", "*.csv"),), page_size=10)
+    dialog.file_option["value"] = "*.csv"
+    dialog.directory["value"] = dialog.directory["options"][1][1]
+
+    assert len(dialog.directory_files["options"]) == 10
+    assert dialog.label_page["value"] == "1-10 of 25"
+    assert dialog.button_prev["disabled"] is True
+
+    dialog.button_next.widget.click()
+    dialog.button_next.widget.click()
+    assert len(dialog.directory_files["options"]) == 5
+    assert dialog.label_page["value"] == "21-25 of 25"
+    assert dialog.button_next["disabled"] is True
+
+    # filtering returns to the first page of the narrowed listing
+    dialog.file_filter["value"] = "FILE_1"
+    assert dialog.label_page["value"] == "1-10 of 10"
+    assert all("file_1" in label
+               for label, _ in dialog.directory_files["options"])
+
+    dialog.file_filter["value"] = "missing"
+    assert dialog.directory_files["options"] == ()
+    assert dialog.label_page["value"] == "0-0 of 0"
+
+
+def test_file_dialog_displayed_only(tmp_path, monkeypatch):
+    """Test a FileDialog reachable only through its displayed container
+    still reacts to widget changes"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    (tmp_path / "file.csv").touch()
+    container = FileDialog(
+        filter_pattern=(("CSV", "*.csv"), ("TXT", "*.txt"))).container
+    gc.collect()
+
+    container_upper, container_middle, _ = container.children
+    file_option, directory = (
+        container_upper.children[0], container_middle.children[0])
+    file_option.value = "*.txt"
+    file_option.value = "*.csv"
+    assert directory.options != ()
+
+
+def test_file_dialog_new_files(tmp_path, monkeypatch):
+    """Test files created after the first scan are listed when a directory
+    is selected again, and by a new FileDialog"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    (tmp_path / "file_one.csv").touch()
+    dialog = FileDialog(filter_pattern=(("CSV", "*.csv"),))
+    dialog.file_option["value"] = "*.csv"
+    dialog.directory["value"] = tmp_path
+
+    (tmp_path / "file_two.csv").touch()
+    dialog.directory["value"] = tmp_path.parent
+    dialog.directory["value"] = tmp_path
+    names = {path.name for _, path in dialog.directory_files["options"]}
+    assert names == {"file_one.csv", "file_two.csv"}
+
+    (tmp_path / "file_three.csv").touch()
+    dialog = FileDialog(filter_pattern=(("CSV", "*.csv"),))
+    dialog.file_option["value"] = "*.csv"
+    dialog.directory["value"] = tmp_path
+    assert len(dialog.directory_files["options"]) == 3
+
+
+def test_file_dialog_unfiltered(tmp_path, monkeypatch):
+    """Test an unfiltered FileDialog lists entries matching '*' without
+    building its hidden FileOptions widget"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    (tmp_path / "file.txt").touch()
+    dialog = FileDialog()
+    dialog.refresh()
+    dialog.directory["value"] = tmp_path
+    assert [path.name for _, path in dialog.directory_files["options"]] == [
+        "file.txt"]
+    assert not dialog.file_option.built
+
+
+def test_file_dialog_lazy_tree(tmp_path, monkeypatch):
+    """Test lazy_tree lists only prefetch_depth levels of subdirectories,
+    expanding a subdirectory on selection"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    (tmp_path / "one" / "two" / "three").mkdir(parents=True)
+    (tmp_path / "one" / "two" / "file_one.csv").touch()
+
+    dialog = FileDialog(
+        filter_pattern=(("CSV", "*.csv"),), lazy_tree=True, prefetch_depth=1)
+    dialog.file_option["value"] = "*.csv"
+
+    root, one, two = (
+        path_option(IconUnicode.DIR, path)
+        for path in (tmp_path, tmp_path / "one", tmp_path / "one" / "two"))
+    # the _PATH root has no parent option
+    assert dialog.directory["value"] == tmp_path
+    assert dialog.directory["options"] == (root, one)
+
+    # selecting a subdirectory expands it, listing its parent and children
+    dialog.directory["value"] = one[1]
+    assert dialog.directory["value"] == tmp_path / "one"
+    assert dialog.directory["options"] == (one, root, two)
+
+    dialog.directory["value"] = two[1]
+    file_one = tmp_path / "one" / "two" / "file_one.csv"
+    assert dialog.directory_files["options"] == (
+        path_option(IconUnicode.FILE, file_one),)
+
+    # navigating back up stops at _PATH
+    dialog.directory["value"] = one[1]
+    dialog.directory["value"] = root[1]
+    assert dialog.directory["options"] == (root, one)
+    assert all(
+        path.is_relative_to(tmp_path)
+        for _, path in dialog.directory["options"])
+
+
+def test_file_dialog_watch(tmp_path, monkeypatch):
+    """Test watched directories apply added and removed entries"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    (tmp_path / "file_one.csv").touch()
+
+    dialog = FileDialog(filter_pattern=(("CSV", "*.csv"),))
+    dialog.file_option["value"] = "*.csv"
+    dialog.directory["value"] = dialog.directory["options"][1][1]
+    dialog.directory_files["value"] = (
+        dialog.directory_files["options"][0][1])
+
+    # changes are applied on the event loop thread, so one must be running
+    with pytest.raises(RuntimeError):
+        dialog.watch()
+
+    async def watch() -> None:
+        dialog.watch(interval=0.05, backend="polling")
+        assert str(tmp_path) in dialog._watcher.directories
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "file_two.csv").touch()
+        (tmp_path / "sub" / "file_three.csv").touch()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and (
+                len(dialog.directory_files["options"]) < 2
+                or len(dialog.directory["options"]) < 3):
+            await asyncio.sleep(0.05)
+        dialog.unwatch()
+
+    asyncio.run(watch())
+
+    assert dialog.directory_files["options"] == (
+        path_option(IconUnicode.FILE, tmp_path / "file_one.csv"),
+        path_option(IconUnicode.FILE, tmp_path / "file_two.csv"))
+    # selections are retained as options are updated
+    assert dialog.directory_files["value"] == tmp_path / "file_one.csv"
+    assert dialog.directory["options"][-1] == (
+        path_option(IconUnicode.DIR, tmp_path / "sub"))
+    assert dialog.directory["value"] == tmp_path
+
+    # lost watcher events apply a full refresh
+    (tmp_path / "file_four.csv").touch()
+    dialog._apply_changes(None)
+    assert len(dialog.directory_files["options"]) == 3
+
+
+def test_file_dialog_pool(tmp_path, monkeypatch):
+    """Test FileDialogPool hands back reset dialogs and closes surplus"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    (tmp_path / "file_one.csv").touch()
+    pool = FileDialogPool(maxsize=1)
+    filter_pattern = (("CSV", "*.csv"),)
+
+    with pool.dialog(filter_pattern=filter_pattern, page_size=10) as dialog:
+        dialog.file_option["value"] = "*.csv"
+        dialog.directory["value"] = dialog.directory["options"][1][1]
+        dialog.directory_files["value"] = (
+            dialog.directory_files["options"][0][1])
+        dialog.button_select["value"] = True
+        assert dialog.file_output["value"] == "file_one.csv"
+        assert dialog.button_save["disabled"] is False
+        # the selected (label, Path) option value is saved, unparsed
+        dialog.button_save.widget.click()
+        assert dialog.dialog_selection == tmp_path / "file_one.csv"
+    assert pool.idle() == 1
+
+    # reset to its initial state
+    reused = pool.acquire(filter_pattern=filter_pattern, page_size=10)
+    assert reused is dialog and pool.idle() == 0
+    assert reused.file_option["value"] is None
+    assert reused.directory["options"] == ()
+    assert reused.directory_files["options"] == ()
+    assert reused.file_selected["value"] == "..."
+    assert reused.button_select["disabled"] is True
+    assert reused.button_save["disabled"] is True
+    assert reused.dialog_selection is None
+
+    # no idle dialog - a new dialog
+    other = pool.acquire(filter_pattern=filter_pattern, page_size=10)
+    assert other is not reused
+
+    # released on ButtonClose, observers see the close and the selection
+    # is kept until the dialog is acquired again
+    changes = []
+    reused.observe(
+        lambda change: changes.append((change["name"], change["new"])),
+        names=("dialog_open", "dialog_selection"))
+    reused.dialog_selection = tmp_path / "file_one.csv"
+    reused.button_close.widget.click()
+    assert changes == [
+        ("dialog_selection", tmp_path / "file_one.csv"),
+        ("dialog_open", False)]
+    assert reused.dialog_open is False and pool.idle() == 1
+    assert reused.dialog_selection == tmp_path / "file_one.csv"
+    # the surplus dialog is closed
+    pool.release(other)
+    assert other.dialog_open is False
+    assert other.directory.closed and other.directory.widget.comm is None
+
+    pool.clear()
+    assert pool.idle() == 0 and reused.container.comm is None
+
+
+def test_file_dialog_dispose(tmp_path, monkeypatch):
+    """Test a disposed FileDialog is collected without the cyclic garbage
+    collector"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    gc.disable()
+    try:
+        dialog = FileDialog(
+            filter_pattern=(("CSV", "*.csv"),), async_scan=True, page_size=5)
+        dialog.file_option["value"] = "*.csv"
+        dialog.wait_scans(timeout=5)
+
+        async def watch(dialog_: FileDialog) -> None:
+            dialog_.watch(interval=0.1)
+
+        asyncio.run(watch(dialog))
+        refs = [
+            weakref.ref(dialog),
+            weakref.ref(dialog.directory.widget),
+            weakref.ref(dialog.button_close.widget)]
+
+        dialog.dispose()
+        assert dialog.components() == ()
+        del dialog
+        assert [ref() for ref in refs] == [None, None, None]
+    finally:
+        gc.enable()
+
+
+def test_file_dialog_comm_budget(tmp_path, monkeypatch):
+    """Test comm messages and bytes are attributed per Component and action,
+    and budgets asserted"""
+    monkeypatch.setattr(FileDialog, "_PATH", tmp_path)
+    for i in range(10):
+        (tmp_path / f"file_{i}.csv").touch()
+
+    with CommRecorder() as recorder:
+        dialog = FileDialog(filter_pattern=(("CSV", "*.csv"),))
+    # every comm opened sends the widget state, initial values included
+    assert recorder.summary("method").keys() == {"open", "update"}
+    recorder.check(max_messages=50)
+
+    recorder = CommRecorder(dialog)
+    with recorder:
+        with recorder.action("select file"):
+            dialog.file_option["value"] = "*.csv"
+            dialog.directory["value"] = dialog.directory["options"][1][1]
+            dialog.directory_files["value"] = (
+                dialog.directory_files["options"][0][1])
+            dialog.button_select["value"] = True
+            dialog.button_save.widget.click()
+        with recorder.action("minimise"):
+            # deferred widget built, attributed once its Component holds it
+            dialog.button_min["icon"]
+    assert not recorder.active
+
+    by_action = recorder.summary("action")
+    by_component = recorder.summary()
+    assert by_action["select file"]["messages"] == sum(
+        by_component[name]["messages"] for name in (
+            "FileOptions", "Directory", "DirectoryFiles", "FileSelected",
+            "FileOutput", "ButtonSelect", "ButtonSave"))
+    assert all(group["bytes"] > 0 for group in by_component.values())
+    assert {message.component for message in recorder.messages if (
+        message.action == "minimise")} == {"ButtonMin"}
+
+    # batched handlers select a file in 14 messages, of ~1.3kB (paths sent
+    # vary in length with tmp_path)
+    recorder.check(max_messages=14, max_bytes=1536, action="select file")
+    with pytest.raises(CommBudgetError) as e:
+        recorder.check(max_messages=13, action="select file")
+    assert len(e.value.messages) == 14
+    with pytest.raises(CommBudgetError):
+        recorder.check(max_bytes=1, component="Directory")
+    with pytest.raises(ValueError):
+        recorder.summary("widget")
+
+    # overlapping recorders stop in any order
+    outer, inner = CommRecorder(dialog), CommRecorder(dialog)
+    outer.start()
+    inner.start()
+    dialog.file_selected["value"] = "outer and inner"
+    outer.stop()
+    dialog.file_selected["value"] = "inner"
+    assert inner.active and not outer.active
+    inner.stop()
+    dialog.file_selected["value"] = "neither"
+    assert len(outer.messages) == 1 and len(inner.messages) == 2
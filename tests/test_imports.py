@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+
+def imported_modules(statement: str) -> set[str]:
+    """Return modules imported by statement, run with python -X importtime
+    in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True)
+    return {
+        line.split("|")[2].strip()
+        for line in result.stderr.splitlines()[1:]}
+
+
+def test_lazy_imports():
+    """Test importing the package, utils and enumerations does not import
+    ipywidgets, traitlets or the interface, until its attributes are used"""
+    light = imported_modules(
+        "import ipymediator\n"
+        "from ipymediator.enumerations import Value\n"
+        "from ipymediator.utils import singlenotifydispatch, notify_key")
+    for module in (
+            "ipywidgets", "traitlets", "ipymediator.interface",
+            "ipymediator.dialogs", "ipymediator.utils.watchers"):
+        assert module not in light
+
+    full = imported_modules(
+        "import ipymediator\n"
+        "ipymediator.Component\n"
+        "from ipymediator.utils import DirectoryWatcher")
+    assert "ipywidgets" in full and "ipymediator.utils.watchers" in full
+
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import ipymediator, ipymediator.utils as utils\n"
+         "assert ipymediator.Mediator is ipymediator.interface.Mediator\n"
+         "assert 'Component' in dir(ipymediator)\n"
+         "assert callable(utils.directory_index)\n"
+         "try:\n"
+         "    ipymediator.missing\n"
+         "except AttributeError:\n"
+         "    pass\n"
+         "else:\n"
+         "    raise AssertionError"],
+        capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
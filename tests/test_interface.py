@@ -1,9 +1,30 @@
 # pyright: reportGeneralTypeIssues=false, reportAttributeAccessIssue=false
+import asyncio
+import gc
+import logging
+import threading
+import time
+import weakref
 from abc import ABC
 from functools import singledispatchmethod
+from unittest import mock
 from ipymediator.interface import (
-    ABCTraits, Component, Mediator, MediatorWithTraits)
+    ABCTraits,
+    AsyncMediator,
+    CascadeGuard,
+    CompactComponent,
+    Component,
+    ComponentSpec,
+    Mediator,
+    MediatorWithTraits,
+    NotifyProfiler,
+    NotifyQueue,
+    WriteMarshal)
+from ipymediator.interface.hooks import NotifyHook
+from ipymediator.interface import compact as compact_module
 from ipymediator.enumerations import Value
+from ipymediator.exceptions import CascadeError
+from ipymediator.utils import singlenotifydispatch
 from ipywidgets import widgets as w
 from traitlets import traitlets as t
 import pytest
@@ -144,3 +165,655 @@ def test_concrete_component():
     # test message passed to Mediator notify method from component
     assert mediator.reference == "Component"
     assert mediator.change_new is True
+
+    # a Mediator implementation without register_component is supported
+    class PlainMediator:
+        def notify(self, reference, change) -> None:
+            self.reference = reference
+
+    plain = PlainMediator()
+    component_three = Component(
+        mediator=plain, widget=w.IntText(), widget_name="Plain")
+    component_three["value"] = 1
+    assert plain.reference == "Plain"
+    component_three.dispose()
+
+
+def test_component_paused():
+    """Test notifications are suspended within Component.paused"""
+    mediator = MediatorWithSingleDispatch()
+    component = Component(
+        mediator=mediator, widget=w.Button(), widget_name="component")
+
+    with component.paused():
+        component.widget.click()
+    assert component("value") is True
+    assert mediator.reference is None
+
+    component.widget.click()
+    assert mediator.reference == "component"
+    assert mediator.change_new is False
+
+
+def test_component_batch():
+    """Test batched assignments send one sync message per widget"""
+    mediator = MediatorWithSingleDispatch()
+    component_one = Component(
+        mediator=mediator, widget=w.Button(), widget_name="component_one")
+    component_two = Component(
+        mediator=mediator,
+        widget=w.Text(),
+        widget_name="component_two",
+        names=("disabled",))
+
+    send = w.Widget._send
+    with mock.patch.object(
+            w.Widget, "_send", autospec=True, side_effect=send) as patched:
+        with component_one.batch():
+            component_one["description"] = "description"
+            component_one["icon"] = "file"
+            component_one["disabled"] = True
+        assert patched.call_count == 1
+
+        patched.reset_mock()
+        # Mediator.batch defaults to every Component held by the Mediator
+        assert set(mediator.components()) == {component_one, component_two}
+        with mediator.batch():
+            component_one["description"] = "batched"
+            component_one["layout"].width = "auto"
+            component_two["value"] = "batched"
+            component_two["placeholder"] = "..."
+        # component_one, its layout and component_two
+        assert patched.call_count == 3
+
+
+class MediatorWithChanges(Mediator):
+    """Mediator recording every change passed to notify"""
+    def __init__(self):
+        self.changes = []
+
+    def notify(self, reference: str, change: Value) -> None:
+        self.changes.append(change)
+
+
+def test_component_debounce_throttle():
+    """Test debounced and throttled Components coalesce bursts of changes"""
+    mediator = MediatorWithChanges()
+
+    with pytest.raises(ValueError):
+        Component(mediator=mediator, widget=w.Text(), debounce=1, throttle=1)
+
+    debounced = Component(mediator=mediator, widget=w.Text(), debounce=60)
+    # changes are delivered on the event loop, so one must be running
+    with pytest.raises(RuntimeError):
+        debounced["value"] = "x"
+    debounced.reset()
+
+    async def changes() -> None:
+        for value in "abc":
+            debounced["value"] = value
+        assert mediator.changes == []
+        # latest value wins, retaining the first old value
+        debounced.flush()
+        assert [(c["old"], c["new"]) for c in mediator.changes] == [
+            ("", "c")]
+
+        mediator.changes.clear()
+        throttled = Component(
+            mediator=mediator, widget=w.Text(), throttle=0.1)
+        for value in "abc":
+            throttled["value"] = value
+        # the first change is passed immediately, the latest at interval end
+        assert [c["new"] for c in mediator.changes] == ["a"]
+        deadline = time.monotonic() + 5
+        while len(mediator.changes) < 2 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        assert [(c["old"], c["new"]) for c in mediator.changes] == [
+            ("", "a"), ("a", "c")]
+
+    asyncio.run(changes())
+
+
+def test_compact_component():
+    """Test CompactComponent matches the Component interface"""
+    mediator = MediatorWithSingleDispatch()
+
+    with pytest.raises(ValueError):
+        CompactComponent(
+            mediator=mediator, widget=w.Button(), names=("wrong_trait",))
+
+    component = CompactComponent(
+        mediator=mediator, widget=w.Button(), widget_name="compact")
+    assert not hasattr(component, "__dict__")
+    assert component in mediator.components()
+    assert "value" in component and str(component) == "compact"
+
+    component.widget.click()
+    assert component("value") is True
+    assert mediator.reference == "compact"
+    assert mediator.change_new is True
+
+    # two components observing one widget
+    mediator = MediatorWithChanges()
+    widget = w.Text()
+    component_one = CompactComponent(
+        mediator=mediator, widget=widget, names=("disabled",))
+    component_two = CompactComponent(
+        mediator=mediator,
+        widget=widget,
+        names=("disabled",),
+        notify_self=True)
+
+    component_one["disabled"] = True
+    assert component_two["disabled"] is True
+    assert len(mediator.changes) == 2
+
+    with component_two.paused():
+        component_one["disabled"] = False
+    assert len(mediator.changes) == 3
+
+    # one shared observe callback, rather than a bound method per Component
+    notifiers = widget._trait_notifiers["disabled"]["change"]
+    assert notifiers == [compact_module._observe]
+    component_two.close()
+    assert notifiers == [compact_module._observe]
+    component_one["disabled"] = True
+    assert len(mediator.changes) == 4
+
+    # reset restores the observed traits without notifying, as Component
+    component_one.reset()
+    component_one.flush()
+    assert component_one["disabled"] is False
+    assert len(mediator.changes) == 4
+
+
+def test_component_deferred():
+    """Test a Component built from a widget factory on first access"""
+    mediator = MediatorWithChanges()
+    component = Component(
+        mediator=mediator, widget=w.Dropdown, widget_name="deferred")
+    assert not component.built
+    assert component in mediator.components()
+    # batching and assignments do not build the widget
+    with mediator.batch():
+        component["options"] = ("a", "b")
+        component["disabled"] = True
+    assert not component.built
+
+    assert component["disabled"] is True
+    assert component.built
+    assert component["options"] == ("a", "b")
+    component["value"] = "b"
+    assert mediator.changes[-1]["new"] == "b"
+
+    button = Component(mediator=mediator, widget=w.Button)
+    assert button.widget_name == "ButtonComponent"
+    button.widget.click()
+    assert button("value") is True
+
+    component = Component(
+        mediator=mediator, widget=w.Button, names=("wrong_trait",))
+    with pytest.raises(ValueError):
+        component.widget
+
+
+def test_component_reset_close():
+    """Test Component.reset restores observed traits and close releases
+    the widget"""
+    mediator = MediatorWithChanges()
+    component = Component(
+        mediator=mediator, widget=w.Text(value="initial"), throttle=60)
+
+    async def changes() -> None:
+        component["value"] = "first"
+        component["value"] = "second"
+        assert len(mediator.changes) == 1
+        component.reset()
+
+    asyncio.run(changes())
+    assert component["value"] == "initial"
+    component.flush()
+    assert len(mediator.changes) == 1
+
+    layout = component["layout"]
+    component.close()
+    component.close()
+    assert component.closed
+    assert component.widget.comm is None and layout.comm is None
+    component.widget.value = "closed"
+    assert len(mediator.changes) == 1
+
+    deferred = Component(mediator=mediator, widget=w.Text)
+    deferred.close()
+    with pytest.raises(RuntimeError):
+        deferred.widget
+
+
+def test_mediator_dispose():
+    """Test disposed Mediators and Components are collected without the
+    cyclic garbage collector"""
+    gc.disable()
+    try:
+        mediator = MediatorWithChanges()
+        components = [
+            Component(mediator=mediator, widget=w.Button()),
+            Component(mediator=mediator, widget=w.Text(), notify_self=True),
+            Component(mediator=mediator, widget=w.Text(), debounce=60),
+            CompactComponent(mediator=mediator, widget=w.Text())]
+        refs = [weakref.ref(mediator)]
+        refs.extend(weakref.ref(component) for component in components)
+        refs.extend(weakref.ref(component.widget) for component in components)
+
+        mediator.dispose()
+        assert mediator.components() == ()
+        del mediator, components
+        assert [ref() for ref in refs] == [None] * len(refs)
+
+        # Components hold their Mediator until disposed
+        mediator = MediatorWithChanges()
+        component = Component(mediator=mediator, widget=w.Text())
+        ref = weakref.ref(mediator)
+        del mediator
+        assert ref() is component._mediator is not None
+        component.dispose()
+        assert ref() is None and component._mediator is None
+        component["value"] = "disposed"
+    finally:
+        gc.enable()
+
+
+class MediatorWithSpecs(MediatorWithTraits):
+    """Mediator declaring its Components with ComponentSpec"""
+    button = ComponentSpec(
+        w.Button,
+        "Button",
+        traits={"description": "X"},
+        layout={"width": "auto"},
+        style={"font_weight": "bold"})
+    text = ComponentSpec(w.Text, "Text", traits={"value": "..."})
+    optional = ComponentSpec(
+        w.Text, "Optional", enabled=lambda mediator: mediator.enable)
+
+    def __init__(self, enable: bool = False):
+        super().__init__()
+        self.enable = enable
+        self.changes = []
+
+    def notify(self, reference: str, change: Value) -> None:
+        self.changes.append(change)
+
+
+class MediatorWithSpecsOverride(MediatorWithSpecs):
+    text = ComponentSpec(w.Textarea, "Text", component=CompactComponent)
+
+
+def test_component_spec():
+    """Test ComponentSpec declarations built by build_components"""
+    mediator = MediatorWithSpecs()
+    assert MediatorWithSpecs.button.name == "button"
+    with pytest.raises(AttributeError):
+        mediator.button
+
+    components = mediator.build_components()
+    assert tuple(components) == ("button", "text")
+    assert mediator.button is components["button"]
+    assert mediator.components() == tuple(components.values())
+    assert not hasattr(mediator, "optional")
+    # initial values passed to the widget, without notifying the Mediator
+    assert mediator.button["description"] == "X"
+    assert mediator.button["layout"].width == "auto"
+    assert mediator.button["style"].font_weight == "bold"
+    assert mediator.text["value"] == "..."
+    assert mediator.changes == []
+
+    mediator.text["value"] = "changed"
+    assert len(mediator.changes) == 1
+
+    # subclass overrides keep declaration order
+    mediator = MediatorWithSpecsOverride(enable=True)
+    assert tuple(mediator.build_components()) == (
+        "button", "text", "optional")
+    assert isinstance(mediator.text, CompactComponent)
+    assert isinstance(mediator.text.widget, w.Textarea)
+
+
+class MediatorWithCascade(MediatorWithTraits):
+    """Mediator whose 'first' handler sets the 'second' Component value"""
+
+    def __init__(self):
+        super().__init__()
+        self.first = Component(
+            mediator=self, widget=w.IntText(), widget_name="first")
+        self.second = Component(
+            mediator=self, widget=w.IntText(), widget_name="second")
+
+    @singlenotifydispatch
+    def notify(self, reference: str, change: Value) -> None:
+        pass
+
+    @notify.register("first")
+    def _(self, reference: str, change: Value) -> None:
+        self.second["value"] = change["new"]
+
+
+def test_mediator_profile():
+    """Test notify counts, latency and cascade depth are recorded whilst
+    profiling, and notify restored afterwards"""
+    mediator = MediatorWithCascade()
+    notify = mediator.notify
+
+    with mediator.profile() as profiler:
+        assert profiler.active and mediator.notify is not notify
+        for value in range(1, 6):
+            mediator.first["value"] = value
+        mediator.second["disabled"] = True
+
+    assert not profiler.active and mediator.notify is notify
+    mediator.first["value"] = 10
+    rows = {row["reference"]: row for row in profiler.snapshot()}
+    assert rows.keys() == {"first", "second"}
+    assert rows["first"]["calls"] == 5 and rows["first"]["trait"] == "value"
+    assert rows["first"]["triggered"] == 5
+    assert rows["first"]["max_depth"] == 1
+    assert rows["second"]["calls"] == 5 and rows["second"]["max_depth"] == 2
+    assert rows["first"]["total_s"] >= rows["second"]["total_s"]
+    assert rows["first"]["own_s"] <= rows["first"]["total_s"]
+    assert 0 <= rows["first"]["p50_s"] <= rows["first"]["p99_s"]
+
+    profiler.reset()
+    assert profiler.snapshot() == []
+
+    # without an instance cached notify, the class attribute is restored
+    mediator = MediatorWithChanges()
+    with NotifyProfiler(mediator, max_samples=2) as profiler:
+        for _ in range(10):
+            mediator.notify("reference", {"name": "value"})
+    assert "notify" not in vars(mediator)
+    assert profiler.snapshot()[0]["calls"] == 10
+
+
+class MediatorWithLoop(MediatorWithCascade):
+    """Mediator whose 'first' and 'second' handlers increment each other's
+    Component value, a feedback loop, and whose 'third' handler re-notifies"""
+
+    def __init__(self):
+        super().__init__()
+        self.third = Component(
+            mediator=self, widget=w.IntText(), widget_name="third")
+
+    @singlenotifydispatch
+    def notify(self, reference: str, change: Value) -> None:
+        pass
+
+    @notify.register("first")
+    def _(self, reference: str, change: Value) -> None:
+        self.second["value"] = change["new"] + 1
+
+    @notify.register("second")
+    def _(self, reference: str, change: Value) -> None:
+        self.first["value"] = change["new"] + 1
+
+    @notify.register("third")
+    def _(self, reference: str, change: Value) -> None:
+        self.notify(reference, change)
+
+
+def test_cascade_guard(caplog):
+    """Test feedback loops are cut off by raising or logging, and redundant
+    re-notifications suppressed"""
+    mediator = MediatorWithLoop()
+    notify = mediator.notify
+
+    guard = mediator.guard_cascades()
+    assert guard.active and mediator.notify is not notify
+    with pytest.raises(CascadeError) as e:
+        mediator.first["value"] = 1
+    # first -> second -> first (one re-entry allowed) -> second -> first
+    assert e.value.cascade == (
+        ("first", "value"), ("second", "value"), ("first", "value"),
+        ("second", "value"), ("first", "value"))
+    assert guard.cycles == 1
+    mediator.third["value"] = 1
+    assert guard.suppressed == 1
+    guard.stop()
+    assert mediator.notify is notify
+
+    with CascadeGuard(mediator, max_reentries=0, on_cycle="log") as guard:
+        with caplog.at_level(logging.WARNING):
+            mediator.first["value"] = 10
+        # the re-entered assignment stands, its notify is cut off
+        assert mediator.first["value"] == 12
+        assert mediator.second["value"] == 11
+        assert guard.cycles == 1 and "first.value" in caplog.text
+
+    with mediator.guard_cascades(max_depth=2, max_reentries=5) as guard:
+        with pytest.raises(CascadeError):
+            mediator.first["value"] = 20
+    assert mediator.notify is notify
+
+    with pytest.raises(ValueError):
+        CascadeGuard(mediator, on_cycle="ignore")
+
+
+class MediatorWithFanOut(MediatorWithTraits):
+    """Mediator whose 'first' handler sets 'second' and 'third' Component
+    values, and whose 'second' handler sets 'third' again, recording each
+    handler call with its nesting depth"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls, self.depth = [], 0
+        for name in ("first", "second", "third"):
+            setattr(self, name, Component(
+                mediator=self, widget=w.IntText(), widget_name=name))
+
+    @singlenotifydispatch
+    def notify(self, reference: str, change: Value) -> None:
+        self.calls.append((reference, change["new"], self.depth + 1))
+
+    @notify.register("first")
+    def _(self, reference: str, change: Value) -> None:
+        self.calls.append((reference, change["new"], self.depth + 1))
+        self.depth += 1
+        self.second["value"] = change["new"]
+        self.third["value"] = change["new"]
+        self.depth -= 1
+
+    @notify.register("second")
+    def _(self, reference: str, change: Value) -> None:
+        self.calls.append((reference, change["new"], self.depth + 1))
+        self.depth += 1
+        self.third["value"] = change["new"] * 10
+        self.depth -= 1
+
+
+def test_notify_queue():
+    """Test queued notify calls run in FIFO order at depth one, collapsing
+    duplicate (reference, trait) changes"""
+    mediator = MediatorWithFanOut()
+    mediator.first["value"] = 1
+    assert mediator.calls == [
+        ("first", 1, 1), ("second", 1, 2), ("third", 10, 3), ("third", 1, 2)]
+
+    mediator.calls.clear()
+    notify = mediator.notify
+    with mediator.queue_notifications() as queue:
+        assert isinstance(queue, NotifyQueue) and queue.active
+        mediator.first["value"] = 2
+        # third queued by first, collapsed with its change by second
+        assert mediator.calls == [
+            ("first", 2, 1), ("second", 2, 1), ("third", 20, 1)]
+        assert queue.queued == 3 and queue.collapsed == 1
+        assert mediator.third["value"] == 20
+
+        # a queued change reverted before it runs is dropped
+        with mediator.third.paused():
+            mediator.third["value"] = 30
+        mediator.calls.clear()
+        mediator.first["value"] = 3
+        assert mediator.calls == [("first", 3, 1), ("second", 3, 1)]
+        assert queue.collapsed == 2
+    assert mediator.notify is notify
+
+    # hooks hold their Mediator weakly, and must implement _wrap
+    mediator = MediatorWithFanOut()
+    queue = NotifyQueue(mediator)
+    mediator.dispose()
+    del mediator
+    gc.collect()
+    assert queue.mediator is None
+    queue.start()
+    assert not queue.active
+    with pytest.raises(TypeError):
+        NotifyHook(queue)
+
+
+class MediatorWithCoroutines(AsyncMediator):
+    """AsyncMediator whose 'first' coroutine handler copies the value to the
+    'second' Component after a delay, and whose 'second' handler is
+    synchronous"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started, self.cancelled, self.calls = [], [], []
+        self.first = Component(
+            mediator=self, widget=w.IntText(), widget_name="first")
+        self.second = Component(
+            mediator=self, widget=w.IntText(), widget_name="second")
+
+    @singlenotifydispatch
+    def notify(self, reference: str, change: Value) -> None:
+        self.calls.append(reference)
+
+    @notify.register("first")
+    async def _(self, reference: str, change: Value) -> None:
+        self.started.append(change["new"])
+        try:
+            await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            self.cancelled.append(change["new"])
+            raise
+        if change["new"] < 0:
+            raise ValueError(change["new"])
+        self.second["value"] = change["new"]
+
+
+def test_async_mediator(caplog):
+    """Test coroutine handlers are scheduled as tasks, superseded tasks
+    cancelled per reference and handler exceptions logged"""
+
+    async def main():
+        mediator = MediatorWithCoroutines()
+        assert mediator.loop is asyncio.get_running_loop()
+        for value in (1, 2, 3):
+            mediator.first["value"] = value
+        assert mediator.tasks().keys() == {"first"}
+        await mediator.wait()
+        assert mediator.second["value"] == 3
+        # tasks for 1 and 2 were cancelled before starting
+        assert mediator.started == [3] and mediator.cancelled == []
+        assert mediator.calls == ["second"]
+
+        mediator.first["value"] = 4
+        await asyncio.sleep(0)
+        mediator.first["value"] = 5
+        await mediator.wait()
+        assert mediator.cancelled == [4] and mediator.second["value"] == 5
+        # finished and cancelled tasks are not retained
+        assert mediator.tasks() == {}
+
+        # notified from a worker thread, scheduled on the mediator loop
+        thread = threading.Thread(
+            target=mediator.first.__setitem__, args=("value", 6))
+        thread.start()
+        while thread.is_alive() or not mediator.tasks():
+            await asyncio.sleep(0.001)
+        await mediator.wait()
+        assert mediator.second["value"] == 6
+
+        with caplog.at_level(logging.ERROR):
+            mediator.first["value"] = -1
+            await mediator.wait()
+        assert "ValueError" in caplog.text
+
+        mediator.first["value"] = 7
+        mediator.dispose()
+        await asyncio.sleep(0.02)
+        assert mediator.tasks() == {} and mediator.second["value"] == 6
+
+    asyncio.run(main())
+
+    # without a loop, coroutine handlers cannot be scheduled
+    mediator = MediatorWithCoroutines()
+    with pytest.raises(RuntimeError):
+        mediator.notify("first", {"name": "value", "new": 1})
+
+    # the scheduler holds its Mediator weakly
+    scheduler = mediator._scheduler
+    mediator.dispose()
+    del mediator
+    gc.collect()
+    assert scheduler.mediator is None
+
+
+class MediatorWithWorkers(Mediator):
+    """Mediator recording notify calls with the thread making them"""
+
+    def __init__(self, workers: int):
+        self.calls = []
+        self.progress = [
+            Component(
+                mediator=self, widget=w.IntProgress(max=1_000),
+                widget_name=f"Progress{i}", thread_safe=True)
+            for i in range(workers)]
+
+    def notify(self, reference: str, change: Value) -> None:
+        self.calls.append(
+            (reference, change["new"], threading.current_thread()))
+
+
+def test_component_thread_safe():
+    """Test trait writes from many worker threads are applied and notified
+    on the loop thread, in per-thread submission order and in batches"""
+    workers, writes = 16, 200
+
+    async def main():
+        mediator = MediatorWithWorkers(workers)
+        marshal = WriteMarshal.for_loop(asyncio.get_running_loop())
+        barrier = threading.Barrier(workers)
+
+        def work(i: int) -> None:
+            barrier.wait()
+            for value in range(1, writes + 1):
+                mediator.progress[i]["value"] = value
+                if value % 50 == 0:
+                    time.sleep(0.001)
+
+        threads = [
+            threading.Thread(target=work, args=(i,)) for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads) or not (
+                marshal.idle):
+            await asyncio.sleep(0.001)
+
+        main_thread = threading.current_thread()
+        assert all(thread is main_thread for *_, thread in mediator.calls)
+        for i in range(workers):
+            values = [
+                value for reference, value, _ in mediator.calls
+                if reference == f"Progress{i}"]
+            # coalesced, but in submission order and ending with the last
+            assert values == sorted(values) and values[-1] == writes
+            assert mediator.progress[i]["value"] == writes
+        assert marshal.writes == workers * writes
+        assert marshal.batches < marshal.writes
+
+        # on the loop thread, writes are applied directly
+        mediator.progress[0]["value"] = 0
+        assert mediator.progress[0]["value"] == 0 and marshal.idle
+
+    asyncio.run(main())
+
+    with pytest.raises(ValueError):
+        MediatorWithWorkers(1)